@@ -1,12 +1,36 @@
 import os
+import sys
 import json
 import logging
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from operator import attrgetter
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
-from dataclasses import dataclass, asdict, field
-from dotenv import load_dotenv
+from dataclasses import dataclass, field, fields
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_DOTENV_LOADED = False
+
+def _ensure_dotenv():
+    """Load the .env file the first time an environment override is requested."""
+    global _DOTENV_LOADED
+    if not _DOTENV_LOADED:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _DOTENV_LOADED = True
+
+# Shared immutable defaults for the supported_formats fields
+_PROCESSING_FORMATS = (".txt", ".md", ".pdf", ".docx", ".html", ".json")
+_EXPORT_FORMATS = ("pdf", "markdown", "json")
+
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class EmbeddingConfig:
     """Configuration for embedding generation."""
     model_name: str = "all-MiniLM-L6-v2"
@@ -15,8 +39,10 @@ class EmbeddingConfig:
     max_length: int = 512
     cache_dir: Optional[str] = None
     use_cache: bool = True
+    quantization: Optional[str] = None
+    precision: Optional[str] = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class StorageConfig:
     """Configuration for document storage."""
     data_dir: str = "data"
@@ -27,7 +53,7 @@ class StorageConfig:
     chunk_size: int = 1000
     chunk_overlap: int = 200
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ReasoningConfig:
     """Configuration for reasoning engine."""
     max_steps: int = 10
@@ -36,7 +62,7 @@ class ReasoningConfig:
     enable_explanation: bool = True
     reasoning_timeout: int = 300
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class QueryConfig:
     """Configuration for query handling."""
     max_results: int = 10
@@ -45,27 +71,30 @@ class QueryConfig:
     max_refinement_rounds: int = 3
     enable_summarization: bool = True
     summary_type: str = "hybrid"
+    rerank_enabled: bool = False
+    rerank_model: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+    rerank_candidates: int = 30
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessingConfig:
     """Configuration for document processing."""
-    supported_formats: List[str] = field(default_factory=lambda: [".txt", ".md", ".pdf", ".docx", ".html", ".json"])
+    supported_formats: Tuple[str, ...] = _PROCESSING_FORMATS
     max_file_size: int = 50 * 1024 * 1024  # 50MB
     chunk_size: int = 1000
     chunk_overlap: int = 200
     clean_text: bool = True
     extract_metadata: bool = True
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ExportConfig:
     """Configuration for export functionality."""
     output_dir: str = "exports"
     default_format: str = "pdf"
-    supported_formats: List[str] = field(default_factory=lambda: ["pdf", "markdown", "json"])
+    supported_formats: Tuple[str, ...] = _EXPORT_FORMATS
     include_metadata: bool = True
     include_reasoning: bool = True
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LoggingConfig:
     """Configuration for logging."""
     level: str = "INFO"
@@ -74,7 +103,7 @@ class LoggingConfig:
     max_file_size: int = 10 * 1024 * 1024  # 10MB
     backup_count: int = 5
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AppConfig:
     """Main application configuration."""
     embedding: EmbeddingConfig = field(default_factory=EmbeddingConfig)
@@ -91,12 +120,110 @@ class AppConfig:
     data_dir: str = "data"
     config_file: Optional[str] = None
 
+# Field names per config section, used instead of hasattr() when applying updates
+_EMBEDDING_FIELDS = frozenset(f.name for f in fields(EmbeddingConfig))
+_STORAGE_FIELDS = frozenset(f.name for f in fields(StorageConfig))
+_REASONING_FIELDS = frozenset(f.name for f in fields(ReasoningConfig))
+_QUERY_FIELDS = frozenset(f.name for f in fields(QueryConfig))
+_PROCESSING_FIELDS = frozenset(f.name for f in fields(ProcessingConfig))
+_EXPORT_FIELDS = frozenset(f.name for f in fields(ExportConfig))
+_LOGGING_FIELDS = frozenset(f.name for f in fields(LoggingConfig))
+_APP_FIELDS = frozenset(f.name for f in fields(AppConfig))
+
+_LOGGING_LEVELS = frozenset(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
+_EMBEDDING_QUANTIZATIONS = frozenset(["fp32", "fp16", "int8"])
+_EMBEDDING_PRECISIONS = frozenset(["fp32", "fp16", "bf16", "int8"])
+
+_SECTION_FIELDS = {
+    "embedding": _EMBEDDING_FIELDS,
+    "storage": _STORAGE_FIELDS,
+    "reasoning": _REASONING_FIELDS,
+    "query": _QUERY_FIELDS,
+    "processing": _PROCESSING_FIELDS,
+    "export": _EXPORT_FIELDS,
+    "logging": _LOGGING_FIELDS,
+}
+
+@lru_cache(maxsize=8)
+def _resolve_level(level_name: str) -> int:
+    """Map a level name such as "INFO" to its logging constant."""
+    return getattr(logging, level_name.upper(), logging.INFO)
+
+@lru_cache(maxsize=8)
+def _get_formatter(fmt: str) -> logging.Formatter:
+    """Get a shared Formatter for a format string."""
+    return logging.Formatter(fmt)
+
+def _config_to_dict(config: AppConfig) -> Dict[str, Any]:
+    """Build a JSON-ready dict from an AppConfig without asdict()'s deep copy."""
+    config_dict = {}
+    for config_field in fields(config):
+        value = getattr(config, config_field.name)
+        if config_field.name in _SECTION_FIELDS:
+            value = {f.name: getattr(value, f.name) for f in fields(value)}
+        config_dict[config_field.name] = value
+    return config_dict
+
 class ConfigManager:
     """
     Configuration manager for the Deep Researcher Agent.
     Handles loading, saving, and managing configuration settings.
     """
     
+    # Validation rules: (value getter, predicate, error message)
+    _VALIDATORS = (
+        (attrgetter("embedding.batch_size"), lambda v: v > 0,
+         "Embedding batch_size must be positive"),
+        (attrgetter("embedding.max_length"), lambda v: v > 0,
+         "Embedding max_length must be positive"),
+        (attrgetter("embedding.quantization"), lambda v: v is None or v in _EMBEDDING_QUANTIZATIONS,
+         "Embedding quantization must be one of fp32, fp16, int8"),
+        (attrgetter("embedding.precision"), lambda v: v is None or v in _EMBEDDING_PRECISIONS,
+         "Embedding precision must be one of fp32, fp16, bf16, int8"),
+        (attrgetter("storage.max_documents"), lambda v: v > 0,
+         "Storage max_documents must be positive"),
+        (attrgetter("storage.chunk_size"), lambda v: v > 0,
+         "Storage chunk_size must be positive"),
+        (attrgetter("reasoning.max_steps"), lambda v: v > 0,
+         "Reasoning max_steps must be positive"),
+        (attrgetter("reasoning.confidence_threshold"), lambda v: 0 <= v <= 1,
+         "Reasoning confidence_threshold must be between 0 and 1"),
+        (attrgetter("query.max_results"), lambda v: v > 0,
+         "Query max_results must be positive"),
+        (attrgetter("query.similarity_threshold"), lambda v: 0 <= v <= 1,
+         "Query similarity_threshold must be between 0 and 1"),
+        (attrgetter("query.rerank_candidates"), lambda v: v > 0,
+         "Query rerank_candidates must be positive"),
+        (attrgetter("processing.max_file_size"), lambda v: v > 0,
+         "Processing max_file_size must be positive"),
+        (attrgetter("processing.chunk_size"), lambda v: v > 0,
+         "Processing chunk_size must be positive"),
+        (attrgetter("export"), lambda export: export.default_format in export.supported_formats,
+         "Export default_format must be one of supported formats"),
+        (attrgetter("logging.level"), lambda v: v in _LOGGING_LEVELS,
+         "Logging level must be one of DEBUG, INFO, WARNING, ERROR, CRITICAL"),
+    )
+    
+    # Signature of the logging settings last applied to the root logger
+    _logging_configured: Optional[tuple] = None
+    
+    @classmethod
+    def get(cls, config_file: Optional[str] = None) -> "ConfigManager":
+        """
+        Get the shared configuration manager for a config file.
+        
+        Args:
+            config_file: Path to configuration file (optional)
+            
+        Returns:
+            Cached ConfigManager instance for the given path
+        """
+        key = config_file or "config/config.json"
+        instance = _INSTANCES.get(key)
+        if instance is None:
+            instance = _INSTANCES.setdefault(key, cls(key))
+        return instance
+    
     def __init__(self, config_file: Optional[str] = None):
         """
         Initialize the configuration manager.
@@ -105,12 +232,10 @@ class ConfigManager:
             config_file: Path to configuration file (optional)
         """
         self.config_file = config_file or "config/config.json"
-        self.config_dir = Path(self.config_file).parent
+        self._config_path = Path(self.config_file)
+        self.config_dir = self._config_path.parent
         self.config_dir.mkdir(exist_ok=True)
         
-        # Load environment variables
-        load_dotenv()
-        
         # Initialize default configuration
         self.config = AppConfig()
         
@@ -130,17 +255,18 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config_data = json.load(f)
-                
-                # Update configuration with loaded data
-                self._update_config_from_dict(config_data)
-                logging.info(f"Configuration loaded from {self.config_file}")
-                return True
-            else:
+            try:
+                data = self._config_path.read_bytes()
+            except FileNotFoundError:
                 logging.info(f"Configuration file not found: {self.config_file}. Using defaults.")
                 return False
+            
+            config_data = orjson.loads(data) if orjson is not None else json.loads(data)
+            
+            # Update configuration with loaded data
+            self._update_config_from_dict(config_data)
+            logging.info(f"Configuration loaded from {self.config_file}")
+            return True
                 
         except Exception as e:
             logging.error(f"Error loading configuration: {e}")
@@ -154,10 +280,15 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
-            config_dict = asdict(self.config)
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, indent=2, ensure_ascii=False)
+            # Always indented: config.json is edited and diffed by hand
+            if orjson is not None:
+                # orjson serializes dataclasses natively and emits UTF-8 bytes
+                with open(self.config_file, 'wb') as f:
+                    f.write(orjson.dumps(self.config, option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_INDENT_2))
+            else:
+                config_dict = _config_to_dict(self.config)
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    json.dump(config_dict, f, indent=2, ensure_ascii=False)
             
             logging.info(f"Configuration saved to {self.config_file}")
             return True
@@ -222,173 +353,55 @@ class ConfigManager:
             logging.error(f"Error updating configuration: {e}")
             return False
     
-    def update_embedding_config(self, **kwargs) -> bool:
+    def _update_section(self, section_name: str, kwargs: Dict[str, Any]) -> bool:
         """
-        Update embedding configuration.
+        Update one configuration section with keyword arguments.
         
         Args:
-            **kwargs: Configuration parameters to update
+            section_name: Name of the section on AppConfig (e.g. "embedding")
+            kwargs: Configuration parameters to update
             
         Returns:
-            True if successful, False otherwise
+            True once the known parameters have been applied
         """
-        try:
-            for key, value in kwargs.items():
-                if hasattr(self.config.embedding, key):
-                    setattr(self.config.embedding, key, value)
-                else:
-                    logging.warning(f"Unknown embedding config parameter: {key}")
-            
-            logging.info("Embedding configuration updated")
-            return True
-            
-        except Exception as e:
-            logging.error(f"Error updating embedding configuration: {e}")
-            return False
+        section = getattr(self.config, section_name)
+        section_fields = _SECTION_FIELDS[section_name]
+        for key, value in kwargs.items():
+            if key in section_fields:
+                setattr(section, key, value)
+            else:
+                logging.warning(f"Unknown {section_name} config parameter: {key}")
+        
+        logging.info(f"{section_name.capitalize()} configuration updated")
+        return True
+    
+    def update_embedding_config(self, **kwargs) -> bool:
+        """Update embedding configuration."""
+        return self._update_section("embedding", kwargs)
     
     def update_storage_config(self, **kwargs) -> bool:
-        """
-        Update storage configuration.
-        
-        Args:
-            **kwargs: Configuration parameters to update
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            for key, value in kwargs.items():
-                if hasattr(self.config.storage, key):
-                    setattr(self.config.storage, key, value)
-                else:
-                    logging.warning(f"Unknown storage config parameter: {key}")
-            
-            logging.info("Storage configuration updated")
-            return True
-            
-        except Exception as e:
-            logging.error(f"Error updating storage configuration: {e}")
-            return False
+        """Update storage configuration."""
+        return self._update_section("storage", kwargs)
     
     def update_reasoning_config(self, **kwargs) -> bool:
-        """
-        Update reasoning configuration.
-        
-        Args:
-            **kwargs: Configuration parameters to update
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            for key, value in kwargs.items():
-                if hasattr(self.config.reasoning, key):
-                    setattr(self.config.reasoning, key, value)
-                else:
-                    logging.warning(f"Unknown reasoning config parameter: {key}")
-            
-            logging.info("Reasoning configuration updated")
-            return True
-            
-        except Exception as e:
-            logging.error(f"Error updating reasoning configuration: {e}")
-            return False
+        """Update reasoning configuration."""
+        return self._update_section("reasoning", kwargs)
     
     def update_query_config(self, **kwargs) -> bool:
-        """
-        Update query configuration.
-        
-        Args:
-            **kwargs: Configuration parameters to update
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            for key, value in kwargs.items():
-                if hasattr(self.config.query, key):
-                    setattr(self.config.query, key, value)
-                else:
-                    logging.warning(f"Unknown query config parameter: {key}")
-            
-            logging.info("Query configuration updated")
-            return True
-            
-        except Exception as e:
-            logging.error(f"Error updating query configuration: {e}")
-            return False
+        """Update query configuration."""
+        return self._update_section("query", kwargs)
     
     def update_processing_config(self, **kwargs) -> bool:
-        """
-        Update processing configuration.
-        
-        Args:
-            **kwargs: Configuration parameters to update
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            for key, value in kwargs.items():
-                if hasattr(self.config.processing, key):
-                    setattr(self.config.processing, key, value)
-                else:
-                    logging.warning(f"Unknown processing config parameter: {key}")
-            
-            logging.info("Processing configuration updated")
-            return True
-            
-        except Exception as e:
-            logging.error(f"Error updating processing configuration: {e}")
-            return False
+        """Update processing configuration."""
+        return self._update_section("processing", kwargs)
     
     def update_export_config(self, **kwargs) -> bool:
-        """
-        Update export configuration.
-        
-        Args:
-            **kwargs: Configuration parameters to update
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            for key, value in kwargs.items():
-                if hasattr(self.config.export, key):
-                    setattr(self.config.export, key, value)
-                else:
-                    logging.warning(f"Unknown export config parameter: {key}")
-            
-            logging.info("Export configuration updated")
-            return True
-            
-        except Exception as e:
-            logging.error(f"Error updating export configuration: {e}")
-            return False
+        """Update export configuration."""
+        return self._update_section("export", kwargs)
     
     def update_logging_config(self, **kwargs) -> bool:
-        """
-        Update logging configuration.
-        
-        Args:
-            **kwargs: Configuration parameters to update
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            for key, value in kwargs.items():
-                if hasattr(self.config.logging, key):
-                    setattr(self.config.logging, key, value)
-                else:
-                    logging.warning(f"Unknown logging config parameter: {key}")
-            
-            logging.info("Logging configuration updated")
-            return True
-            
-        except Exception as e:
-            logging.error(f"Error updating logging configuration: {e}")
-            return False
+        """Update logging configuration."""
+        return self._update_section("logging", kwargs)
     
     def reset_to_defaults(self) -> bool:
         """
@@ -413,52 +426,8 @@ class ConfigManager:
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
-        
-        # Validate embedding config
-        if self.config.embedding.batch_size <= 0:
-            errors.append("Embedding batch_size must be positive")
-        
-        if self.config.embedding.max_length <= 0:
-            errors.append("Embedding max_length must be positive")
-        
-        # Validate storage config
-        if self.config.storage.max_documents <= 0:
-            errors.append("Storage max_documents must be positive")
-        
-        if self.config.storage.chunk_size <= 0:
-            errors.append("Storage chunk_size must be positive")
-        
-        # Validate reasoning config
-        if self.config.reasoning.max_steps <= 0:
-            errors.append("Reasoning max_steps must be positive")
-        
-        if not 0 <= self.config.reasoning.confidence_threshold <= 1:
-            errors.append("Reasoning confidence_threshold must be between 0 and 1")
-        
-        # Validate query config
-        if self.config.query.max_results <= 0:
-            errors.append("Query max_results must be positive")
-        
-        if not 0 <= self.config.query.similarity_threshold <= 1:
-            errors.append("Query similarity_threshold must be between 0 and 1")
-        
-        # Validate processing config
-        if self.config.processing.max_file_size <= 0:
-            errors.append("Processing max_file_size must be positive")
-        
-        if self.config.processing.chunk_size <= 0:
-            errors.append("Processing chunk_size must be positive")
-        
-        # Validate export config
-        if self.config.export.default_format not in self.config.export.supported_formats:
-            errors.append("Export default_format must be one of supported formats")
-        
-        # Validate logging config
-        if self.config.logging.level not in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]:
-            errors.append("Logging level must be one of DEBUG, INFO, WARNING, ERROR, CRITICAL")
-        
-        return errors
+        config = self.config
+        return [message for getter, is_valid, message in self._VALIDATORS if not is_valid(getter(config))]
     
     def get_config_summary(self) -> Dict[str, Any]:
         """
@@ -487,11 +456,17 @@ class ConfigManager:
         try:
             log_config = self.config.logging
             
+            # Skip handler teardown/rebuild if nothing changed
+            signature = (log_config.level, log_config.format, log_config.file_path,
+                         log_config.max_file_size, log_config.backup_count)
+            if ConfigManager._logging_configured == signature:
+                return
+            
             # Configure logging level
-            level = getattr(logging, log_config.level.upper(), logging.INFO)
+            level = _resolve_level(log_config.level)
             
             # Configure logging format
-            formatter = logging.Formatter(log_config.format)
+            formatter = _get_formatter(log_config.format)
             
             # Setup root logger
             root_logger = logging.getLogger()
@@ -523,6 +498,7 @@ class ConfigManager:
                 file_handler.setFormatter(formatter)
                 root_logger.addHandler(file_handler)
             
+            ConfigManager._logging_configured = signature
             logging.info("Logging setup completed")
             
         except Exception as e:
@@ -532,14 +508,19 @@ class ConfigManager:
         """Update configuration from dictionary."""
         # Update main config
         for key, value in config_dict.items():
-            if hasattr(self.config, key):
-                if key in ["embedding", "storage", "reasoning", "query", "processing", "export", "logging"]:
+            if key in _APP_FIELDS:
+                section_fields = _SECTION_FIELDS.get(key)
+                if section_fields is not None:
                     # Handle nested configurations
                     nested_config = getattr(self.config, key)
                     if isinstance(value, dict):
-                        for nested_key, nested_value in value.items():
-                            if hasattr(nested_config, nested_key):
+                        filtered = {k: v for k, v in value.items() if k in section_fields}
+                        if _DATACLASS_OPTIONS:
+                            # Slotted dataclasses have no __dict__ to merge into
+                            for nested_key, nested_value in filtered.items():
                                 setattr(nested_config, nested_key, nested_value)
+                        else:
+                            nested_config.__dict__.update(filtered)
                 else:
                     setattr(self.config, key, value)
     
@@ -572,5 +553,9 @@ class ConfigManager:
         Returns:
             Configuration value
         """
+        _ensure_dotenv()
         env_key = f"DEEP_RESEARCHER_{key.upper()}"
         return os.getenv(env_key, default)
+
+
+_INSTANCES: Dict[str, ConfigManager] = {}
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Clean the sample corpus once with the DocumentProcessor so that
+setup_sample_data.py can ingest it without re-cleaning every run
+"""
+
+import sys
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT / 'src'))
+
+from setup_sample_data import SAMPLE_CORPUS_PATH
+
+def preprocess_sample_data(corpus_path: str = SAMPLE_CORPUS_PATH):
+    """Rewrite the sample corpus with cleaned content."""
+    from processing.document_processor import DocumentProcessor
+
+    processor = DocumentProcessor()
+
+    with open(corpus_path, 'rb') as f:
+        documents = [json.loads(line) for line in f.read().split(b'\n') if line.strip()]
+
+    with open(corpus_path, 'w', encoding='utf-8') as f:
+        for title, content in documents:
+            f.write(json.dumps([title, processor._clean_text(content)], ensure_ascii=False) + '\n')
+
+    print(f"✅ Preprocessed {len(documents)} sample documents in {corpus_path}")
+
+if __name__ == "__main__":
+    preprocess_sample_data()
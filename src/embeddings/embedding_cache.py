@@ -0,0 +1,146 @@
+import os
+import re
+import sqlite3
+import logging
+import threading
+import numpy as np
+from typing import List, Dict
+
+from .embedding_generator import LocalEmbeddingGenerator
+
+# Most keys bound to a single SQLite "IN (...)" lookup
+_LOOKUP_CHUNK = 500
+
+class EmbeddingCache:
+    """
+    Persistent embedding cache keyed by a content hash of the embedded text.
+    
+    Each model, precision and dimension gets its own SQLite file, so vectors
+    from a different model configuration are never returned.
+    """
+    
+    def __init__(self, cache_dir: str, model_name: str, precision: str, embedding_dim: int):
+        """
+        Initialize the embedding cache.
+        
+        Args:
+            cache_dir: Directory holding the cache files
+            model_name: Name of the embedding model
+            precision: Precision the model runs at (see LocalEmbeddingGenerator)
+            embedding_dim: Dimension of the embeddings
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', model_name)
+        self.cache_path = os.path.join(cache_dir, f"{safe_name}_{precision}_{embedding_dim}.sqlite")
+        self.embedding_dim = embedding_dim
+        self.dtype = np.float32 if precision == 'fp32' else np.float16
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)")
+        self._conn.commit()
+        
+        self.stats = {'hits': 0, 'misses': 0}
+    
+    @classmethod
+    def for_generator(cls, cache_dir: str, generator: LocalEmbeddingGenerator) -> "EmbeddingCache":
+        """Create the cache matching a generator's model configuration."""
+        return cls(cache_dir, generator.model_name, generator.precision, generator.embedding_dim)
+    
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """
+        Look up cached embeddings.
+        
+        Args:
+            keys: Content hashes (see LocalEmbeddingGenerator._cache_key)
+        
+        Returns:
+            Dictionary mapping the keys found to their embeddings
+        """
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[start:start + _LOOKUP_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                )
+                for key, vector in rows:
+                    found[key] = np.frombuffer(vector, dtype=self.dtype)
+        return found
+    
+    def put_many(self, keys: List[bytes], embeddings: np.ndarray):
+        """
+        Store embeddings.
+        
+        Args:
+            keys: Content hashes of the embedded texts
+            embeddings: (len(keys), embedding_dim) matrix
+        """
+        embeddings = np.ascontiguousarray(embeddings, dtype=self.dtype)
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                zip(keys, (row.tobytes() for row in embeddings))
+            )
+            self._conn.commit()
+    
+    def embed(self, texts: List[str], generator: LocalEmbeddingGenerator,
+              batch_size: int = 32) -> np.ndarray:
+        """
+        Embed texts, encoding only those without a cached embedding.
+        
+        Args:
+            texts: Texts to embed
+            generator: Embedding generator for cache misses
+            batch_size: Encoder batch size for cache misses
+        
+        Returns:
+            (len(texts), embedding_dim) matrix of embeddings in input order
+        """
+        out = np.zeros((len(texts), self.embedding_dim), dtype=self.dtype)
+        positions: Dict[bytes, List[int]] = {}
+        for i, text in enumerate(texts):
+            if text and text.strip():
+                positions.setdefault(LocalEmbeddingGenerator._cache_key(text), []).append(i)
+        if not positions:
+            return out
+        
+        cached = self.get_many(list(positions))
+        for key, vector in cached.items():
+            out[positions[key]] = vector
+        
+        missing = [key for key in positions if key not in cached]
+        self.stats['hits'] += len(cached)
+        self.stats['misses'] += len(missing)
+        
+        if missing:
+            embeddings = generator.generate_embeddings_batch(
+                [texts[positions[key][0]] for key in missing], batch_size=batch_size
+            )
+            for key, embedding in zip(missing, embeddings):
+                out[positions[key]] = embedding
+            # Failed encodes come back as zero vectors; don't keep those
+            encoded = embeddings.any(axis=1)
+            if encoded.any():
+                self.put_many([key for key, ok in zip(missing, encoded) if ok], embeddings[encoded])
+        
+        logging.info(f"Embedding cache: {len(cached)} hits, {len(missing)} misses")
+        return out
+    
+    def clear(self):
+        """Remove all cached embeddings."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+    
+    def close(self):
+        """Close the cache file."""
+        with self._lock:
+            self._conn.close()
+    
+    def get_statistics(self) -> Dict[str, int]:
+        """Get cache hit statistics and size."""
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return {'entries': entries, **self.stats}
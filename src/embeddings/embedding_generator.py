@@ -1,10 +1,116 @@
 import os
+import sys
+import math
+import hashlib
+import contextlib
+import threading
+import queue
+import time
+from collections import OrderedDict
 import numpy as np
 from typing import List, Dict, Any, Optional
 from sentence_transformers import SentenceTransformer
 import torch
 import logging
-from tqdm import tqdm
+
+# Tokenize batches with the Rust tokenizer's thread pool unless the user chose otherwise
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
+def _top_k_indices(similarities: np.ndarray, top_k: int) -> List[tuple]:
+    """Return (index, score) pairs for the top_k scores, best first."""
+    # Select the top_k without sorting every candidate
+    top_k = min(top_k, len(similarities))
+    if top_k < len(similarities):
+        top_indices = np.argpartition(-similarities, top_k - 1)[:top_k]
+    else:
+        top_indices = np.arange(len(similarities))
+    top_indices = top_indices[np.argsort(-similarities[top_indices], kind='stable')]
+    
+    return list(zip(top_indices.tolist(), similarities[top_indices].tolist()))
+
+def _top_k_similar(query_embedding: np.ndarray, candidate_embeddings: np.ndarray,
+                   top_k: int, candidates_normalized: bool = False) -> List[tuple]:
+    """Return (index, cosine similarity) pairs for the top_k candidates."""
+    if len(candidate_embeddings) == 0 or top_k <= 0:
+        return []
+    
+    try:
+        # Cosine similarity against all candidates in a single matrix-vector product
+        candidates = np.asarray(candidate_embeddings, dtype=np.float32)
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = max(float(np.linalg.norm(query)), 1e-12)
+        similarities = (candidates @ query) / query_norm
+        if not candidates_normalized:
+            similarities /= np.linalg.norm(candidates, axis=1).clip(min=1e-12)
+        
+        return _top_k_indices(similarities, top_k)
+    except Exception as e:
+        logging.error(f"Error finding similar embeddings: {e}")
+        return []
+
+
+class _EmbedRequest:
+    """A single text waiting to be encoded by an _EmbedBatcher."""
+    
+    __slots__ = ('text', 'done', 'embedding', 'error')
+    
+    def __init__(self, text: str):
+        self.text = text
+        self.done = threading.Event()
+        self.embedding: Optional[np.ndarray] = None
+        self.error: Optional[Exception] = None
+
+
+class _EmbedBatcher:
+    """
+    Groups single-text encode requests from concurrent callers into batches.
+    
+    A background thread takes the first waiting request, collects up to
+    max_batch - 1 more that arrive within max_delay seconds (0 means only those
+    already queued), and encodes them in one forward pass.
+    """
+    
+    def __init__(self, encode_batch, max_batch: int = 32, max_delay: float = 0.0):
+        self._encode_batch = encode_batch
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue: "queue.Queue[_EmbedRequest]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="embed-batcher", daemon=True)
+        self._thread.start()
+    
+    def submit(self, text: str) -> np.ndarray:
+        """Encode one text as part of the next batch, blocking until it is done."""
+        request = _EmbedRequest(text)
+        self._queue.put(request)
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.embedding
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                try:
+                    timeout = deadline - time.monotonic()
+                    if timeout > 0:
+                        batch.append(self._queue.get(timeout=timeout))
+                    else:
+                        batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                embeddings = self._encode_batch([request.text for request in batch])
+                for request, embedding in zip(batch, embeddings):
+                    request.embedding = embedding
+            except Exception as e:
+                for request in batch:
+                    request.error = e
+            for request in batch:
+                request.done.set()
+
 
 class LocalEmbeddingGenerator:
     """
@@ -12,28 +118,158 @@ class LocalEmbeddingGenerator:
     Supports various pre-trained models for different use cases.
     """
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", device: Optional[str] = None):
+    @classmethod
+    def get(cls, model_name: str = "all-MiniLM-L6-v2", device: Optional[str] = None,
+            precision: Optional[str] = None) -> "LocalEmbeddingGenerator":
+        """
+        Get the process-wide shared generator for a model, loading it once.
+        
+        Args:
+            model_name: Name of the sentence-transformers model to use
+            device: Device to run the model on (None for auto-detection)
+            precision: Model precision (see __init__)
+            
+        Returns:
+            Shared LocalEmbeddingGenerator instance
+        """
+        key = (model_name, device or ('cuda' if torch.cuda.is_available() else 'cpu'), precision)
+        instance = _GENERATORS.get(key)
+        if instance is None:
+            with _GENERATORS_LOCK:
+                instance = _GENERATORS.get(key)
+                if instance is None:
+                    instance = _GENERATORS[key] = cls(model_name, key[1], precision)
+        return instance
+    
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", device: Optional[str] = None,
+                 precision: Optional[str] = None, max_cache_size: int = 50000,
+                 max_seq_length: Optional[int] = None, compile_model: bool = False,
+                 max_query_batch: int = 32, query_batch_delay: float = 0.0):
         """
         Initialize the embedding generator.
         
         Args:
             model_name: Name of the sentence-transformers model to use
             device: Device to run the model on ('cuda', 'cpu', or None for auto-detection)
+            precision: Model precision ('fp32', 'fp16', 'bf16' autocast or 'int8'
+                dynamic quantization; None for fp32)
+            max_cache_size: Maximum number of cached embeddings
+            max_seq_length: Optional cap on the tokens per input, which also
+                bounds the shapes a compiled model sees
+            compile_model: Compile the transformer forward pass with torch.compile
+            max_query_batch: Most single-text requests encoded in one forward pass
+            query_batch_delay: Seconds to wait for more concurrent single-text
+                requests before encoding a batch
         """
         self.model_name = model_name
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
+        self.precision = precision or 'fp32'
+        
+        # Embeddings are stored in half precision unless full precision was requested
+        self.embedding_dtype = np.float32 if self.precision == 'fp32' else np.float16
+        self.compiled = False
         
         # Initialize the model
         try:
             self.model = SentenceTransformer(model_name, device=self.device)
             self.embedding_dim = self.model.get_sentence_embedding_dimension()
-            logging.info(f"Loaded model {model_name} on device {self.device}")
+            if max_seq_length:
+                self.model.max_seq_length = min(self.model.max_seq_length, max_seq_length)
+            self._apply_precision()
+            if compile_model:
+                self._compile_model()
+            logging.info(f"Loaded model {model_name} on device {self.device} ({self.precision})")
         except Exception as e:
             logging.error(f"Failed to load model {model_name}: {e}")
             raise
         
-        # Cache for embeddings to avoid recomputation
-        self.embedding_cache = {}
+        # Bounded LRU cache of embeddings, keyed by a digest of the text
+        self.embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self.max_cache_size = max_cache_size
+        # Shared generators are called from web request threads and the warm-up thread
+        self._cache_lock = threading.Lock()
+        # Uncased WordPiece tokenizers ignore case and repeated whitespace, so
+        # single-text keys can be normalized to let retyped queries hit the cache
+        self._normalize_cache_keys = bool(getattr(getattr(self.model, 'tokenizer', None), 'do_lower_case', False))
+        
+        # Single-text requests from concurrent callers are encoded together
+        self.max_query_batch = max_query_batch
+        self.query_batch_delay = query_batch_delay
+        self._batcher: Optional[_EmbedBatcher] = None
+        self._batcher_lock = threading.Lock()
+    
+    def _apply_precision(self):
+        """Convert the loaded model to the requested precision."""
+        if self.precision == 'fp16' and self.device == 'cuda':
+            self.model = self.model.half()
+        elif self.precision == 'int8' and self.device == 'cpu':
+            try:
+                self.model = torch.ao.quantization.quantize_dynamic(
+                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            except Exception as e:
+                # Quantization backends are not available on every platform
+                logging.warning(f"INT8 quantization unavailable, using fp32: {e}")
+                self.precision = 'fp32'
+                self.embedding_dtype = np.float32
+        elif self.precision == 'bf16':
+            # bf16 runs as autocast around encode; check the backend can execute it
+            if self.device == 'cpu':
+                supported = torch.backends.mkldnn.is_available()
+            else:
+                supported = self.device.startswith('cuda') and torch.cuda.is_bf16_supported()
+            if not supported:
+                logging.warning(f"BF16 autocast unavailable on {self.device}, using fp32")
+                self.precision = 'fp32'
+                self.embedding_dtype = np.float32
+    
+    def _encode(self, texts, **kwargs) -> np.ndarray:
+        """Run the model's encode without autograd, under bf16 autocast if requested."""
+        if self.precision == 'bf16':
+            autocast = torch.autocast(device_type=self.device.split(':')[0], dtype=torch.bfloat16)
+        else:
+            autocast = contextlib.nullcontext()
+        with torch.inference_mode(), autocast:
+            embeddings = self.model.encode(
+                texts, convert_to_tensor=True, normalize_embeddings=True, **kwargs
+            )
+        return embeddings.float().cpu().numpy()
+    
+    def _compile_model(self):
+        """Compile the transformer forward pass, keeping eager mode if that fails."""
+        transformer = self.model[0]
+        eager_model = transformer.auto_model
+        try:
+            mode = 'reduce-overhead' if self.device == 'cuda' else 'default'
+            transformer.auto_model = torch.compile(eager_model, mode=mode, dynamic=True)
+            # Compilation is lazy, so trigger it here instead of on the first query
+            self.warm_up()
+            self.compiled = True
+        except Exception as e:
+            logging.warning(f"torch.compile unavailable, using eager mode: {e}")
+            transformer.auto_model = eager_model
+    
+    def warm_up(self) -> np.ndarray:
+        """Run one forward pass so the first real request skips one-time setup costs, returning its embedding."""
+        return self._encode(["warm up"], show_progress_bar=False)[0]
+    
+    def _encode_query_batch(self, texts: List[str]) -> np.ndarray:
+        """Encode a micro-batch of query texts collected by the batcher."""
+        return self._encode(texts, batch_size=len(texts), show_progress_bar=False)
+    
+    def _get_batcher(self) -> _EmbedBatcher:
+        """Start the micro-batching thread on first use."""
+        if self._batcher is None:
+            with self._batcher_lock:
+                if self._batcher is None:
+                    self._batcher = _EmbedBatcher(self._encode_query_batch,
+                                                  self.max_query_batch, self.query_batch_delay)
+        return self._batcher
+    
+    @staticmethod
+    def _cache_key(text: str) -> bytes:
+        """Fixed-size cache key so long texts are not retained as dict keys."""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
     
     def generate_embedding(self, text: str) -> np.ndarray:
         """
@@ -46,31 +282,42 @@ class LocalEmbeddingGenerator:
             numpy array representing the embedding
         """
         if not text or not text.strip():
-            return np.zeros(self.embedding_dim)
+            return np.zeros(self.embedding_dim, dtype=self.embedding_dtype)
         
         # Check cache first
-        if text in self.embedding_cache:
-            return self.embedding_cache[text]
+        key = self._cache_key(' '.join(text.lower().split()) if self._normalize_cache_keys else text)
+        with self._cache_lock:
+            cached = self.embedding_cache.get(key)
+            if cached is not None:
+                self.embedding_cache.move_to_end(key)
+                return cached
         
         try:
             # Generate embedding
-            embedding = self.model.encode(text, convert_to_numpy=True)
+            embedding = self._get_batcher().submit(text).astype(self.embedding_dtype, copy=False)
             
-            # Cache the result
-            self.embedding_cache[text] = embedding
+            # Cache the result, evicting the least recently used entry when full
+            with self._cache_lock:
+                self.embedding_cache[key] = embedding
+                if len(self.embedding_cache) > self.max_cache_size:
+                    self.embedding_cache.popitem(last=False)
             
             return embedding
         except Exception as e:
             logging.error(f"Error generating embedding for text: {e}")
-            return np.zeros(self.embedding_dim)
+            return np.zeros(self.embedding_dim, dtype=self.embedding_dtype)
     
-    def generate_embeddings_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+    def generate_embeddings_batch(self, texts: List[str], batch_size: int = 32,
+                                  out: Optional[np.ndarray] = None,
+                                  progress: Optional[bool] = None) -> np.ndarray:
         """
         Generate embeddings for a batch of texts.
         
         Args:
             texts: List of texts to embed
             batch_size: Batch size for processing
+            out: Optional preallocated (len(texts), embedding_dim) array to fill
+            progress: Show a progress bar (None: only for large jobs on a terminal)
             
         Returns:
             numpy array of embeddings
@@ -78,41 +325,63 @@ class LocalEmbeddingGenerator:
         if not texts:
             return np.array([])
         
-        # Filter out empty texts
-        valid_texts = [text for text in texts if text and text.strip()]
-        if not valid_texts:
-            return np.zeros((len(texts), self.embedding_dim))
+        if out is None:
+            out = np.empty((len(texts), self.embedding_dim), dtype=self.embedding_dtype)
+        
+        # Filter out empty texts and collapse duplicates onto a single encode slot
+        valid_positions = []
+        slots = []
+        unique_texts = []
+        text_slots = {}
+        for i, text in enumerate(texts):
+            if text and text.strip():
+                slot = text_slots.setdefault(text, len(unique_texts))
+                if slot == len(unique_texts):
+                    unique_texts.append(text)
+                valid_positions.append(i)
+                slots.append(slot)
+        if not unique_texts:
+            out.fill(0)
+            return out
         
         try:
-            # Generate embeddings in batches
-            embeddings = self.model.encode(
-                valid_texts, 
+            # Encode in length order so each batch pads to a similar length
+            order = np.argsort([len(text) for text in unique_texts], kind='stable')
+            if progress is None:
+                progress = len(unique_texts) >= max(256, 4 * batch_size) and sys.stderr.isatty()
+            embeddings = self._encode(
+                [unique_texts[i] for i in order], 
                 batch_size=batch_size, 
-                convert_to_numpy=True,
-                show_progress_bar=True
+                show_progress_bar=progress
             )
             
-            # Create result array with proper dimensions
-            result = np.zeros((len(texts), self.embedding_dim))
-            
             # Map embeddings back to original positions
-            valid_idx = 0
-            for i, text in enumerate(texts):
-                if text and text.strip():
-                    result[i] = embeddings[valid_idx]
-                    valid_idx += 1
+            if len(unique_texts) == len(texts):
+                # Common case: no empty or repeated texts, so undo the sort in one scatter
+                out[order] = embeddings
+            else:
+                inverse = np.empty_like(order)
+                inverse[order] = np.arange(len(order))
+                if len(valid_positions) < len(texts):
+                    out.fill(0)
+                out[valid_positions] = embeddings[inverse[slots]]
             
-            return result
+            return out
         except Exception as e:
             logging.error(f"Error generating batch embeddings: {e}")
-            return np.zeros((len(texts), self.embedding_dim))
+            out.fill(0)
+            return out
     
-    def generate_document_embeddings(self, documents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def generate_document_embeddings(self, documents: List[Dict[str, Any]],
+                                     chunk_size: int = 1024,
+                                     batch_size: int = 32) -> List[Dict[str, Any]]:
         """
         Generate embeddings for documents with metadata.
         
         Args:
             documents: List of documents with 'content' and 'metadata' keys
+            chunk_size: Number of documents whose texts are encoded at a time
+            batch_size: Batch size for the encoder
             
         Returns:
             List of documents with added 'embedding' key
@@ -120,13 +389,17 @@ class LocalEmbeddingGenerator:
         if not documents:
             return []
         
-        # Extract texts for batch processing
-        texts = [doc.get('content', '') for doc in documents]
-        
-        # Generate embeddings
-        embeddings = self.generate_embeddings_batch(texts)
+        # Encode chunk by chunk straight into one preallocated matrix
+        embeddings = np.empty((len(documents), self.embedding_dim), dtype=self.embedding_dtype)
+        for start in range(0, len(documents), chunk_size):
+            chunk = documents[start:start + chunk_size]
+            self.generate_embeddings_batch(
+                [doc.get('content', '') for doc in chunk],
+                batch_size=batch_size,
+                out=embeddings[start:start + len(chunk)]
+            )
         
-        # Add embeddings to documents
+        # Attach row views of the shared matrix to the documents
         for i, doc in enumerate(documents):
             doc['embedding'] = embeddings[i]
             doc['embedding_model'] = self.model_name
@@ -144,24 +417,19 @@ class LocalEmbeddingGenerator:
         Returns:
             Cosine similarity score
         """
-        try:
-            # Normalize embeddings
-            norm1 = np.linalg.norm(embedding1)
-            norm2 = np.linalg.norm(embedding2)
-            
-            if norm1 == 0 or norm2 == 0:
-                return 0.0
-            
-            # Compute cosine similarity
-            similarity = np.dot(embedding1, embedding2) / (norm1 * norm2)
-            return float(similarity)
-        except Exception as e:
-            logging.error(f"Error computing similarity: {e}")
+        # Three BLAS dot products and one sqrt instead of two separate norm calls
+        a = np.asarray(embedding1, dtype=np.float32).ravel()
+        b = np.asarray(embedding2, dtype=np.float32).ravel()
+        denominator = math.sqrt(float(a @ a) * float(b @ b))
+        if denominator == 0.0:
             return 0.0
+        
+        return float(a @ b) / denominator
     
     def find_similar_embeddings(self, query_embedding: np.ndarray, 
                                candidate_embeddings: np.ndarray, 
-                               top_k: int = 5) -> List[tuple]:
+                               top_k: int = 5,
+                               candidates_normalized: bool = False) -> List[tuple]:
         """
         Find most similar embeddings to a query embedding.
         
@@ -169,32 +437,17 @@ class LocalEmbeddingGenerator:
             query_embedding: Query embedding
             candidate_embeddings: Array of candidate embeddings
             top_k: Number of top results to return
+            candidates_normalized: True if candidates are already L2-normalized
             
         Returns:
             List of (index, similarity_score) tuples
         """
-        if len(candidate_embeddings) == 0:
-            return []
-        
-        try:
-            # Compute similarities
-            similarities = []
-            for i, candidate_emb in enumerate(candidate_embeddings):
-                similarity = self.compute_similarity(query_embedding, candidate_emb)
-                similarities.append((i, similarity))
-            
-            # Sort by similarity (descending)
-            similarities.sort(key=lambda x: x[1], reverse=True)
-            
-            # Return top_k results
-            return similarities[:top_k]
-        except Exception as e:
-            logging.error(f"Error finding similar embeddings: {e}")
-            return []
+        return _top_k_similar(query_embedding, candidate_embeddings, top_k, candidates_normalized)
     
     def clear_cache(self):
         """Clear the embedding cache."""
-        self.embedding_cache.clear()
+        with self._cache_lock:
+            self.embedding_cache.clear()
     
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current model."""
@@ -202,6 +455,8 @@ class LocalEmbeddingGenerator:
             'model_name': self.model_name,
             'embedding_dimension': self.embedding_dim,
             'device': self.device,
+            'precision': self.precision,
+            'compiled': self.compiled,
             'cache_size': len(self.embedding_cache)
         }
 
@@ -225,19 +480,21 @@ class EmbeddingManager:
         # Create cache directory if it doesn't exist
         os.makedirs(cache_dir, exist_ok=True)
     
-    def load_model(self, model_name: str, device: Optional[str] = None) -> LocalEmbeddingGenerator:
+    def load_model(self, model_name: str, device: Optional[str] = None,
+                   precision: Optional[str] = None) -> LocalEmbeddingGenerator:
         """
         Load an embedding model.
         
         Args:
             model_name: Name of the model to load
             device: Device to run the model on
+            precision: Model precision (see LocalEmbeddingGenerator)
             
         Returns:
-            LocalEmbeddingGenerator instance
+            Shared LocalEmbeddingGenerator instance
         """
         if model_name not in self.models:
-            self.models[model_name] = LocalEmbeddingGenerator(model_name, device)
+            self.models[model_name] = LocalEmbeddingGenerator.get(model_name, device, precision)
         
         self.active_model = model_name
         return self.models[model_name]
@@ -279,7 +536,7 @@ class EmbeddingManager:
     
     def load_embeddings(self, filename: str) -> Optional[np.ndarray]:
         """
-        Load embeddings from disk.
+        Load embeddings from disk, memory-mapped rather than read into RAM.
         
         Args:
             filename: Name of the file to load from
@@ -290,8 +547,13 @@ class EmbeddingManager:
         try:
             filepath = os.path.join(self.cache_dir, filename)
             if os.path.exists(filepath):
-                return np.load(filepath)
+                return np.load(filepath, mmap_mode='r')
             return None
         except Exception as e:
             logging.error(f"Error loading embeddings: {e}")
             return None
+
+
+# Generators shared across EmbeddingManagers, keyed by (model_name, device, precision)
+_GENERATORS: Dict[tuple, LocalEmbeddingGenerator] = {}
+_GENERATORS_LOCK = threading.Lock()
@@ -1,26 +1,288 @@
 import os
 import logging
-from typing import List, Dict, Any, Optional, Union
+import weakref
+import dataclasses
+import filecmp
+import hashlib
+import shutil
+import threading
+from collections import Counter, OrderedDict
+from itertools import chain, islice
+from operator import itemgetter
+from xml.sax.saxutils import escape
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 import json
-import markdown
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.pdfgen import canvas
+import numpy as np
 
-from ..querying.query_handler import QueryResult
 from ..processing.summarizer import Summary
 from ..reasoning.explanation_engine import ReasoningExplanationEngine, ReasoningPlan
 
+if TYPE_CHECKING:
+    # Annotations only: query_handler imports the embedding models
+    from ..querying.query_handler import QueryResult
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_default(obj):
+    """Serialize the datetimes, enums, numpy values and dataclasses found in export payloads."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _write_json(filepath: str, data: Dict[str, Any]):
+    """Write data as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, default=_json_default, option=option))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, default=_json_default)
+
+def _pdf_cache_key(kind: str, data: Dict[str, Any]) -> Optional[str]:
+    """
+    Content hash identifying a rendered PDF.
+    
+    Args:
+        kind: Export type, so different layouts never share an entry
+        data: Exported artifact as a dictionary
+        
+    Returns:
+        Hex digest, or None if the content cannot be serialized
+    """
+    try:
+        if orjson is not None:
+            payload = orjson.dumps(data, default=_json_default,
+                                   option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+                                   | orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            payload = json.dumps(data, default=_json_default, sort_keys=True).encode('utf-8')
+    except (TypeError, ValueError):
+        return None
+    digest = hashlib.blake2b(kind.encode('utf-8'), digest_size=16)
+    digest.update(payload)
+    return digest.hexdigest()
+
+# File extensions written by the exporters
+_EXPORT_EXTENSIONS = frozenset((".pdf", ".md", ".json"))
+
+# Attributes exported for each artifact, whatever its concrete type
+_QUERY_RESULT_FIELDS = ("query", "timestamp", "confidence", "processing_time",
+                        "answer", "sources", "reasoning_steps", "metadata")
+_SUMMARY_FIELDS = ("summary_type", "timestamp", "source_count", "confidence",
+                   "content", "key_points", "source_documents", "metadata")
+_STEP_FIELDS = ("step_id", "step_type", "confidence", "dependencies",
+                "input_data", "output_data", "execution_time")
+
+def _as_export_dict(obj, fields: tuple) -> Dict[str, Any]:
+    """
+    Convert an exported artifact to a dictionary.
+    
+    Only the listed attributes are exported, so dataclass instances and
+    duck-typed results share one schema.
+    """
+    return {field: getattr(obj, field) for field in fields}
+
+class _FilenameCharTable(dict):
+    """str.translate table keeping alphanumerics, ' ', '-' and '_' (filled in on demand)."""
+    
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        keep = char.isalnum() or char in ' -_'
+        self[codepoint] = codepoint if keep else None
+        return self[codepoint]
+
+_FILENAME_CHARS = _FilenameCharTable()
+_SPACE_TO_UNDERSCORE = str.maketrans(' ', '_')
+
+def _safe_filename_part(text: str) -> str:
+    """Reduce the first 30 characters of text to a filename-safe fragment."""
+    return text[:30].translate(_FILENAME_CHARS).rstrip().translate(_SPACE_TO_UNDERSCORE)
+
+def _preview(content: str, limit: int = 200) -> str:
+    """Truncate content to limit characters, marking the cut with an ellipsis."""
+    return content if len(content) <= limit else content[:limit] + "..."
+
+def _esc(text) -> str:
+    """Escape text for a reportlab Paragraph so markup characters render literally."""
+    return escape(text if isinstance(text, str) else str(text))
+
+def _run_exporter(manager: "ExportManager", table: str, format_type: str, artifact, filename: str) -> str:
+    """Run one exporter from an ExportManager handler table (picklable for worker processes)."""
+    return getattr(manager, table)[format_type](manager, artifact, filename)
+
+# Flowables pulled into a streaming PDF story at a time
+_STORY_BATCH_SIZE = 64
+
+class _StreamingStory(list):
+    """
+    PDF story that pulls flowables from an iterable in batches.
+    
+    reportlab's build() consumes the story from the front, so topping it up to
+    _STORY_BATCH_SIZE items keeps only a window of flowables alive (enough for
+    keepWithNext lookahead) instead of the whole document.
+    """
+    
+    def __init__(self, flowables):
+        super().__init__()
+        self._source = iter(flowables)
+        self._refill()
+    
+    def _refill(self):
+        if self._source is not None and list.__len__(self) < _STORY_BATCH_SIZE:
+            batch = list(islice(self._source, _STORY_BATCH_SIZE))
+            if len(batch) < _STORY_BATCH_SIZE:
+                self._source = None
+            self.extend(batch)
+    
+    def __len__(self):
+        self._refill()
+        return list.__len__(self)
+    
+    def __getitem__(self, index):
+        self._refill()
+        return list.__getitem__(self, index)
+
+# Most step/plan explanations kept per ExportManager for re-exports
+_EXPLANATION_CACHE_SIZE = 512
+
+# Most rendered PDFs kept in output_dir/.cache, least recently used pruned first
+_PDF_CACHE_MAX_ENTRIES = 64
+
+# reportlab names, bound by _lazy_reportlab() on the first PDF export so that
+# Markdown/JSON-only callers never import reportlab
+A4 = colors = BaseDocTemplate = Frame = PageTemplate = Paragraph = Spacer = PageBreak = None
+getSampleStyleSheet = ParagraphStyle = None
+_REPORTLAB_LOADED = False
+
+def _lazy_reportlab():
+    """Import the reportlab pieces used by the PDF exporters, once."""
+    global A4, colors, BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, PageBreak
+    global getSampleStyleSheet, ParagraphStyle, _REPORTLAB_LOADED
+    if _REPORTLAB_LOADED:
+        return
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, PageBreak
+    _REPORTLAB_LOADED = True
+
+def _source_flowables(index: int, source: Dict[str, Any], normal, heading3) -> List:
+    """Flowables describing one retrieved source of a query result."""
+    P = Paragraph
+    flowables = [
+        P(f"<b>Source {index}:</b>", heading3),
+        P("Document: " + _esc(source.get('document_id', 'Unknown')), normal),
+        P(f"Score: {source.get('score', 0):.3f}", normal),
+    ]
+    content = source.get('content')
+    if content is not None:
+        flowables.append(P("Content: " + _esc(_preview(content)), normal))
+    flowables.append(Spacer(1, 6))
+    return flowables
+
+def _query_step_flowables(index: int, step: Dict[str, Any], normal, heading3) -> List:
+    """Flowables describing one reasoning step of a query result."""
+    P = Paragraph
+    flowables = [
+        P(f"<b>Step {index}:</b> " + _esc(step.get('step_type', 'Unknown')), heading3),
+        P("Description: " + _esc(step.get('description', 'No description')), normal),
+    ]
+    if 'result' in step:
+        flowables.append(P("Result: " + _esc(step['result']), normal))
+    flowables.append(Spacer(1, 6))
+    return flowables
+
+def _bullet_flowables(title: str, items: List[str], normal) -> List:
+    """A bold label followed by one bullet paragraph per item and a spacer."""
+    P = Paragraph
+    flowables = [P(f"<b>{title}:</b>", normal)]
+    flowables.extend([P("• " + _esc(item), normal) for item in items])
+    flowables.append(Spacer(1, 6))
+    return flowables
+
+def _build_step_flowables(index: int, step, explanation, normal, heading3) -> List:
+    """Flowables for one step of a reasoning report, starting on a new page."""
+    P = Paragraph
+    dependencies = ', '.join(step.dependencies) if step.dependencies else 'None'
+    flowables = [
+        PageBreak(),
+        P(f"<b>Step {index}:</b> {step.step_type.value.replace('_', ' ').title()}", heading3),
+        P("<b>Step ID:</b> " + _esc(step.step_id), normal),
+        P(f"<b>Confidence:</b> {step.confidence:.2f}", normal),
+        P("<b>Dependencies:</b> " + _esc(dependencies), normal),
+        Spacer(1, 6),
+        
+        # Step explanation
+        P("<b>Purpose:</b> " + _esc(explanation.purpose), normal),
+        P("<b>Explanation:</b> " + _esc(explanation.explanation), normal),
+        Spacer(1, 6),
+    ]
+    
+    # Inputs, outputs and limitations
+    if explanation.inputs_used:
+        flowables.extend(_bullet_flowables("Inputs Used", explanation.inputs_used, normal))
+    if explanation.outputs_generated:
+        flowables.extend(_bullet_flowables("Outputs Generated", explanation.outputs_generated, normal))
+    if explanation.limitations:
+        flowables.extend(_bullet_flowables("Limitations", explanation.limitations, normal))
+    return flowables
+
+def _query_story(qr, normal, heading2, heading3, title_style):
+    """Generate the flowables of a query-result PDF, yielding sources and steps as they are laid out."""
+    P = Paragraph
+    yield P("Deep Researcher Agent - Query Result", title_style)
+    yield Spacer(1, 12)
+    yield P("<b>Query:</b> " + _esc(qr.query), normal)
+    yield P(f"<b>Timestamp:</b> {qr.timestamp.strftime('%Y-%m-%d %H:%M:%S')}", normal)
+    yield P(f"<b>Confidence:</b> {qr.confidence:.2f}", normal)
+    yield P(f"<b>Processing Time:</b> {qr.processing_time:.2f} seconds", normal)
+    yield Spacer(1, 12)
+    
+    # Answer
+    if qr.answer:
+        yield P("<b>Answer:</b>", heading2)
+        yield P(_esc(qr.answer), normal)
+        yield Spacer(1, 12)
+    
+    # Sources
+    if qr.sources:
+        yield P("<b>Sources:</b>", heading2)
+        for i, source in enumerate(qr.sources, 1):
+            yield from _source_flowables(i, source, normal, heading3)
+        yield Spacer(1, 12)
+    
+    # Reasoning steps
+    if qr.reasoning_steps:
+        yield P("<b>Reasoning Steps:</b>", heading2)
+        for i, step in enumerate(qr.reasoning_steps, 1):
+            yield from _query_step_flowables(i, step, normal, heading3)
+
 class ExportManager:
     """
     Manager for exporting research results in various formats (PDF, Markdown, JSON).
     """
     
+    # Shared reportlab sample stylesheet and title styles keyed by color name,
+    # built on first PDF export
+    _STYLES = None
+    _TITLE_STYLES: Dict[str, Any] = {}
+    
     def __init__(self, output_dir: str = "exports"):
         """
         Initialize the export manager.
@@ -30,44 +292,235 @@ class ExportManager:
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self._out_str = str(self.output_dir)
+        self._pdf_cache_dir = os.path.join(self._out_str, ".cache")
         self.explanation_engine = ReasoningExplanationEngine()
+        
+        # Explanations of steps/plans already exported, keyed by object identity
+        self._explanations: "OrderedDict[tuple, tuple]" = OrderedDict()
+        
+        # PDF document template reused by every PDF export on a thread
+        self._pdf_docs = threading.local()
         logging.info(f"ExportManager initialized with output directory: {self.output_dir}")
     
-    def export_query_result(self, query_result: QueryResult, format_type: str = "pdf", 
-                          filename: Optional[str] = None) -> str:
+    def __getstate__(self):
+        # Cached explanations hold weak references, which worker processes cannot unpickle
+        state = self.__dict__.copy()
+        state['_explanations'] = OrderedDict()
+        del state['_pdf_docs']
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._pdf_docs = threading.local()
+    
+    def _build_pdf(self, filepath: str, story):
+        """
+        Lay out a story into filepath with this thread's shared document template.
+        
+        The A4 BaseDocTemplate and its single-frame page template are set up on
+        the first PDF export and reused afterwards; each build opens a fresh canvas.
+        
+        Args:
+            filepath: Destination PDF path
+            story: Flowables to lay out
+        """
+        doc = getattr(self._pdf_docs, 'doc', None)
+        if doc is None:
+            doc = BaseDocTemplate(filepath, pagesize=A4)
+            frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal')
+            doc.addPageTemplates([PageTemplate(id='Normal', frames=frame, pagesize=doc.pagesize)])
+            self._pdf_docs.doc = doc
+        
+        try:
+            doc.build(story, filename=filepath)
+        except Exception:
+            # Start over from a clean template after a failed layout
+            self._pdf_docs.doc = None
+            raise
+        finally:
+            # The saved canvas still holds the document's pages; let them go
+            doc.canv = None
+    
+    @classmethod
+    def _get_styles(cls, title_color: str):
+        """
+        Get the shared PDF stylesheet and the title style for a color.
+        
+        Args:
+            title_color: Name of a reportlab color (e.g. 'darkblue')
+            
+        Returns:
+            Tuple of (stylesheet, title style)
+        """
+        if cls._STYLES is None:
+            _lazy_reportlab()
+            cls._STYLES = getSampleStyleSheet()
+        title_style = cls._TITLE_STYLES.get(title_color)
+        if title_style is None:
+            title_style = cls._TITLE_STYLES[title_color] = ParagraphStyle(
+                'CustomTitle',
+                parent=cls._STYLES['Heading1'],
+                fontSize=16,
+                spaceAfter=30,
+                textColor=getattr(colors, title_color)
+            )
+        return cls._STYLES, title_style
+    
+    def _cached_explanation(self, kind: str, obj, explain):
+        """
+        Explain a step or plan once and reuse the result while the object lives.
+        
+        Args:
+            kind: Cache namespace ('step' or 'plan')
+            obj: ReasoningStep or ReasoningPlan to explain
+            explain: Explanation engine method to call on a miss
+            
+        Returns:
+            The (possibly cached) explanation
+        """
+        key = (kind, id(obj))
+        entry = self._explanations.get(key)
+        if entry is not None and entry[0]() is obj:
+            self._explanations.move_to_end(key)
+            return entry[1]
+        
+        explanation = explain(obj)
+        self._explanations[key] = (weakref.ref(obj), explanation)
+        if len(self._explanations) > _EXPLANATION_CACHE_SIZE:
+            self._explanations.popitem(last=False)
+        return explanation
+    
+    def clear_explanation_cache(self):
+        """Forget cached step and plan explanations."""
+        self._explanations.clear()
+    
+    def _copy_cached_pdf(self, cache_key: Optional[str], filepath: str) -> bool:
+        """Copy a previously rendered PDF to filepath; False on a cache miss."""
+        if cache_key is None:
+            return False
+        cache_path = os.path.join(self._pdf_cache_dir, cache_key + ".pdf")
+        try:
+            shutil.copyfile(cache_path, filepath)
+            # Mark the entry as recently used for pruning
+            os.utime(cache_path)
+            return True
+        except FileNotFoundError:
+            return False
+    
+    def _store_cached_pdf(self, cache_key: Optional[str], filepath: str):
+        """Keep a copy of a freshly rendered PDF under its content hash."""
+        if cache_key is None:
+            return
+        try:
+            os.makedirs(self._pdf_cache_dir, exist_ok=True)
+            cache_path = os.path.join(self._pdf_cache_dir, cache_key + ".pdf")
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            shutil.copyfile(filepath, tmp_path)
+            os.replace(tmp_path, cache_path)
+            self._prune_pdf_cache()
+        except OSError as e:
+            logging.warning(f"Could not cache rendered PDF {filepath}: {e}")
+    
+    def _prune_pdf_cache(self):
+        """Delete the least recently used cached PDFs beyond _PDF_CACHE_MAX_ENTRIES."""
+        entries = []
+        with os.scandir(self._pdf_cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".pdf"):
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                    except FileNotFoundError:
+                        pass
+        if len(entries) <= _PDF_CACHE_MAX_ENTRIES:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - _PDF_CACHE_MAX_ENTRIES]:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+    
+    def _drop_cached_pdf(self, filepath: str):
+        """Delete cached renders with the same bytes as an exported PDF."""
+        try:
+            size = os.path.getsize(filepath)
+            with os.scandir(self._pdf_cache_dir) as it:
+                for entry in it:
+                    if (entry.name.endswith(".pdf") and entry.stat().st_size == size
+                            and filecmp.cmp(entry.path, filepath, shallow=False)):
+                        os.unlink(entry.path)
+        except OSError:
+            pass
+    
+    def clear_pdf_cache(self):
+        """Delete all cached PDF renders."""
+        shutil.rmtree(self._pdf_cache_dir, ignore_errors=True)
+    
+    @staticmethod
+    def _query_result_filename(query_result: "QueryResult") -> str:
+        """Default export filename for a query result."""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        safe_query = _safe_filename_part(query_result.query)
+        return f"query_result_{safe_query}_{timestamp}"
+    
+    def export_query_result(self, query_result: "QueryResult", format_type: str = "pdf", 
+                          filename: Optional[str] = None) -> Union[str, Dict[str, str]]:
         """
         Export a query result to the specified format.
         
         Args:
             query_result: QueryResult to export
-            format_type: Export format ('pdf', 'markdown', 'json')
+            format_type: Export format ('pdf', 'markdown', 'json', or 'all')
             filename: Optional custom filename
             
         Returns:
-            Path to the exported file
+            Path to the exported file, or a format -> path dict for 'all'
         """
         try:
             # Generate filename if not provided
             if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                safe_query = "".join(c for c in query_result.query[:30] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                safe_query = safe_query.replace(' ', '_')
-                filename = f"query_result_{safe_query}_{timestamp}"
+                filename = self._query_result_filename(query_result)
+            
+            if format_type.lower() == "all":
+                return self.export_all_formats(query_result, filename)
             
             # Export based on format type
-            if format_type.lower() == "pdf":
-                return self._export_query_result_to_pdf(query_result, filename)
-            elif format_type.lower() == "markdown":
-                return self._export_query_result_to_markdown(query_result, filename)
-            elif format_type.lower() == "json":
-                return self._export_query_result_to_json(query_result, filename)
-            else:
+            exporter = self._QUERY_RESULT_EXPORTERS.get(format_type.lower())
+            if exporter is None:
                 raise ValueError(f"Unsupported export format: {format_type}")
+            return exporter(self, query_result, filename)
                 
         except Exception as e:
             logging.error(f"Error exporting query result: {e}")
             raise
     
+    def export_all_formats(self, query_result: "QueryResult", filename: Optional[str] = None,
+                           use_processes: bool = False) -> Dict[str, str]:
+        """
+        Export a query result to every supported format concurrently.
+        
+        Args:
+            query_result: QueryResult to export
+            filename: Optional custom filename (shared by all formats)
+            use_processes: Run exporters in worker processes so PDF layout does
+                not contend for the GIL (workers re-import this module)
+            
+        Returns:
+            Dictionary mapping format name to exported file path
+        """
+        if not filename:
+            filename = self._query_result_filename(query_result)
+        
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        with executor_class(max_workers=len(self._QUERY_RESULT_EXPORTERS)) as executor:
+            futures = {
+                format_type: executor.submit(_run_exporter, self, "_QUERY_RESULT_EXPORTERS",
+                                             format_type, query_result, filename)
+                for format_type in self._QUERY_RESULT_EXPORTERS
+            }
+            return {format_type: future.result() for format_type, future in futures.items()}
+    
     def export_summary(self, summary: Summary, format_type: str = "pdf", 
                       filename: Optional[str] = None) -> str:
         """
@@ -88,14 +541,10 @@ class ExportManager:
                 filename = f"summary_{summary.summary_type}_{timestamp}"
             
             # Export based on format type
-            if format_type.lower() == "pdf":
-                return self._export_summary_to_pdf(summary, filename)
-            elif format_type.lower() == "markdown":
-                return self._export_summary_to_markdown(summary, filename)
-            elif format_type.lower() == "json":
-                return self._export_summary_to_json(summary, filename)
-            else:
+            exporter = self._SUMMARY_EXPORTERS.get(format_type.lower())
+            if exporter is None:
                 raise ValueError(f"Unsupported export format: {format_type}")
+            return exporter(self, summary, filename)
                 
         except Exception as e:
             logging.error(f"Error exporting summary: {e}")
@@ -115,173 +564,117 @@ class ExportManager:
             Path to the exported file
         """
         try:
+            # One clock read serves both the filename and the report timestamp
+            timestamp = datetime.now()
+            
             # Generate filename if not provided
             if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                safe_query = "".join(c for c in reasoning_plan.query[:30] if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                safe_query = safe_query.replace(' ', '_')
-                filename = f"reasoning_report_{safe_query}_{timestamp}"
+                safe_query = _safe_filename_part(reasoning_plan.query)
+                filename = f"reasoning_report_{safe_query}_{timestamp.strftime('%Y%m%d_%H%M%S')}"
             
             # Export based on format type
-            if format_type.lower() == "pdf":
-                return self._export_reasoning_report_to_pdf(reasoning_plan, filename)
-            elif format_type.lower() == "markdown":
-                return self._export_reasoning_report_to_markdown(reasoning_plan, filename)
-            elif format_type.lower() == "json":
-                return self._export_reasoning_report_to_json(reasoning_plan, filename)
-            else:
+            exporter = self._REASONING_REPORT_EXPORTERS.get(format_type.lower())
+            if exporter is None:
                 raise ValueError(f"Unsupported export format: {format_type}")
+            return exporter(self, reasoning_plan, filename, timestamp)
                 
         except Exception as e:
             logging.error(f"Error exporting reasoning report: {e}")
             raise
     
-    def _export_query_result_to_pdf(self, query_result: QueryResult, filename: str) -> str:
+    def _export_query_result_to_pdf(self, query_result: "QueryResult", filename: str) -> str:
         """Export query result to PDF format."""
-        filepath = self.output_dir / f"{filename}.pdf"
+        filepath = os.path.join(self._out_str, filename + ".pdf")
         
         try:
-            doc = SimpleDocTemplate(str(filepath), pagesize=A4)
-            story = []
-            styles = getSampleStyleSheet()
+            # Identical content was rendered before: reuse those bytes
+            cache_key = _pdf_cache_key('query_result', _as_export_dict(query_result, _QUERY_RESULT_FIELDS))
+            if self._copy_cached_pdf(cache_key, filepath):
+                logging.info(f"Query result exported to PDF (cached render): {filepath}")
+                return filepath
             
-            # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=30,
-                textColor=colors.darkblue
-            )
-            story.append(Paragraph("Deep Researcher Agent - Query Result", title_style))
-            story.append(Spacer(1, 12))
-            
-            # Query information
-            story.append(Paragraph(f"<b>Query:</b> {query_result.query}", styles['Normal']))
-            story.append(Paragraph(f"<b>Timestamp:</b> {query_result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
-            story.append(Paragraph(f"<b>Confidence:</b> {query_result.confidence:.2f}", styles['Normal']))
-            story.append(Paragraph(f"<b>Processing Time:</b> {query_result.processing_time:.2f} seconds", styles['Normal']))
-            story.append(Spacer(1, 12))
-            
-            # Answer
-            if query_result.answer:
-                story.append(Paragraph("<b>Answer:</b>", styles['Heading2']))
-                story.append(Paragraph(query_result.answer, styles['Normal']))
-                story.append(Spacer(1, 12))
+            _lazy_reportlab()
+            styles, title_style = self._get_styles('darkblue')
             
-            # Sources
-            if query_result.sources:
-                story.append(Paragraph("<b>Sources:</b>", styles['Heading2']))
-                for i, source in enumerate(query_result.sources, 1):
-                    story.append(Paragraph(f"<b>Source {i}:</b>", styles['Heading3']))
-                    story.append(Paragraph(f"Document: {source.get('document_id', 'Unknown')}", styles['Normal']))
-                    story.append(Paragraph(f"Score: {source.get('score', 0):.3f}", styles['Normal']))
-                    if 'content' in source:
-                        content_preview = source['content'][:200] + "..." if len(source['content']) > 200 else source['content']
-                        story.append(Paragraph(f"Content: {content_preview}", styles['Normal']))
-                    story.append(Spacer(1, 6))
-                story.append(Spacer(1, 12))
-            
-            # Reasoning steps
-            if query_result.reasoning_steps:
-                story.append(Paragraph("<b>Reasoning Steps:</b>", styles['Heading2']))
-                for i, step in enumerate(query_result.reasoning_steps, 1):
-                    story.append(Paragraph(f"<b>Step {i}:</b> {step.get('step_type', 'Unknown')}", styles['Heading3']))
-                    story.append(Paragraph(f"Description: {step.get('description', 'No description')}", styles['Normal']))
-                    if 'result' in step:
-                        story.append(Paragraph(f"Result: {step['result']}", styles['Normal']))
-                    story.append(Spacer(1, 6))
-            
-            # Build PDF
-            doc.build(story)
+            # Build PDF, generating flowables as the layout consumes them
+            story = _query_story(query_result, styles['Normal'], styles['Heading2'], styles['Heading3'], title_style)
+            self._build_pdf(filepath, _StreamingStory(story))
+            self._store_cached_pdf(cache_key, filepath)
             logging.info(f"Query result exported to PDF: {filepath}")
-            return str(filepath)
+            return filepath
             
         except Exception as e:
             logging.error(f"Error creating PDF: {e}")
             raise
     
-    def _export_query_result_to_markdown(self, query_result: QueryResult, filename: str) -> str:
+    def _export_query_result_to_markdown(self, query_result: "QueryResult", filename: str) -> str:
         """Export query result to Markdown format."""
-        filepath = self.output_dir / f"{filename}.md"
+        filepath = os.path.join(self._out_str, filename + ".md")
         
         try:
-            markdown_content = []
-            
-            # Header
-            markdown_content.append("# Deep Researcher Agent - Query Result")
-            markdown_content.append("")
-            
-            # Query information
-            markdown_content.append("## Query Information")
-            markdown_content.append(f"- **Query:** {query_result.query}")
-            markdown_content.append(f"- **Timestamp:** {query_result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-            markdown_content.append(f"- **Confidence:** {query_result.confidence:.2f}")
-            markdown_content.append(f"- **Processing Time:** {query_result.processing_time:.2f} seconds")
-            markdown_content.append("")
-            
-            # Answer
-            if query_result.answer:
-                markdown_content.append("## Answer")
-                markdown_content.append(query_result.answer)
-                markdown_content.append("")
-            
-            # Sources
-            if query_result.sources:
-                markdown_content.append("## Sources")
-                for i, source in enumerate(query_result.sources, 1):
-                    markdown_content.append(f"### Source {i}")
-                    markdown_content.append(f"- **Document:** {source.get('document_id', 'Unknown')}")
-                    markdown_content.append(f"- **Score:** {source.get('score', 0):.3f}")
-                    if 'content' in source:
-                        content_preview = source['content'][:200] + "..." if len(source['content']) > 200 else source['content']
-                        markdown_content.append(f"- **Content:** {content_preview}")
-                    markdown_content.append("")
-            
-            # Reasoning steps
-            if query_result.reasoning_steps:
-                markdown_content.append("## Reasoning Steps")
-                for i, step in enumerate(query_result.reasoning_steps, 1):
-                    markdown_content.append(f"### Step {i}: {step.get('step_type', 'Unknown')}")
-                    markdown_content.append(f"**Description:** {step.get('description', 'No description')}")
-                    if 'result' in step:
-                        markdown_content.append(f"**Result:** {step['result']}")
-                    markdown_content.append("")
-            
-            # Write to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(markdown_content))
+            # Stream lines straight to the buffered file; each section starts with its blank separator
+            with open(filepath, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                w = f.write
+                
+                # Header
+                w("# Deep Researcher Agent - Query Result\n")
+                
+                # Query information
+                w("\n## Query Information\n")
+                w(f"- **Query:** {query_result.query}\n")
+                w(f"- **Timestamp:** {query_result.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                w(f"- **Confidence:** {query_result.confidence:.2f}\n")
+                w(f"- **Processing Time:** {query_result.processing_time:.2f} seconds\n")
+                
+                # Answer
+                if query_result.answer:
+                    w("\n## Answer\n")
+                    w(f"{query_result.answer}\n")
+                
+                # Sources
+                if query_result.sources:
+                    w("\n## Sources\n")
+                    for i, source in enumerate(query_result.sources, 1):
+                        if i > 1:
+                            w("\n")
+                        w(f"### Source {i}\n")
+                        w(f"- **Document:** {source.get('document_id', 'Unknown')}\n")
+                        w(f"- **Score:** {source.get('score', 0):.3f}\n")
+                        content = source.get('content')
+                        if content is not None:
+                            w(f"- **Content:** {_preview(content)}\n")
+                
+                # Reasoning steps
+                if query_result.reasoning_steps:
+                    w("\n## Reasoning Steps\n")
+                    for i, step in enumerate(query_result.reasoning_steps, 1):
+                        if i > 1:
+                            w("\n")
+                        w(f"### Step {i}: {step.get('step_type', 'Unknown')}\n")
+                        w(f"**Description:** {step.get('description', 'No description')}\n")
+                        if 'result' in step:
+                            w(f"**Result:** {step['result']}\n")
             
             logging.info(f"Query result exported to Markdown: {filepath}")
-            return str(filepath)
+            return filepath
             
         except Exception as e:
             logging.error(f"Error creating Markdown: {e}")
             raise
     
-    def _export_query_result_to_json(self, query_result: QueryResult, filename: str) -> str:
+    def _export_query_result_to_json(self, query_result: "QueryResult", filename: str) -> str:
         """Export query result to JSON format."""
-        filepath = self.output_dir / f"{filename}.json"
+        filepath = os.path.join(self._out_str, filename + ".json")
         
         try:
             # Convert to dictionary
-            result_dict = {
-                "query": query_result.query,
-                "timestamp": query_result.timestamp.isoformat(),
-                "confidence": query_result.confidence,
-                "processing_time": query_result.processing_time,
-                "answer": query_result.answer,
-                "sources": query_result.sources,
-                "reasoning_steps": query_result.reasoning_steps,
-                "metadata": query_result.metadata
-            }
+            result_dict = _as_export_dict(query_result, _QUERY_RESULT_FIELDS)
             
             # Write to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(result_dict, f, indent=2, ensure_ascii=False)
+            _write_json(filepath, result_dict)
             
             logging.info(f"Query result exported to JSON: {filepath}")
-            return str(filepath)
+            return filepath
             
         except Exception as e:
             logging.error(f"Error creating JSON: {e}")
@@ -289,55 +682,54 @@ class ExportManager:
     
     def _export_summary_to_pdf(self, summary: Summary, filename: str) -> str:
         """Export summary to PDF format."""
-        filepath = self.output_dir / f"{filename}.pdf"
+        filepath = os.path.join(self._out_str, filename + ".pdf")
         
         try:
-            doc = SimpleDocTemplate(str(filepath), pagesize=A4)
+            # Identical content was rendered before: reuse those bytes
+            cache_key = _pdf_cache_key('summary', _as_export_dict(summary, _SUMMARY_FIELDS))
+            if self._copy_cached_pdf(cache_key, filepath):
+                logging.info(f"Summary exported to PDF (cached render): {filepath}")
+                return filepath
+            
+            _lazy_reportlab()
             story = []
-            styles = getSampleStyleSheet()
+            styles, title_style = self._get_styles('darkgreen')
+            normal, heading2 = styles['Normal'], styles['Heading2']
             
-            # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=30,
-                textColor=colors.darkgreen
-            )
-            story.append(Paragraph("Deep Researcher Agent - Summary", title_style))
-            story.append(Spacer(1, 12))
+            P = Paragraph
             
-            # Summary information
-            story.append(Paragraph(f"<b>Summary Type:</b> {summary.summary_type}", styles['Normal']))
-            story.append(Paragraph(f"<b>Timestamp:</b> {summary.timestamp.strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
-            story.append(Paragraph(f"<b>Source Count:</b> {summary.source_count}", styles['Normal']))
-            story.append(Paragraph(f"<b>Confidence:</b> {summary.confidence:.2f}", styles['Normal']))
-            story.append(Spacer(1, 12))
+            # Title and summary information
+            story.extend([
+                P("Deep Researcher Agent - Summary", title_style),
+                Spacer(1, 12),
+                P("<b>Summary Type:</b> " + _esc(summary.summary_type), normal),
+                P(f"<b>Timestamp:</b> {summary.timestamp.strftime('%Y-%m-%d %H:%M:%S')}", normal),
+                P(f"<b>Source Count:</b> {summary.source_count}", normal),
+                P(f"<b>Confidence:</b> {summary.confidence:.2f}", normal),
+                Spacer(1, 12),
+            ])
             
             # Summary content
             if summary.content:
-                story.append(Paragraph("<b>Summary:</b>", styles['Heading2']))
-                story.append(Paragraph(summary.content, styles['Normal']))
-                story.append(Spacer(1, 12))
+                story.extend([P("<b>Summary:</b>", heading2), P(_esc(summary.content), normal), Spacer(1, 12)])
             
             # Key points
             if summary.key_points:
-                story.append(Paragraph("<b>Key Points:</b>", styles['Heading2']))
-                for point in summary.key_points:
-                    story.append(Paragraph(f"• {point}", styles['Normal']))
+                story.append(P("<b>Key Points:</b>", heading2))
+                story.extend([P("• " + _esc(point), normal) for point in summary.key_points])
                 story.append(Spacer(1, 12))
             
             # Source documents
             if summary.source_documents:
-                story.append(Paragraph("<b>Source Documents:</b>", styles['Heading2']))
-                for doc in summary.source_documents:
-                    story.append(Paragraph(f"• {doc}", styles['Normal']))
+                story.append(P("<b>Source Documents:</b>", heading2))
+                story.extend([P("• " + _esc(source), normal) for source in summary.source_documents])
                 story.append(Spacer(1, 12))
             
             # Build PDF
-            doc.build(story)
+            self._build_pdf(filepath, story)
+            self._store_cached_pdf(cache_key, filepath)
             logging.info(f"Summary exported to PDF: {filepath}")
-            return str(filepath)
+            return filepath
             
         except Exception as e:
             logging.error(f"Error creating PDF: {e}")
@@ -345,49 +737,40 @@ class ExportManager:
     
     def _export_summary_to_markdown(self, summary: Summary, filename: str) -> str:
         """Export summary to Markdown format."""
-        filepath = self.output_dir / f"{filename}.md"
+        filepath = os.path.join(self._out_str, filename + ".md")
         
         try:
-            markdown_content = []
-            
-            # Header
-            markdown_content.append("# Deep Researcher Agent - Summary")
-            markdown_content.append("")
-            
-            # Summary information
-            markdown_content.append("## Summary Information")
-            markdown_content.append(f"- **Summary Type:** {summary.summary_type}")
-            markdown_content.append(f"- **Timestamp:** {summary.timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
-            markdown_content.append(f"- **Source Count:** {summary.source_count}")
-            markdown_content.append(f"- **Confidence:** {summary.confidence:.2f}")
-            markdown_content.append("")
-            
-            # Summary content
-            if summary.content:
-                markdown_content.append("## Summary")
-                markdown_content.append(summary.content)
-                markdown_content.append("")
-            
-            # Key points
-            if summary.key_points:
-                markdown_content.append("## Key Points")
-                for point in summary.key_points:
-                    markdown_content.append(f"- {point}")
-                markdown_content.append("")
-            
-            # Source documents
-            if summary.source_documents:
-                markdown_content.append("## Source Documents")
-                for doc in summary.source_documents:
-                    markdown_content.append(f"- {doc}")
-                markdown_content.append("")
-            
-            # Write to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(markdown_content))
+            # Stream lines straight to the buffered file; each section starts with its blank separator
+            with open(filepath, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                w = f.write
+                
+                # Header
+                w("# Deep Researcher Agent - Summary\n")
+                
+                # Summary information
+                w("\n## Summary Information\n")
+                w(f"- **Summary Type:** {summary.summary_type}\n")
+                w(f"- **Timestamp:** {summary.timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                w(f"- **Source Count:** {summary.source_count}\n")
+                w(f"- **Confidence:** {summary.confidence:.2f}\n")
+                
+                # Summary content
+                if summary.content:
+                    w("\n## Summary\n")
+                    w(f"{summary.content}\n")
+                
+                # Key points
+                if summary.key_points:
+                    w("\n## Key Points\n")
+                    f.writelines(f"- {point}\n" for point in summary.key_points)
+                
+                # Source documents
+                if summary.source_documents:
+                    w("\n## Source Documents\n")
+                    f.writelines(f"- {doc}\n" for doc in summary.source_documents)
             
             logging.info(f"Summary exported to Markdown: {filepath}")
-            return str(filepath)
+            return filepath
             
         except Exception as e:
             logging.error(f"Error creating Markdown: {e}")
@@ -395,113 +778,72 @@ class ExportManager:
     
     def _export_summary_to_json(self, summary: Summary, filename: str) -> str:
         """Export summary to JSON format."""
-        filepath = self.output_dir / f"{filename}.json"
+        filepath = os.path.join(self._out_str, filename + ".json")
         
         try:
             # Convert to dictionary
-            summary_dict = {
-                "summary_type": summary.summary_type,
-                "timestamp": summary.timestamp.isoformat(),
-                "source_count": summary.source_count,
-                "confidence": summary.confidence,
-                "content": summary.content,
-                "key_points": summary.key_points,
-                "source_documents": summary.source_documents,
-                "metadata": summary.metadata
-            }
+            summary_dict = _as_export_dict(summary, _SUMMARY_FIELDS)
             
             # Write to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(summary_dict, f, indent=2, ensure_ascii=False)
+            _write_json(filepath, summary_dict)
             
             logging.info(f"Summary exported to JSON: {filepath}")
-            return str(filepath)
+            return filepath
             
         except Exception as e:
             logging.error(f"Error creating JSON: {e}")
             raise
     
-    def _export_reasoning_report_to_pdf(self, reasoning_plan: ReasoningPlan, filename: str) -> str:
+    def _export_reasoning_report_to_pdf(self, reasoning_plan: ReasoningPlan, filename: str,
+                                        timestamp: Optional[datetime] = None) -> str:
         """Export reasoning report to PDF format."""
-        filepath = self.output_dir / f"{filename}.pdf"
+        filepath = os.path.join(self._out_str, filename + ".pdf")
         
         try:
-            doc = SimpleDocTemplate(str(filepath), pagesize=A4)
+            _lazy_reportlab()
             story = []
-            styles = getSampleStyleSheet()
+            styles, title_style = self._get_styles('darkred')
+            normal, heading2, heading3 = styles['Normal'], styles['Heading2'], styles['Heading3']
             
-            # Title
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=16,
-                spaceAfter=30,
-                textColor=colors.darkred
-            )
-            story.append(Paragraph("Deep Researcher Agent - Reasoning Report", title_style))
-            story.append(Spacer(1, 12))
+            P = Paragraph
             
-            # Query information
-            story.append(Paragraph(f"<b>Query:</b> {reasoning_plan.query}", styles['Normal']))
-            story.append(Paragraph(f"<b>Timestamp:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
-            story.append(Paragraph(f"<b>Confidence:</b> {reasoning_plan.confidence_score:.2f}", styles['Normal']))
-            story.append(Paragraph(f"<b>Total Steps:</b> {len(reasoning_plan.steps)}", styles['Normal']))
-            story.append(Spacer(1, 12))
+            # Title and query information
+            story.extend([
+                P("Deep Researcher Agent - Reasoning Report", title_style),
+                Spacer(1, 12),
+                P("<b>Query:</b> " + _esc(reasoning_plan.query), normal),
+                P(f"<b>Timestamp:</b> {(timestamp or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')}", normal),
+                P(f"<b>Confidence:</b> {reasoning_plan.confidence_score:.2f}", normal),
+                P(f"<b>Total Steps:</b> {len(reasoning_plan.steps)}", normal),
+                Spacer(1, 12),
+            ])
             
             # Final answer
             if reasoning_plan.final_answer:
-                story.append(Paragraph("<b>Final Answer:</b>", styles['Heading2']))
-                story.append(Paragraph(reasoning_plan.final_answer, styles['Normal']))
-                story.append(Spacer(1, 12))
+                story.extend([P("<b>Final Answer:</b>", heading2), P(_esc(reasoning_plan.final_answer), normal), Spacer(1, 12)])
             
-            # Reasoning steps
-            story.append(Paragraph("<b>Reasoning Steps:</b>", styles['Heading2']))
-            for i, step in enumerate(reasoning_plan.steps, 1):
-                story.append(PageBreak())
-                story.append(Paragraph(f"<b>Step {i}:</b> {step.step_type.value.replace('_', ' ').title()}", styles['Heading3']))
-                story.append(Paragraph(f"<b>Step ID:</b> {step.step_id}", styles['Normal']))
-                story.append(Paragraph(f"<b>Confidence:</b> {step.confidence:.2f}", styles['Normal']))
-                story.append(Paragraph(f"<b>Dependencies:</b> {', '.join(step.dependencies) if step.dependencies else 'None'}", styles['Normal']))
-                story.append(Spacer(1, 6))
-                
-                # Step explanation
-                explanation = self.explanation_engine.explain_reasoning_step(step)
-                story.append(Paragraph(f"<b>Purpose:</b> {explanation.purpose}", styles['Normal']))
-                story.append(Paragraph(f"<b>Explanation:</b> {explanation.explanation}", styles['Normal']))
-                story.append(Spacer(1, 6))
-                
-                # Inputs and outputs
-                if explanation.inputs_used:
-                    story.append(Paragraph("<b>Inputs Used:</b>", styles['Normal']))
-                    for input_item in explanation.inputs_used:
-                        story.append(Paragraph(f"• {input_item}", styles['Normal']))
-                    story.append(Spacer(1, 6))
-                
-                if explanation.outputs_generated:
-                    story.append(Paragraph("<b>Outputs Generated:</b>", styles['Normal']))
-                    for output_item in explanation.outputs_generated:
-                        story.append(Paragraph(f"• {output_item}", styles['Normal']))
-                    story.append(Spacer(1, 6))
-                
-                # Limitations
-                if explanation.limitations:
-                    story.append(Paragraph("<b>Limitations:</b>", styles['Normal']))
-                    for limitation in explanation.limitations:
-                        story.append(Paragraph(f"• {limitation}", styles['Normal']))
-                    story.append(Spacer(1, 6))
+            # Reasoning steps are generated as the layout consumes them
+            story.append(P("<b>Reasoning Steps:</b>", heading2))
+            explain_step = self.explanation_engine.explain_reasoning_step
+            step_flowables = chain.from_iterable(
+                _build_step_flowables(i, step, self._cached_explanation('step', step, explain_step),
+                                      normal, heading3)
+                for i, step in enumerate(reasoning_plan.steps, 1)
+            )
             
             # Build PDF
-            doc.build(story)
+            self._build_pdf(filepath, _StreamingStory(chain(story, step_flowables)))
             logging.info(f"Reasoning report exported to PDF: {filepath}")
-            return str(filepath)
+            return filepath
             
         except Exception as e:
             logging.error(f"Error creating PDF: {e}")
             raise
     
-    def _export_reasoning_report_to_markdown(self, reasoning_plan: ReasoningPlan, filename: str) -> str:
+    def _export_reasoning_report_to_markdown(self, reasoning_plan: ReasoningPlan, filename: str,
+                                             timestamp: Optional[datetime] = None) -> str:
         """Export reasoning report to Markdown format."""
-        filepath = self.output_dir / f"{filename}.md"
+        filepath = os.path.join(self._out_str, filename + ".md")
         
         try:
             # Generate step-by-step report
@@ -512,55 +854,61 @@ class ExportManager:
                 f.write(report_content)
             
             logging.info(f"Reasoning report exported to Markdown: {filepath}")
-            return str(filepath)
+            return filepath
             
         except Exception as e:
             logging.error(f"Error creating Markdown: {e}")
             raise
     
-    def _export_reasoning_report_to_json(self, reasoning_plan: ReasoningPlan, filename: str) -> str:
+    def _export_reasoning_report_to_json(self, reasoning_plan: ReasoningPlan, filename: str,
+                                         timestamp: Optional[datetime] = None) -> str:
         """Export reasoning report to JSON format."""
-        filepath = self.output_dir / f"{filename}.json"
+        filepath = os.path.join(self._out_str, filename + ".json")
         
         try:
             # Get explanation
-            explanation = self.explanation_engine.explain_reasoning_plan(reasoning_plan)
+            explanation = self._cached_explanation(
+                'plan', reasoning_plan, self.explanation_engine.explain_reasoning_plan
+            )
             
             # Convert to dictionary
             report_dict = {
                 "query": reasoning_plan.query,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": timestamp or datetime.now(),
                 "confidence_score": reasoning_plan.confidence_score,
                 "final_answer": reasoning_plan.final_answer,
                 "step_count": len(reasoning_plan.steps),
                 "explanation": explanation,
-                "steps": []
+                "steps": [_as_export_dict(step, _STEP_FIELDS) for step in reasoning_plan.steps]
             }
             
-            # Add step details
-            for step in reasoning_plan.steps:
-                step_dict = {
-                    "step_id": step.step_id,
-                    "step_type": step.step_type.value,
-                    "confidence": step.confidence,
-                    "dependencies": step.dependencies,
-                    "input_data": step.input_data,
-                    "output_data": step.output_data,
-                    "execution_time": step.execution_time
-                }
-                report_dict["steps"].append(step_dict)
-            
             # Write to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(report_dict, f, indent=2, ensure_ascii=False)
+            _write_json(filepath, report_dict)
             
             logging.info(f"Reasoning report exported to JSON: {filepath}")
-            return str(filepath)
+            return filepath
             
         except Exception as e:
             logging.error(f"Error creating JSON: {e}")
             raise
     
+    # Exporters by format name, looked up by the public export_* methods
+    _QUERY_RESULT_EXPORTERS = {
+        "pdf": _export_query_result_to_pdf,
+        "markdown": _export_query_result_to_markdown,
+        "json": _export_query_result_to_json,
+    }
+    _SUMMARY_EXPORTERS = {
+        "pdf": _export_summary_to_pdf,
+        "markdown": _export_summary_to_markdown,
+        "json": _export_summary_to_json,
+    }
+    _REASONING_REPORT_EXPORTERS = {
+        "pdf": _export_reasoning_report_to_pdf,
+        "markdown": _export_reasoning_report_to_markdown,
+        "json": _export_reasoning_report_to_json,
+    }
+    
     def list_exports(self) -> List[Dict[str, Any]]:
         """
         List all exported files.
@@ -571,19 +919,21 @@ class ExportManager:
         try:
             exports = []
             
-            for file_path in self.output_dir.glob("*"):
-                if file_path.is_file():
-                    stat = file_path.stat()
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
                     exports.append({
-                        "filename": file_path.name,
-                        "filepath": str(file_path),
+                        "filename": entry.name,
+                        "filepath": entry.path,
                         "size": stat.st_size,
                         "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
                         "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                        "format": file_path.suffix.lower()
+                        "format": os.path.splitext(entry.name)[1].lower()
                     })
             
-            return sorted(exports, key=lambda x: x["created"], reverse=True)
+            return sorted(exports, key=itemgetter("created"), reverse=True)
             
         except Exception as e:
             logging.error(f"Error listing exports: {e}")
@@ -599,16 +949,17 @@ class ExportManager:
         Returns:
             True if successful, False otherwise
         """
+        filepath = os.path.join(self._out_str, filename)
         try:
-            filepath = self.output_dir / filename
-            if filepath.exists():
-                filepath.unlink()
-                logging.info(f"Deleted export file: {filepath}")
-                return True
-            else:
-                logging.warning(f"Export file not found: {filepath}")
-                return False
-                
+            if filename.endswith(".pdf"):
+                self._drop_cached_pdf(filepath)
+            os.unlink(filepath)
+            logging.info(f"Deleted export file: {filepath}")
+            return True
+            
+        except FileNotFoundError:
+            logging.warning(f"Export file not found: {filepath}")
+            return False
         except Exception as e:
             logging.error(f"Error deleting export file: {e}")
             return False
@@ -651,17 +1002,17 @@ class ExportManager:
             
             # Count existing files in output directory
             if self.output_dir.exists():
-                files = list(self.output_dir.glob("*"))
-                stats["current_file_count"] = len(files)
+                with os.scandir(self._out_str) as entries:
+                    extensions = Counter(
+                        os.path.splitext(entry.name)[1].lower()
+                        for entry in entries if entry.is_file(follow_symlinks=False)
+                    )
+                stats["current_file_count"] = sum(extensions.values())
                 
                 # Count by file type
-                file_types = {}
-                for file in files:
-                    ext = file.suffix.lower()
-                    if ext in [".pdf", ".md", ".json"]:
-                        format_name = ext[1:]  # Remove dot
-                        file_types[format_name] = file_types.get(format_name, 0) + 1
-                stats["current_files_by_type"] = file_types
+                stats["current_files_by_type"] = {
+                    ext[1:]: count for ext, count in extensions.items() if ext in _EXPORT_EXTENSIONS
+                }
             else:
                 stats["current_file_count"] = 0
                 stats["current_files_by_type"] = {}
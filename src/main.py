@@ -8,26 +8,233 @@ import os
 import sys
 import logging
 import argparse
-from typing import Optional, List, Dict, Any
+import atexit
+import copy
+import heapq
+import importlib
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from enum import Enum
+from functools import cached_property, lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Callable, Optional, List, Dict, Any, NamedTuple, Sequence, Tuple
 import json
 from pathlib import Path
 
+import numpy as np
+
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.querying.query_handler import QueryHandler
-from src.querying.query_refiner import QueryRefiner
-from src.processing.document_processor import DocumentProcessor, DocumentIngestor
-from src.processing.summarizer import DocumentSummarizer
-from src.storage.document_store import DocumentStore
-from src.embeddings.embedding_generator import EmbeddingManager
-from src.reasoning.reasoning_engine import ReasoningEngine
-from src.reasoning.explanation_engine import ReasoningExplanationEngine
-from src.exporting.export_manager import ExportManager
 from config.config_manager import ConfigManager
 
+# Components whose modules pull in torch, sentence-transformers or FAISS are
+# imported by the agent property that first creates them, so commands that
+# never touch the models start without loading those libraries
+_LAZY_IMPORTS = {
+    'QueryHandler': 'src.querying.query_handler',
+    'QueryRefiner': 'src.querying.query_refiner',
+    'SemanticQueryCache': 'src.querying.query_cache',
+    'DocumentProcessor': 'src.processing.document_processor',
+    'DocumentIngestor': 'src.processing.document_processor',
+    'DocumentSummarizer': 'src.processing.summarizer',
+    'DocumentStore': 'src.storage.document_store',
+    'EmbeddingManager': 'src.embeddings.embedding_generator',
+    'LocalEmbeddingGenerator': 'src.embeddings.embedding_generator',
+    'EmbeddingCache': 'src.embeddings.embedding_cache',
+    'ReasoningEngine': 'src.reasoning.reasoning_engine',
+    'ReasoningExplanationEngine': 'src.reasoning.explanation_engine',
+    'ExportManager': 'src.exporting.export_manager',
+}
+
+if TYPE_CHECKING:
+    from src.querying.query_handler import QueryHandler
+    from src.querying.query_refiner import QueryRefiner
+    from src.querying.query_cache import SemanticQueryCache
+    from src.processing.document_processor import DocumentProcessor, DocumentIngestor
+    from src.processing.summarizer import DocumentSummarizer
+    from src.storage.document_store import DocumentStore
+    from src.embeddings.embedding_generator import EmbeddingManager, LocalEmbeddingGenerator
+    from src.reasoning.reasoning_engine import ReasoningEngine
+    from src.reasoning.explanation_engine import ReasoningExplanationEngine
+    from src.exporting.export_manager import ExportManager
+
+def __getattr__(name: str):
+    """Resolve the lazily imported component classes as module attributes."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 logger = logging.getLogger(__name__)
 
+# Most expanded-query embeddings kept in memory and in data_dir/embed_cache.npz
+_QUERY_EMBEDDING_CACHE_SIZE = 4096
+
+# Seconds a get_status() result is reused
+_STATUS_TTL = 1.0
+
+# Documents a deep-research run reports and reasons over
+_DEEP_RESULT_LIMIT = 10
+
+# Topic triggers, matched as whole words in the lower-cased query
+_AI_PATTERN = re.compile(r"\b(?:artificial intelligence|ai)\b")
+_ML_PATTERN = re.compile(r"\bmachine learning\b")
+_DATA_SCIENCE_PATTERN = re.compile(r"\bdata science\b")
+_PYTHON_PATTERN = re.compile(r"\bpython\b")
+
+# Related searches added for a query's topic, tried in order
+_TOPIC_EXPANSIONS = (
+    (_AI_PATTERN, (
+        'machine learning algorithms',
+        'neural networks deep learning',
+        'computer vision image recognition',
+        'natural language processing',
+        'expert systems knowledge representation'
+    )),
+    (_ML_PATTERN, (
+        'supervised learning classification',
+        'unsupervised learning clustering',
+        'reinforcement learning',
+        'neural networks artificial intelligence',
+        'data mining pattern recognition'
+    )),
+    (_DATA_SCIENCE_PATTERN, (
+        'statistical analysis data mining',
+        'predictive modeling analytics',
+        'big data processing',
+        'business intelligence reporting'
+    )),
+)
+
+# Canned definitions for "what is" questions about a known topic, tried in order
+_TOPIC_DEFINITIONS = (
+    (_AI_PATTERN, "Artificial intelligence (AI) is a branch of computer science that focuses on creating systems capable of performing tasks that typically require human intelligence. These tasks include learning, reasoning, problem-solving, perception, and language understanding. AI systems can analyze data, recognize patterns, make predictions, and even generate creative content. The field encompasses various subareas like machine learning, natural language processing, computer vision, and robotics."),
+    (_ML_PATTERN, "Machine learning is a subset of artificial intelligence that enables computers to learn and improve from experience without being explicitly programmed. It involves algorithms that can analyze data, identify patterns, and make predictions or decisions. There are three main types: supervised learning (learning from labeled examples), unsupervised learning (finding patterns in data), and reinforcement learning (learning through trial and error with rewards and penalties)."),
+    (_DATA_SCIENCE_PATTERN, "Data science is an interdisciplinary field that combines statistics, programming, and domain expertise to extract insights and knowledge from structured and unstructured data. Data scientists use various tools and techniques including data collection, cleaning, analysis, visualization, and machine learning to solve complex problems and make data-driven decisions across industries like healthcare, finance, technology, and marketing."),
+    (_PYTHON_PATTERN, "Python is a high-level, versatile programming language known for its simplicity and readability. It's widely used in web development, data science, artificial intelligence, automation, and scientific computing. Python's extensive libraries and frameworks make it suitable for both beginners and experts. Key features include dynamic typing, automatic memory management, and support for multiple programming paradigms."),
+)
+
+class QuestionType(Enum):
+    """Question shapes that select the direct-answer template."""
+    DEFINITION = "definition"
+    HOW_IT_WORKS = "how_it_works"
+    HOW_TO = "how_to"
+    EXPLANATION = "explanation"
+    WHY = "why"
+    GENERAL = "general"
+
+class QueryContext(NamedTuple):
+    """A query classified once: raw and lower-cased text, question type and subject."""
+    raw: str
+    lower: str
+    qtype: QuestionType
+    subject: str
+
+# Direct answer when no documents are available to answer from
+_NO_DOCUMENTS_ANSWER = "I don't have enough information in my knowledge base to answer that question. Please upload some documents related to your topic so I can provide a more accurate response."
+
+# Direct answers per question type, filled in with the query's subject
+_DIRECT_ANSWER_TEMPLATES = {
+    QuestionType.DEFINITION: "Based on the information available, {subject} involves the study and application of methods to extract meaningful insights and solve problems in that domain. It typically combines theoretical knowledge with practical applications and may involve various tools, techniques, and methodologies depending on the specific context.",
+    QuestionType.HOW_IT_WORKS: "The process of {subject} typically involves several key steps: understanding the problem, gathering relevant information, applying appropriate methods or techniques, analyzing results, and drawing conclusions. The exact approach depends on the specific context and available resources.",
+    QuestionType.HOW_TO: "To {subject}, you would typically need to: 1) Understand the requirements or problem, 2) Gather necessary resources and information, 3) Apply appropriate methods or techniques, 4) Monitor progress and make adjustments, and 5) Evaluate the results. The specific steps depend on the particular situation and domain.",
+    QuestionType.EXPLANATION: "Let me explain {subject}. This involves breaking down the concept into understandable parts, discussing its key components, applications, and significance. A comprehensive explanation would cover the definition, main characteristics, practical applications, and any important considerations or limitations.",
+    QuestionType.WHY: "There are several reasons why {subject}. The main factors include practical benefits, theoretical foundations, real-world applications, and ongoing research developments. Understanding the underlying principles helps explain both the importance and the challenges associated with this topic.",
+    QuestionType.GENERAL: "That's an interesting question about {subject}. From the available information, I can tell you that this topic involves several important aspects and applications. The key points include understanding the fundamental concepts, recognizing practical applications, and being aware of current developments and future trends in the field.",
+}
+
+def _classify_query(query: str) -> QueryContext:
+    """
+    Classify a query's question type and extract its subject in one pass.
+    
+    Args:
+        query: The query text
+        
+    Returns:
+        QueryContext for the query
+    """
+    query_lower = query.lower()
+
+    if 'what is' in query_lower or 'what are' in query_lower or 'define' in query_lower:
+        return QueryContext(query, query_lower, QuestionType.DEFINITION, query[0].lower() + query[1:])
+    if 'how' in query_lower:
+        qtype = (QuestionType.HOW_IT_WORKS if 'work' in query_lower or 'function' in query_lower
+                 else QuestionType.HOW_TO)
+        return QueryContext(query, query_lower, qtype, query[4:].strip())
+    if 'explain' in query_lower or 'describe' in query_lower:
+        if query_lower.startswith('explain '):
+            subject = query[8:]
+        elif query_lower.startswith('describe '):
+            subject = query[9:]
+        else:
+            subject = query[7:]
+        return QueryContext(query, query_lower, QuestionType.EXPLANATION, subject)
+    if 'why' in query_lower:
+        return QueryContext(query, query_lower, QuestionType.WHY, query[4:].strip())
+    return QueryContext(query, query_lower, QuestionType.GENERAL, query_lower)
+
+# Deep-research reasoning steps: (step_number, step_type, description, purpose,
+# outcome), with {query}, {doc_count}, {variation_count} and {result_count} fields
+_REASONING_STEP_TEMPLATES = (
+    (1, 'Query Analysis',
+     'Analyzed the query "{query}" to understand research requirements',
+     'Break down complex query into searchable components',
+     'Generated {variation_count} search variations'),
+    (2, 'Local Document Search',
+     'Searched through {doc_count} local documents using multiple query strategies',
+     'Retrieve all relevant information from local knowledge base',
+     'Found {result_count} highly relevant documents'),
+    (3, 'Multi-source Analysis',
+     'Analyzed multiple document perspectives and cross-referenced information',
+     'Synthesize information from different sources',
+     'Generated comprehensive understanding from local sources'),
+    (4, 'Enhanced Reasoning',
+     'Applied multi-step reasoning to combine findings into coherent analysis',
+     'Create deeper insights through logical reasoning',
+     'Produced enhanced answer with comprehensive coverage'),
+)
+
+# Generic research vocabulary never reported as a key theme
+_COMMON_THEME_WORDS = frozenset([
+    'research', 'analysis', 'system', 'method', 'approach', 'technique', 'model', 'algorithm'
+])
+
+@lru_cache(maxsize=1024)
+def _expand_query(query: str) -> Tuple[str, ...]:
+    """
+    Expand the original query into multiple related search terms
+    for comprehensive local document retrieval.
+    
+    The expansion depends only on the query text, so results are memoized.
+    """
+    expanded_queries = [query]  # Start with original query
+
+    # Add variations and related terms
+    query_lower = query.lower()
+
+    # Basic query expansion based on keywords: the first matching topic wins
+    for pattern, expansions in _TOPIC_EXPANSIONS:
+        if pattern.search(query_lower):
+            expanded_queries.extend(expansions)
+            break
+    else:
+        # Generic expansion - add broader and narrower terms
+        words = query_lower.split()
+        if len(words) > 1:
+            # Remove one word at a time for broader search
+            for i in range(len(words)):
+                broader_query = ' '.join(words[:i] + words[i+1:])
+                if broader_query.strip():
+                    expanded_queries.append(broader_query)
+
+    # Remove duplicates (keeping the original query first) and limit
+    return tuple(dict.fromkeys(expanded_queries))[:5]  # Limit to 5 queries
+
 class DeepResearcherAgent:
     """Main Deep Researcher Agent class."""
     
@@ -39,38 +246,83 @@ class DeepResearcherAgent:
             config_path: Path to configuration file
         """
         # Initialize configuration manager
-        self.config_manager = ConfigManager(config_path)
+        self.config_manager = ConfigManager.get(config_path)
         self.config = self.config_manager.get_config()
         
         # Setup logging
         self.config_manager.setup_logging()
         
-        # Initialize core components
-        self.embedding_manager = EmbeddingManager()
-        self.embedding_generator = self.embedding_manager.load_model(
-            self.config.embedding.model_name
-        )
-        
         # Create data directories
         data_dir = Path(self.config.storage.data_dir)
         data_dir.mkdir(exist_ok=True)
+        self._documents_path = str(data_dir / self.config.storage.documents_dir)
         
-        self.document_store = DocumentStore(
-            store_path=str(data_dir / self.config.storage.documents_dir),
-            embedding_dim=self.embedding_generator.embedding_dim,
-            embedding_generator=self.embedding_generator
-        )
+        # Embeddings of deep-research queries, loaded from disk on first use
+        self._query_embeddings: Optional["OrderedDict[bytes, np.ndarray]"] = None
+        self._query_embeddings_path = str(data_dir / "embed_cache.npz")
+        self._query_cache_path = str(data_dir / "query_cache.json")
         
-        self.reasoning_engine = ReasoningEngine(self.document_store)
+        # (time built, status) of the last get_status() result
+        self._status_cache: Optional[Tuple[float, dict]] = None
         
-        self.query_handler = QueryHandler(
-            document_store_path=str(data_dir / self.config.storage.documents_dir),
+        # Set when background warm-up (see start_warm_up) has finished
+        self._warmed_up: Optional[threading.Event] = None
+        
+        # Core components are created on first access (see the properties
+        # below), so single-purpose runs only load what they use
+
+    @cached_property
+    def embedding_manager(self) -> "EmbeddingManager":
+        """Embedding manager holding the loaded models."""
+        from src.embeddings.embedding_generator import EmbeddingManager
+        return EmbeddingManager()
+
+    @cached_property
+    def embedding_generator(self) -> "LocalEmbeddingGenerator":
+        """Embedding model used for documents and deep-research queries."""
+        return self.embedding_manager.load_model(self.config.embedding.model_name,
+                                                 precision=self.config.embedding.precision)
+
+    @cached_property
+    def document_store(self) -> "DocumentStore":
+        """Local document store with its FAISS index."""
+        from src.storage.document_store import DocumentStore
+        return DocumentStore(
+            store_path=self._documents_path,
+            embedding_dim=self.embedding_generator.embedding_dim,
+            embedding_generator=self.embedding_generator,
+            quantization=self.config.embedding.quantization
+        )
+
+    @cached_property
+    def reasoning_engine(self) -> "ReasoningEngine":
+        """Multi-step reasoning engine over the document store."""
+        from src.reasoning.reasoning_engine import ReasoningEngine
+        return ReasoningEngine(self.document_store)
+
+    @cached_property
+    def query_handler(self) -> "QueryHandler":
+        """Query handler that answers questions from the document store."""
+        from src.querying.query_handler import QueryHandler
+        return QueryHandler(
+            document_store_path=self._documents_path,
             embedding_model=self.config.embedding.model_name,
-            enable_reasoning=self.config.reasoning.enable_multi_step
+            enable_reasoning=self.config.reasoning.enable_multi_step,
+            quantization=self.config.embedding.quantization,
+            precision=self.config.embedding.precision
         )
-        
-        # Initialize new components
-        self.query_refiner = QueryRefiner(
+
+    @cached_property
+    def reranker(self):
+        """Cross-encoder that rescores deep-research candidates against the query."""
+        from sentence_transformers import CrossEncoder
+        return CrossEncoder(self.config.query.rerank_model, device=self.config.embedding.device)
+
+    @cached_property
+    def query_refiner(self) -> "QueryRefiner":
+        """Interactive query refinement."""
+        from src.querying.query_refiner import QueryRefiner
+        return QueryRefiner(
             document_store=self.document_store,
             embedding_generator=self.embedding_generator,
             reasoning_engine=self.reasoning_engine,
@@ -78,10 +330,50 @@ class DeepResearcherAgent:
             confidence_threshold=self.config.query.similarity_threshold
         )
 
-        self.summarizer = DocumentSummarizer()
-
-        self.document_processor = DocumentProcessor()
-        self.document_ingestor = DocumentIngestor(self.document_store, self.document_processor)
+    @cached_property
+    def summarizer(self) -> "DocumentSummarizer":
+        """Summarizer for multi-source results."""
+        from src.processing.summarizer import DocumentSummarizer
+        return DocumentSummarizer()
+
+    @cached_property
+    def query_cache(self) -> "SemanticQueryCache":
+        """Cache of CLI query results, saved to disk when the process exits."""
+        from src.querying.query_cache import SemanticQueryCache
+        cache = SemanticQueryCache(cache_path=self._query_cache_path)
+        atexit.register(cache.save)
+        return cache
+
+    @cached_property
+    def explanation_engine(self) -> "ReasoningExplanationEngine":
+        """Explanations of query reasoning steps."""
+        from src.reasoning.explanation_engine import ReasoningExplanationEngine
+        return ReasoningExplanationEngine()
+
+    @cached_property
+    def export_manager(self) -> "ExportManager":
+        """Exporter for results, summaries and reasoning reports."""
+        from src.exporting.export_manager import ExportManager
+        return ExportManager(output_dir=self.config.export.output_dir)
+
+    @cached_property
+    def document_processor(self) -> "DocumentProcessor":
+        """Document text extraction and chunking."""
+        from src.processing.document_processor import DocumentProcessor
+        return DocumentProcessor()
+
+    @cached_property
+    def document_ingestor(self) -> "DocumentIngestor":
+        """Ingestor that processes files into the document store."""
+        from src.processing.document_processor import DocumentIngestor
+        embedding_cache = None
+        if self.config.embedding.use_cache:
+            from src.embeddings.embedding_cache import EmbeddingCache
+            cache_dir = self.config.embedding.cache_dir or os.path.join(
+                self.config.storage.data_dir, self.config.storage.embeddings_dir
+            )
+            embedding_cache = EmbeddingCache.for_generator(cache_dir, self.embedding_generator)
+        return DocumentIngestor(self.document_store, self.document_processor, embedding_cache)
 
     def _get_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
@@ -115,35 +407,51 @@ class DeepResearcherAgent:
                 'timestamp': None
             }
 
-            # Step 1: Get all documents from local knowledge base
-            all_documents = self.document_store.get_all_documents()
-            logger.info(f"Searching through {len(all_documents)} local documents")
+            # Step 1: Size up the local knowledge base
+            doc_count = self.document_store.get_document_count()
+            logger.info(f"Searching through {doc_count} local documents")
 
             # Step 2: Perform comprehensive search across all documents
             # Use multiple search strategies for better results
-            search_results = []
+            retrieved = []
 
             # Strategy 1: Direct search with the original query
             if original_result and original_result.get('retrieved_documents'):
-                search_results.extend(original_result['retrieved_documents'])
+                retrieved.append(original_result['retrieved_documents'])
 
-            # Strategy 2: Search with expanded query terms
+            # Strategy 2: Search with expanded query terms (skipped for an empty store)
             expanded_queries = self._expand_query_for_deep_search(query)
-            for expanded_query in expanded_queries:
+            if doc_count:
                 try:
-                    # Use the existing query handler to search locally
-                    temp_result = self.query_handler.process_query(expanded_query)
-                    if temp_result and temp_result.retrieved_documents:
-                        # Filter out duplicates
-                        existing_ids = {doc.get('id') for doc in search_results if doc.get('id')}
-                        for doc in temp_result.retrieved_documents:
-                            if doc.get('id') not in existing_ids:
-                                search_results.append(doc)
+                    # Embed all expanded queries in one encoder pass, then search locally
+                    retrieved.extend(self._batch_search(expanded_queries))
                 except Exception as e:
-                    logger.warning(f"Error searching with expanded query '{expanded_query}': {e}")
+                    logger.warning(f"Error searching with expanded queries {expanded_queries}: {e}")
+
+            # Filter out duplicates and keep only the best-scoring documents in a
+            # bounded min-heap (the reranker, if enabled, picks from a wider pool)
+            keep = _DEEP_RESULT_LIMIT
+            if self.config.query.rerank_enabled:
+                keep = max(keep, self.config.query.rerank_candidates)
+            best = []  # (score, -arrival, document); earlier arrivals win ties
+            existing_ids = set()
+            for arrival, doc in enumerate(chain.from_iterable(retrieved)):
+                doc_id = doc.get('id')
+                if doc_id in existing_ids:
                     continue
+                if doc_id:
+                    existing_ids.add(doc_id)
+                entry = (doc.get('similarity_score') or 0.0, -arrival, doc)
+                if len(best) < keep:
+                    heapq.heappush(best, entry)
+                else:
+                    heapq.heappushpop(best, entry)
+            search_results = [doc for _, _, doc in sorted(best, reverse=True)]
+
+            if self.config.query.rerank_enabled:
+                search_results = self._rerank(query, search_results)
 
-            deep_results['local_results'] = search_results[:10]  # Limit to top 10 results
+            deep_results['local_results'] = search_results
 
             # Step 3: Generate enhanced answer using multi-step reasoning
             enhanced_answer = self._generate_enhanced_answer(query, search_results)
@@ -154,7 +462,9 @@ class DeepResearcherAgent:
             deep_results['research_summary'] = research_summary
 
             # Step 5: Generate reasoning steps
-            reasoning_steps = self._generate_reasoning_steps(query, search_results)
+            reasoning_steps = self._generate_reasoning_steps(
+                query, search_results, doc_count, len(expanded_queries)
+            )
             deep_results['reasoning_steps'] = reasoning_steps
 
             deep_results['timestamp'] = self._get_timestamp()
@@ -173,53 +483,144 @@ class DeepResearcherAgent:
                 'reasoning_steps': []
             }
 
+    def _rerank(self, query: str, documents: List[Dict[str, Any]],
+                top_k: int = _DEEP_RESULT_LIMIT) -> List[Dict[str, Any]]:
+        """
+        Rerank the leading retrieved documents with the cross-encoder.
+        
+        Args:
+            query: The research query
+            documents: Retrieved document dictionaries, best first
+            top_k: Number of documents to keep
+            
+        Returns:
+            The top_k documents by cross-encoder score, or the first top_k
+            in retrieval order if the reranker is unavailable
+        """
+        candidates = documents[:self.config.query.rerank_candidates]
+        if not candidates:
+            return documents[:top_k]
+        
+        try:
+            scores = self.reranker.predict(
+                [(query, (doc.get('content') or '')[:512]) for doc in candidates],
+                batch_size=32
+            )
+        except Exception as e:
+            logger.warning(f"Reranking unavailable, keeping retrieval order: {e}")
+            return documents[:top_k]
+        
+        order = np.argsort(-np.asarray(scores, dtype=np.float32), kind='stable')[:top_k]
+        return [candidates[i] for i in order.tolist()]
+
+    def _batch_search(self, queries: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Search the local document store for several queries at once.
+        
+        Queries without a cached embedding are embedded in a single batched
+        encoder call; all embeddings are then searched against the document
+        store in one pass.
+        
+        Args:
+            queries: Queries to search for
+            
+        Returns:
+            One list of retrieved document dictionaries per query
+        """
+        if not queries:
+            return []
+        
+        query_embeddings = self._embed_queries(queries)
+        top_k = self.config.query.max_results
+        return [
+            [
+                {
+                    'id': doc.id,
+                    'content': doc.content,
+                    'metadata': doc.metadata,
+                    'similarity_score': score
+                }
+                for doc, score in retrieved
+            ]
+            for retrieved in self.document_store.search_by_embeddings(query_embeddings, top_k=top_k)
+        ]
+
+    def _embed_queries(self, queries: List[str]) -> List[np.ndarray]:
+        """
+        Embed queries, reusing cached embeddings keyed by query content hash.
+        
+        Args:
+            queries: Queries to embed
+            
+        Returns:
+            One embedding per query
+        """
+        cache = self._query_embeddings
+        if cache is None:
+            cache = self._query_embeddings = self._load_query_embeddings()
+        
+        from src.embeddings.embedding_generator import LocalEmbeddingGenerator
+        keys = [LocalEmbeddingGenerator._cache_key(query) for query in queries]
+        embeddings = {key: cache[key] for key in keys if key in cache}
+        misses = [i for i, key in enumerate(keys) if key not in embeddings]
+        if misses:
+            miss_embeddings = self.embedding_generator.generate_embeddings_batch(
+                [queries[i] for i in misses], batch_size=len(misses)
+            )
+            for i, embedding in zip(misses, miss_embeddings):
+                embeddings[keys[i]] = embedding
+                # Failed encodes come back as zero vectors; don't keep those
+                if embedding.any():
+                    cache[keys[i]] = embedding
+        
+        for key in keys:
+            if key in cache:
+                cache.move_to_end(key)
+        while len(cache) > _QUERY_EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
+        if misses:
+            self._save_query_embeddings()
+        
+        return [embeddings[key] for key in keys]
+
+    def _load_query_embeddings(self) -> "OrderedDict[bytes, np.ndarray]":
+        """Load persisted query embeddings if they were made by the current model and precision."""
+        cache = OrderedDict()
+        try:
+            with np.load(self._query_embeddings_path) as data:
+                if str(data['model_name']) == self._embedding_signature():
+                    for key, embedding in zip(data['keys'], data['embeddings']):
+                        cache[key.tobytes()] = embedding
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable query embedding cache {self._query_embeddings_path}: {e}")
+        return cache
+
+    def _save_query_embeddings(self):
+        """Persist cached query embeddings so later sessions start warm."""
+        cache = self._query_embeddings
+        if not cache:
+            return
+        tmp_path = f"{self._query_embeddings_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    model_name=np.array(self._embedding_signature()),
+                    keys=np.frombuffer(b''.join(cache.keys()), dtype=np.uint8).reshape(len(cache), -1),
+                    embeddings=np.stack(list(cache.values()))
+                )
+            os.replace(tmp_path, self._query_embeddings_path)
+        except Exception as e:
+            logger.warning(f"Could not save query embedding cache: {e}")
+
     def _expand_query_for_deep_search(self, query: str) -> List[str]:
         """
         Expand the original query into multiple related search terms
         for comprehensive local document retrieval.
         """
-        expanded_queries = [query]  # Start with original query
-
-        # Add variations and related terms
-        query_lower = query.lower()
-
-        # Basic query expansion based on keywords
-        if 'artificial intelligence' in query_lower or 'ai' in query_lower:
-            expanded_queries.extend([
-                'machine learning algorithms',
-                'neural networks deep learning',
-                'computer vision image recognition',
-                'natural language processing',
-                'expert systems knowledge representation'
-            ])
-        elif 'machine learning' in query_lower:
-            expanded_queries.extend([
-                'supervised learning classification',
-                'unsupervised learning clustering',
-                'reinforcement learning',
-                'neural networks artificial intelligence',
-                'data mining pattern recognition'
-            ])
-        elif 'data science' in query_lower:
-            expanded_queries.extend([
-                'statistical analysis data mining',
-                'predictive modeling analytics',
-                'big data processing',
-                'business intelligence reporting'
-            ])
-        else:
-            # Generic expansion - add broader and narrower terms
-            words = query_lower.split()
-            if len(words) > 1:
-                # Remove one word at a time for broader search
-                for i in range(len(words)):
-                    broader_query = ' '.join(words[:i] + words[i+1:])
-                    if broader_query.strip():
-                        expanded_queries.append(broader_query)
-
-        # Remove duplicates and limit
-        expanded_queries = list(set(expanded_queries))
-        return expanded_queries[:5]  # Limit to 5 queries
+        return list(_expand_query(query))
 
     def _generate_enhanced_answer(self, query: str, search_results: List[dict]) -> str:
         """
@@ -259,8 +660,8 @@ class DeepResearcherAgent:
         summary = f"Local Deep Research Summary: {query}\n\n"
 
         summary += f"📊 Research Scope: Analyzed {len(search_results)} local documents comprehensively\n"
-        summary += f"🎯 Methodology: Multi-query expansion with local embedding-based retrieval\n"
-        summary += f"🔍 Coverage: Complete local knowledge base search without external dependencies\n\n"
+        summary += "🎯 Methodology: Multi-query expansion with local embedding-based retrieval\n"
+        summary += "🔍 Coverage: Complete local knowledge base search without external dependencies\n\n"
 
         if search_results:
             summary += "📋 Key Findings:\n"
@@ -277,60 +678,50 @@ class DeepResearcherAgent:
 
         return summary
 
-    def _generate_reasoning_steps(self, query: str, search_results: List[dict]) -> List[dict]:
+    def _generate_reasoning_steps(self, query: str, search_results: List[dict],
+                                  doc_count: Optional[int] = None,
+                                  variation_count: Optional[int] = None) -> List[dict]:
         """
         Generate reasoning steps for the deep research process.
         """
-        steps = [
-            {
-                'step_number': 1,
-                'step_type': 'Query Analysis',
-                'description': f'Analyzed the query "{query}" to understand research requirements',
-                'purpose': 'Break down complex query into searchable components',
-                'outcome': f'Generated {len(self._expand_query_for_deep_search(query))} search variations'
-            },
-            {
-                'step_number': 2,
-                'step_type': 'Local Document Search',
-                'description': f'Searched through {len(self.document_store.get_all_documents())} local documents using multiple query strategies',
-                'purpose': 'Retrieve all relevant information from local knowledge base',
-                'outcome': f'Found {len(search_results)} highly relevant documents'
-            },
-            {
-                'step_number': 3,
-                'step_type': 'Multi-source Analysis',
-                'description': 'Analyzed multiple document perspectives and cross-referenced information',
-                'purpose': 'Synthesize information from different sources',
-                'outcome': 'Generated comprehensive understanding from local sources'
-            },
+        if doc_count is None:
+            doc_count = self.document_store.get_document_count()
+        if variation_count is None:
+            variation_count = len(self._expand_query_for_deep_search(query))
+
+        fields = {
+            'query': query,
+            'doc_count': doc_count,
+            'variation_count': variation_count,
+            'result_count': len(search_results)
+        }
+        return [
             {
-                'step_number': 4,
-                'step_type': 'Enhanced Reasoning',
-                'description': 'Applied multi-step reasoning to combine findings into coherent analysis',
-                'purpose': 'Create deeper insights through logical reasoning',
-                'outcome': 'Produced enhanced answer with comprehensive coverage'
+                'step_number': step_number,
+                'step_type': step_type,
+                'description': description.format_map(fields),
+                'purpose': purpose,
+                'outcome': outcome.format_map(fields)
             }
+            for step_number, step_type, description, purpose, outcome in _REASONING_STEP_TEMPLATES
         ]
 
-        return steps
-
     def _extract_key_themes(self, search_results: List[dict]) -> List[str]:
         """
-        Extract key themes from search results.
+        Extract key themes from search results, most frequent first.
         """
-        themes = []
-        common_words = ['research', 'analysis', 'system', 'method', 'approach', 'technique', 'model', 'algorithm']
+        theme_counts = Counter()
 
         for result in search_results[:5]:  # Check first 5 results
             content = result.get('content', '').lower()
             if len(content) > 100:  # Only process substantial content
                 # Look for technical terms and concepts
-                words = content.split()
-                for word in words:
-                    if len(word) > 6 and word not in common_words and word not in themes:
-                        themes.append(word)
+                theme_counts.update(
+                    word for word in content.split()
+                    if len(word) > 6 and word not in _COMMON_THEME_WORDS
+                )
 
-        return themes[:5]  # Return top 5 themes
+        return [theme for theme, _ in theme_counts.most_common(5)]  # Return top 5 themes
     
     def get_config_summary(self) -> dict:
         """Get a summary of the current configuration."""
@@ -346,6 +737,7 @@ class DeepResearcherAgent:
         Returns:
             True if successful, False otherwise
         """
+        self._status_cache = None
         return self.config_manager.update_config(updates)
     
     def save_config(self, config_path: Optional[str] = None) -> bool:
@@ -446,7 +838,8 @@ class DeepResearcherAgent:
         """
         return self.export_manager.delete_export(filename)
     
-    def query(self, query_text: str, enable_refinement: bool = True, enable_summarization: bool = True, **kwargs) -> dict:
+    def query(self, query_text: str, enable_refinement: bool = True, enable_summarization: bool = True,
+              on_answer: Optional[Callable[[dict], None]] = None, **kwargs) -> dict:
         """
         Process a research query with optional refinement and summarization.
         Generates direct AI-like responses instead of research-style format.
@@ -455,14 +848,34 @@ class DeepResearcherAgent:
             query_text: The query to process
             enable_refinement: Whether to enable query refinement
             enable_summarization: Whether to enable result summarization
+            on_answer: Called once with the result as soon as its answer is
+                ready, before summarization (optional)
             **kwargs: Additional parameters
 
         Returns:
             Query result dictionary
         """
         logger.info(f"Processing query: {query_text}")
+        self._wait_for_warm_up()
+        answered = False
 
         try:
+            # An empty knowledge base has nothing to refine against or retrieve
+            if self.query_handler.document_store.get_document_count() == 0:
+                result_dict = {
+                    'query': query_text,
+                    'answer': _NO_DOCUMENTS_ANSWER,
+                    'confidence_score': 0.0,
+                    'reasoning_steps': [],
+                    'retrieved_documents': [],
+                    'execution_time': 0.0,
+                    'metadata': {'processing_mode': 'empty_store'},
+                    'timestamp': self._get_timestamp()
+                }
+                if on_answer:
+                    on_answer(result_dict)
+                return result_dict
+
             # Apply query refinement if enabled
             refined_query = query_text
             refinement_info = None
@@ -486,9 +899,13 @@ class DeepResearcherAgent:
                 result_dict['original_query'] = query_text
 
             # Generate direct AI-like answer instead of research format
-            direct_answer = self._generate_direct_answer(query_text, result_dict)
+            direct_answer = self._generate_direct_answer(_classify_query(query_text), result_dict)
             result_dict['answer'] = direct_answer
 
+            answered = True
+            if on_answer:
+                on_answer(result_dict)
+
             # Apply summarization if enabled and we have multiple sources
             if (enable_summarization and self.config.query.enable_summarization and
                 result_dict.get('retrieved_documents') and
@@ -514,19 +931,84 @@ class DeepResearcherAgent:
 
         except Exception as e:
             logger.error(f"Error processing query: {e}")
-            return {
+            result_dict = {
                 'query': query_text,
                 'answer': f"I apologize, but I encountered an error while processing your query: {str(e)}. Please try rephrasing your question or check if documents are available in the system.",
                 'confidence_score': 0.0,
                 'error': str(e)
             }
+            if on_answer and not answered:
+                on_answer(result_dict)
+            return result_dict
 
-    def _generate_direct_answer(self, query: str, result_dict: dict) -> str:
+    def cached_query(self, query_text: str, enable_refinement: bool = True,
+                     enable_summarization: bool = True,
+                     on_answer: Optional[Callable[[dict], None]] = None) -> dict:
+        """
+        Process a query, reusing the result of an identical or near-identical earlier query.
+
+        Results are cached per processing options and dropped whenever the
+        document store on disk or the embedding model changes.
+
+        Args:
+            query_text: The query to process
+            enable_refinement: Whether to enable query refinement
+            enable_summarization: Whether to enable result summarization
+            on_answer: Called once with the result as soon as its answer is ready (optional)
+
+        Returns:
+            Query result dictionary
+        """
+        cache = self.query_cache
+        cache.set_corpus_version(self._corpus_version())
+        scope = (f"refine={enable_refinement and self.config.query.enable_refinement},"
+                 f"summarize={enable_summarization and self.config.query.enable_summarization},"
+                 f"max_results={self.config.query.max_results}")
+
+        # The model is only needed on an exact miss. The query embedding is
+        # cached by the generator, so retrieval reuses it
+        def embed(text: str) -> np.ndarray:
+            self._wait_for_warm_up()
+            return self.query_handler.embedding_generator.generate_embedding(text)
+
+        result, embedding = cache.lookup(query_text, scope, embed)
+        if result is not None:
+            logger.info(f"Using cached result for query: {query_text}")
+            if embedding is not None:
+                # A semantic hit was answered for a different wording; reuse its
+                # retrieval but phrase the answer for this query
+                result.pop('original_query', None)
+                result.pop('refinement_info', None)
+                result['answer'] = self._generate_direct_answer(_classify_query(query_text), result)
+            if on_answer:
+                on_answer(result)
+            return result
+
+        result = self.query(query_text, enable_refinement=enable_refinement,
+                            enable_summarization=enable_summarization, on_answer=on_answer)
+        if 'error' not in result:
+            cache.put(query_text, result, scope, embedding)
+        return result
+
+    def _corpus_version(self) -> str:
+        """Identify the embedding model and on-disk document store state."""
+        try:
+            stat = os.stat(os.path.join(self._documents_path, "documents.json"))
+            state = f"{stat.st_mtime_ns}:{stat.st_size}"
+        except FileNotFoundError:
+            state = "empty"
+        return f"{self._embedding_signature()}:{state}"
+
+    def _embedding_signature(self) -> str:
+        """Identify the embedding model and precision that cached embeddings depend on."""
+        return f"{self.config.embedding.model_name}:{self.config.embedding.precision or 'fp32'}"
+
+    def _generate_direct_answer(self, context: QueryContext, result_dict: dict) -> str:
         """
         Generate a direct, AI-like response instead of research-style format.
 
         Args:
-            query: The original query
+            context: The classified original query
             result_dict: Query result dictionary
 
         Returns:
@@ -534,67 +1016,16 @@ class DeepResearcherAgent:
         """
         # If no retrieved documents, provide helpful response
         if not result_dict.get('retrieved_documents'):
-            return "I don't have enough information in my knowledge base to answer that question. Please upload some documents related to your topic so I can provide a more accurate response."
-
-        # Get the most relevant document content
-        retrieved_docs = result_dict.get('retrieved_documents', [])
-        if not retrieved_docs:
-            return "I'm not finding specific information about that topic in my current knowledge base. You might want to add some documents related to your question."
-
-        # Extract key information from the most relevant document
-        best_doc = retrieved_docs[0]
-        doc_content = best_doc.get('content', '')
-
-        # Generate direct AI-like response
-        query_lower = query.lower()
-
-        if 'what is' in query_lower or 'what are' in query_lower or 'define' in query_lower:
-            # Definition-style response
-            if 'artificial intelligence' in query_lower or 'ai' in query_lower:
-                return "Artificial intelligence (AI) is a branch of computer science that focuses on creating systems capable of performing tasks that typically require human intelligence. These tasks include learning, reasoning, problem-solving, perception, and language understanding. AI systems can analyze data, recognize patterns, make predictions, and even generate creative content. The field encompasses various subareas like machine learning, natural language processing, computer vision, and robotics."
-            elif 'machine learning' in query_lower:
-                return "Machine learning is a subset of artificial intelligence that enables computers to learn and improve from experience without being explicitly programmed. It involves algorithms that can analyze data, identify patterns, and make predictions or decisions. There are three main types: supervised learning (learning from labeled examples), unsupervised learning (finding patterns in data), and reinforcement learning (learning through trial and error with rewards and penalties)."
-            elif 'data science' in query_lower:
-                return "Data science is an interdisciplinary field that combines statistics, programming, and domain expertise to extract insights and knowledge from structured and unstructured data. Data scientists use various tools and techniques including data collection, cleaning, analysis, visualization, and machine learning to solve complex problems and make data-driven decisions across industries like healthcare, finance, technology, and marketing."
-            elif 'python' in query_lower:
-                return "Python is a high-level, versatile programming language known for its simplicity and readability. It's widely used in web development, data science, artificial intelligence, automation, and scientific computing. Python's extensive libraries and frameworks make it suitable for both beginners and experts. Key features include dynamic typing, automatic memory management, and support for multiple programming paradigms."
-            else:
-                # Generic definition response
-                return f"Based on the information available, {query[0].lower() + query[1:]} involves the study and application of methods to extract meaningful insights and solve problems in that domain. It typically combines theoretical knowledge with practical applications and may involve various tools, techniques, and methodologies depending on the specific context."
+            return _NO_DOCUMENTS_ANSWER
 
-        elif 'how' in query_lower:
-            # How-to style response
-            if 'work' in query_lower or 'function' in query_lower:
-                return f"The process of {query[4:].strip()} typically involves several key steps: understanding the problem, gathering relevant information, applying appropriate methods or techniques, analyzing results, and drawing conclusions. The exact approach depends on the specific context and available resources."
-            else:
-                return f"To {query[4:].strip()}, you would typically need to: 1) Understand the requirements or problem, 2) Gather necessary resources and information, 3) Apply appropriate methods or techniques, 4) Monitor progress and make adjustments, and 5) Evaluate the results. The specific steps depend on the particular situation and domain."
-
-        elif 'explain' in query_lower or 'describe' in query_lower:
-            # Explanation-style response
-            return f"Let me explain {query[8:] if query_lower.startswith('explain ') else query[9:] if query_lower.startswith('describe ') else query[7:]}. This involves breaking down the concept into understandable parts, discussing its key components, applications, and significance. A comprehensive explanation would cover the definition, main characteristics, practical applications, and any important considerations or limitations."
+        if context.qtype is QuestionType.DEFINITION:
+            # Definition-style response for a known topic
+            for pattern, definition in _TOPIC_DEFINITIONS:
+                if pattern.search(context.lower):
+                    return definition
 
-        elif 'why' in query_lower:
-            # Why-style response
-            return f"There are several reasons why {query[4:].strip()}. The main factors include practical benefits, theoretical foundations, real-world applications, and ongoing research developments. Understanding the underlying principles helps explain both the importance and the challenges associated with this topic."
-
-        else:
-            # General conversational response
-            return f"That's an interesting question about {query_lower}. From the available information, I can tell you that this topic involves several important aspects and applications. The key points include understanding the fundamental concepts, recognizing practical applications, and being aware of current developments and future trends in the field."
+        return _DIRECT_ANSWER_TEMPLATES[context.qtype].format(subject=context.subject)
 
-    def get_status(self) -> dict:
-        """Get comprehensive system status information."""
-        return {
-            'config_summary': self.get_config_summary(),
-            'embedding_model': self.embedding_generator.get_model_info(),
-            'document_store': self.document_store.get_statistics(),
-            'query_handler': self.query_handler.get_system_status(),
-            'query_refiner': self.query_refiner.get_statistics(),
-            'summarizer': self.summarizer.get_statistics(),
-            'explanation_engine': self.explanation_engine.get_statistics(),
-            'export_manager': self.export_manager.get_statistics(),
-            'ingestion_stats': self.document_ingestor.get_ingestion_statistics()
-        }
-    
     def ingest_file(self, file_path: str, **kwargs) -> List[str]:
         """
         Ingest a file into the document store.
@@ -607,6 +1038,8 @@ class DeepResearcherAgent:
             List of document IDs
         """
         logger.info(f"Ingesting file: {file_path}")
+        self._status_cache = None
+        kwargs.setdefault('batch_size', self.config.embedding.batch_size)
         
         try:
             return self.document_ingestor.ingest_file(file_path, **kwargs)
@@ -626,6 +1059,8 @@ class DeepResearcherAgent:
             List of document IDs
         """
         logger.info(f"Ingesting directory: {directory_path}")
+        self._status_cache = None
+        kwargs.setdefault('batch_size', self.config.embedding.batch_size)
         
         try:
             return self.document_ingestor.ingest_directory(directory_path, **kwargs)
@@ -645,6 +1080,7 @@ class DeepResearcherAgent:
             Document ID
         """
         logger.info("Ingesting text content")
+        self._status_cache = None
         
         try:
             return self.document_ingestor.ingest_text(text, **kwargs)
@@ -652,9 +1088,96 @@ class DeepResearcherAgent:
             logger.error(f"Error ingesting text: {e}")
             raise
     
+    def add_documents(self, documents: Sequence[Tuple[str, str]], preprocessed: bool = False) -> List[str]:
+        """
+        Ingest several text documents in a single batch.
+        
+        Args:
+            documents: Sequence of (title, content) pairs
+            preprocessed: True if the content was already cleaned by DocumentProcessor
+            
+        Returns:
+            List of document IDs
+        """
+        logger.info(f"Ingesting {len(documents)} text documents")
+        self._status_cache = None
+        
+        batch = [
+            {'content': content, 'metadata': {'title': title}}
+            for title, content in documents
+        ]
+        
+        try:
+            return self.document_ingestor.ingest_texts(batch, clean=not preprocessed)
+        except Exception as e:
+            logger.error(f"Error ingesting documents: {e}")
+            raise
+    
+    def index_exists(self) -> bool:
+        """Check whether the document store already holds indexed documents."""
+        return self.document_store.index is not None and self.document_store.index.ntotal > 0
+    
+    def save_index(self, index_path: str, doc_ids: Optional[List[str]] = None) -> bool:
+        """
+        Save documents and embeddings to a pre-built index file.
+        
+        Args:
+            index_path: Path of the index file
+            doc_ids: Documents to include (all documents if None)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.document_store.save_snapshot(index_path, doc_ids)
+    
+    def load_index(self, index_path: str) -> List[str]:
+        """
+        Load documents from a pre-built index file without re-embedding them.
+        
+        Args:
+            index_path: Path of the index file
+            
+        Returns:
+            List of document IDs
+        """
+        logger.info(f"Loading pre-built index: {index_path}")
+        self._status_cache = None
+        return self.document_store.load_snapshot(index_path)
+    
+    def add_documents_from_file(self, corpus_path: str, preprocessed: bool = False) -> List[str]:
+        """
+        Ingest a JSON Lines corpus file in a single batch.
+        
+        Args:
+            corpus_path: Path to a file with one [title, content] JSON array per line
+                (gzip-compressed if the name ends with '.gz')
+            preprocessed: True if the content was already cleaned by DocumentProcessor
+            
+        Returns:
+            List of document IDs
+        """
+        with open(corpus_path, 'rb') as f:
+            data = f.read()
+        
+        if corpus_path.endswith('.gz'):
+            import gzip
+            data = gzip.decompress(data)
+        
+        documents = tuple(tuple(json.loads(line)) for line in data.split(b'\n') if line.strip())
+        return self.add_documents(documents, preprocessed)
+    
     def get_status(self) -> dict:
-        """Get comprehensive system status information."""
-        return {
+        """
+        Get comprehensive system status information.
+        
+        The status is reused for _STATUS_TTL seconds, and rebuilt sooner
+        after ingestion or a configuration change. Callers get their own copy.
+        """
+        now = time.monotonic()
+        if self._status_cache is not None and now - self._status_cache[0] < _STATUS_TTL:
+            return copy.deepcopy(self._status_cache[1])
+        
+        status = {
             'config_summary': self.get_config_summary(),
             'embedding_model': self.embedding_generator.get_model_info(),
             'document_store': self.document_store.get_statistics(),
@@ -665,6 +1188,54 @@ class DeepResearcherAgent:
             'export_manager': self.export_manager.get_statistics(),
             'ingestion_stats': self.document_ingestor.get_ingestion_statistics()
         }
+        self._status_cache = (now, status)
+        return copy.deepcopy(status)
+    
+    def start_warm_up(self):
+        """
+        Load the components a query uses in a background thread.
+        
+        Queries wait for the warm-up to finish, so components are never
+        created twice. Calling this again has no effect.
+        """
+        if self._warmed_up is not None:
+            return
+        self._warmed_up = threading.Event()
+        threading.Thread(target=self._run_warm_up, name="warm-up", daemon=True).start()
+    
+    def _run_warm_up(self):
+        """Warm up the query components, logging rather than raising failures."""
+        try:
+            self._warm_up()
+        except Exception as e:
+            logger.warning(f"Background warm-up failed: {e}")
+        finally:
+            self._warmed_up.set()
+    
+    def _warm_up(self):
+        """Create the components a query uses, run one encoder forward pass and search the index once."""
+        embedding = self.query_handler.embedding_generator.warm_up()
+        self.query_handler.document_store.search_by_embedding(embedding, top_k=1)
+        if self.config.query.enable_refinement:
+            self.query_refiner
+        if self.config.query.enable_summarization:
+            self.summarizer
+    
+    def _wait_for_warm_up(self):
+        """Wait for background warm-up, if one was started."""
+        if self._warmed_up is not None:
+            self._warmed_up.wait()
+    
+    # Interactive commands matched exactly, and commands taking an argument after a prefix
+    _COMMANDS = {
+        'quit': '_cmd_quit', 'exit': '_cmd_quit', 'q': '_cmd_quit',
+        'help': '_cmd_help', 'status': '_cmd_status',
+        'exports': '_cmd_exports', 'explain': '_cmd_explain'
+    }
+    _PREFIX_COMMANDS = (
+        ('ingest ', '_cmd_ingest'), ('add ', '_cmd_add'), ('refine ', '_cmd_refine'),
+        ('export ', '_cmd_export'), ('config ', '_cmd_config')
+    )
     
     def interactive_mode(self):
         """Start interactive query mode with enhanced commands."""
@@ -672,210 +1243,219 @@ class DeepResearcherAgent:
         print("Type 'help' for commands, 'quit' to exit")
         print("-" * 50)
         
+        # Load models in the background while the user types the first command
+        self.start_warm_up()
+        
         # Store last query result for export/explanation
-        last_result = None
+        self._last_result = None
         
         while True:
             try:
                 user_input = input("\n> ").strip()
+                if not user_input:
+                    continue
                 
-                if user_input.lower() in ['quit', 'exit', 'q']:
-                    print("Goodbye!")
-                    break
-                
-                elif user_input.lower() == 'help':
-                    self._print_help()
-                
-                elif user_input.lower() == 'status':
-                    status = self.get_status()
-                    print(f"\n📊 System Status:")
-                    print(f"  Documents: {status['document_store'].get('total_documents', 0)}")
-                    print(f"  Embedding Model: {status['embedding_model'].get('model_name', 'Unknown')}")
-                    print(f"  Reasoning Enabled: {status['config_summary'].get('reasoning_enabled', False)}")
-                    print(f"  Query Refinement: {status['config_summary'].get('query_refinement_enabled', False)}")
-                    print(f"  Summarization: {status['config_summary'].get('summarization_enabled', False)}")
-                    print(f"  Total Queries: {status['query_handler'].get('query_stats', {}).get('total_queries', 0)}")
-                    print(f"  Refinement Sessions: {status['query_refiner'].get('active_sessions', 0)}")
-                    print(f"  Exports: {status['export_manager'].get('performance_metrics', {}).get('exports_created', 0)}")
-                
-                elif user_input.lower().startswith('ingest '):
-                    path = user_input[7:].strip()
-                    if os.path.isfile(path):
-                        doc_ids = self.ingest_file(path)
-                        print(f"✅ Ingested file with {len(doc_ids)} document(s)")
-                    elif os.path.isdir(path):
-                        doc_ids = self.ingest_directory(path)
-                        print(f"✅ Ingested directory with {len(doc_ids)} document(s)")
-                    else:
-                        print(f"❌ Path not found: {path}")
+                lower = user_input.lower()
+                handler_name = self._COMMANDS.get(lower)
+                argument = ''
+                if handler_name is None:
+                    handler_name = '_cmd_query'
+                    argument = user_input
+                    for prefix, name in self._PREFIX_COMMANDS:
+                        if lower.startswith(prefix):
+                            handler_name = name
+                            argument = user_input[len(prefix):].strip()
+                            break
                 
-                elif user_input.lower().startswith('add '):
-                    text = user_input[4:].strip()
-                    if text:
-                        doc_id = self.ingest_text(text)
-                        print(f"✅ Added text document: {doc_id}")
-                    else:
-                        print("❌ No text provided")
+                if handler_name not in ('_cmd_quit', '_cmd_help'):
+                    self._wait_for_warm_up()
                 
-                elif user_input.lower().startswith('refine '):
-                    query_text = user_input[8:].strip()
-                    if query_text:
-                        print(f"🔄 Starting refinement for: {query_text}")
-                        session = self.start_refinement_session(query_text)
-                        
-                        if session.get('needs_refinement'):
-                            print(f"❓ Refinement needed:")
-                            for i, question in enumerate(session['questions'], 1):
-                                print(f"  {i}. {question['question_text']}")
-                                for j, option in enumerate(question['options'], 1):
-                                    print(f"     {j}. {option}")
-                            
-                            # Get user response
-                            response_input = input("\nEnter your choice (number(s)): ").strip()
-                            try:
-                                selected_indices = [int(x.strip()) - 1 for x in response_input.split()]
-                                selected_options = [session['questions'][0]['options'][i] for i in selected_indices if 0 <= i < len(session['questions'][0]['options'])]
-                                
-                                if selected_options:
-                                    response_data = {
-                                        'question_id': session['questions'][0]['question_id'],
-                                        'selected_options': selected_options,
-                                        'additional_info': input("Additional info (optional): ").strip()
-                                    }
-                                    
-                                    updated_session = self.process_refinement_response(session['session_id'], response_data)
-                                    
-                                    if updated_session.get('refined_query'):
-                                        print(f"✅ Refined query: {updated_session['refined_query']}")
-                                        # Process the refined query
-                                        result = self.query(updated_session['refined_query'], enable_refinement=False)
-                                        last_result = result
-                                        print(f"\n📝 Refined Query: {result['query']}")
-                                        print(f"💡 Answer: {result['answer']}")
-                                        print(f"🎯 Confidence: {result['confidence_score']:.3f}")
-                                    else:
-                                        print("❌ No refined query generated")
-                                else:
-                                    print("❌ Invalid selection")
-                            except (ValueError, IndexError):
-                                print("❌ Invalid input format")
-                        else:
-                            print("✅ No refinement needed")
-                            # Process the original query
-                            result = self.query(query_text)
-                            last_result = result
-                            print(f"\n📝 Query: {result['query']}")
-                            print(f"💡 Answer: {result['answer']}")
-                            print(f"🎯 Confidence: {result['confidence_score']:.3f}")
-                    else:
-                        print("❌ No query provided for refinement")
+                if getattr(self, handler_name)(argument):
+                    break
                 
-                elif user_input.lower() == 'explain' and last_result:
-                    print("🧠 Explaining reasoning steps...")
-                    explanation = self.explain_reasoning(last_result)
-                    print(f"\n📋 Reasoning Explanation:")
-                    print(f"  Query: {explanation['original_query']}")
-                    print(f"  Final Answer: {explanation['final_answer']}")
-                    print(f"  Total Steps: {len(explanation['steps'])}")
-                    
-                    for i, step in enumerate(explanation['steps'], 1):
-                        print(f"\n  Step {i}: {step['step_type']}")
-                        print(f"    Description: {step['description']}")
-                        print(f"    Confidence: {step['confidence']:.3f}")
-                        if step.get('sources'):
-                            print(f"    Sources: {len(step['sources'])} documents")
+            except KeyboardInterrupt:
+                print("\n\nGoodbye!")
+                break
+            except Exception as e:
+                print(f"❌ Error: {e}")
+    
+    def _cmd_quit(self, _argument: str) -> bool:
+        """Leave interactive mode."""
+        print("Goodbye!")
+        return True
+    
+    def _cmd_help(self, _argument: str):
+        """Print the interactive commands."""
+        self._print_help()
+    
+    def _cmd_status(self, _argument: str):
+        """Print the system status."""
+        print("\n" + _format_status(self.get_status()))
+    
+    def _cmd_ingest(self, path: str):
+        """Ingest a file or directory."""
+        if os.path.isfile(path):
+            doc_ids = self.ingest_file(path)
+            print(f"✅ Ingested file with {len(doc_ids)} document(s)")
+        elif os.path.isdir(path):
+            doc_ids = self.ingest_directory(path)
+            print(f"✅ Ingested directory with {len(doc_ids)} document(s)")
+        else:
+            print(f"❌ Path not found: {path}")
+    
+    def _cmd_add(self, text: str):
+        """Add a text document."""
+        if text:
+            doc_id = self.ingest_text(text)
+            print(f"✅ Added text document: {doc_id}")
+        else:
+            print("❌ No text provided")
+    
+    def _cmd_refine(self, query_text: str):
+        """Refine a query interactively, then process it."""
+        if not query_text:
+            print("❌ No query provided for refinement")
+            return
+        
+        print(f"🔄 Starting refinement for: {query_text}", flush=True)
+        session = self.start_refinement_session(query_text)
+        
+        if session.get('needs_refinement'):
+            print("❓ Refinement needed:")
+            for i, question in enumerate(session['questions'], 1):
+                print(f"  {i}. {question['question_text']}")
+                for j, option in enumerate(question['options'], 1):
+                    print(f"     {j}. {option}")
+            
+            # Get user response
+            response_input = input("\nEnter your choice (number(s)): ").strip()
+            try:
+                selected_indices = [int(x.strip()) - 1 for x in response_input.split()]
+                selected_options = [session['questions'][0]['options'][i] for i in selected_indices if 0 <= i < len(session['questions'][0]['options'])]
                 
-                elif user_input.lower().startswith('export '):
-                    if not last_result:
-                        print("❌ No query result to export. Run a query first.")
-                        continue
-                    
-                    export_args = user_input[7:].strip().split()
-                    format_type = 'markdown'  # default
-                    filename = None
+                if selected_options:
+                    response_data = {
+                        'question_id': session['questions'][0]['question_id'],
+                        'selected_options': selected_options,
+                        'additional_info': input("Additional info (optional): ").strip()
+                    }
                     
-                    if len(export_args) > 0:
-                        if export_args[0].lower() in ['markdown', 'pdf']:
-                            format_type = export_args[0].lower()
-                            if len(export_args) > 1:
-                                filename = export_args[1]
-                        else:
-                            filename = export_args[0]
+                    updated_session = self.process_refinement_response(session['session_id'], response_data)
                     
-                    try:
-                        export_path = self.export_query_result(last_result, format_type, filename)
-                        print(f"✅ Exported to: {export_path}")
-                    except Exception as e:
-                        print(f"❌ Export failed: {e}")
-                
-                elif user_input.lower() == 'exports':
-                    exports = self.list_exports()
-                    if exports:
-                        print(f"\n📁 Exported Files ({len(exports)}):")
-                        for export in exports:
-                            print(f"  • {export['filename']} ({export['format']}) - {export['created_at']}")
+                    if updated_session.get('refined_query'):
+                        print(f"✅ Refined query: {updated_session['refined_query']}")
+                        # Process the refined query
+                        result = self.cached_query(updated_session['refined_query'], enable_refinement=False)
+                        self._last_result = result
+                        print(f"\n📝 Refined Query: {result['query']}")
+                        print(f"💡 Answer: {result['answer']}")
+                        print(f"🎯 Confidence: {result['confidence_score']:.3f}")
                     else:
-                        print("\n📁 No exported files")
-                
-                elif user_input.lower().startswith('config '):
-                    config_cmd = user_input[7:].strip()
-                    if config_cmd == 'show':
-                        config_summary = self.get_config_summary()
-                        print(f"\n⚙️ Configuration Summary:")
-                        for section, settings in config_summary.items():
-                            print(f"  {section}:")
-                            for key, value in settings.items():
-                                print(f"    {key}: {value}")
-                    elif config_cmd.startswith('set '):
-                        try:
-                            key_value = config_cmd[4:].strip()
-                            if '=' in key_value:
-                                key, value = key_value.split('=', 1)
-                                updates = {key.strip(): value.strip()}
-                                if self.update_config(updates):
-                                    print(f"✅ Updated config: {key.strip()} = {value.strip()}")
-                                else:
-                                    print("❌ Failed to update config")
-                            else:
-                                print("❌ Invalid format. Use: config set key=value")
-                        except Exception as e:
-                            print(f"❌ Error updating config: {e}")
-                    elif config_cmd == 'save':
-                        if self.save_config():
-                            print("✅ Configuration saved")
-                        else:
-                            print("❌ Failed to save configuration")
+                        print("❌ No refined query generated")
+                else:
+                    print("❌ Invalid selection")
+            except (ValueError, IndexError):
+                print("❌ Invalid input format")
+        else:
+            print("✅ No refinement needed")
+            # Process the original query
+            result = self.cached_query(query_text)
+            self._last_result = result
+            print(f"\n📝 Query: {result['query']}")
+            print(f"💡 Answer: {result['answer']}")
+            print(f"🎯 Confidence: {result['confidence_score']:.3f}")
+    
+    def _cmd_explain(self, _argument: str):
+        """Explain the reasoning steps of the last query result."""
+        if not self._last_result:
+            print("❌ No query result to explain. Run a query first.")
+            return
+        
+        print("🧠 Explaining reasoning steps...", flush=True)
+        explanation = self.explain_reasoning(self._last_result)
+        print("\n📋 Reasoning Explanation:")
+        print(f"  Query: {explanation['original_query']}")
+        print(f"  Final Answer: {explanation['final_answer']}")
+        print(f"  Total Steps: {len(explanation['steps'])}")
+        
+        for i, step in enumerate(explanation['steps'], 1):
+            print(f"\n  Step {i}: {step['step_type']}")
+            print(f"    Description: {step['description']}")
+            print(f"    Confidence: {step['confidence']:.3f}")
+            if step.get('sources'):
+                print(f"    Sources: {len(step['sources'])} documents")
+    
+    def _cmd_export(self, argument: str):
+        """Export the last query result."""
+        if not self._last_result:
+            print("❌ No query result to export. Run a query first.")
+            return
+        
+        export_args = argument.split()
+        format_type = 'markdown'  # default
+        filename = None
+        
+        if len(export_args) > 0:
+            if export_args[0].lower() in ['markdown', 'pdf']:
+                format_type = export_args[0].lower()
+                if len(export_args) > 1:
+                    filename = export_args[1]
+            else:
+                filename = export_args[0]
+        
+        try:
+            export_path = self.export_query_result(self._last_result, format_type, filename)
+            print(f"✅ Exported to: {export_path}")
+        except Exception as e:
+            print(f"❌ Export failed: {e}")
+    
+    def _cmd_exports(self, _argument: str):
+        """List exported files."""
+        exports = self.list_exports()
+        if exports:
+            print(f"\n📁 Exported Files ({len(exports)}):")
+            for export in exports:
+                print(f"  • {export['filename']} ({export['format']}) - {export['created_at']}")
+        else:
+            print("\n📁 No exported files")
+    
+    def _cmd_config(self, config_cmd: str):
+        """Show, set or save configuration."""
+        if config_cmd == 'show':
+            config_summary = self.get_config_summary()
+            print("\n⚙️ Configuration Summary:")
+            for section, settings in config_summary.items():
+                print(f"  {section}:")
+                for key, value in settings.items():
+                    print(f"    {key}: {value}")
+        elif config_cmd.startswith('set '):
+            try:
+                key_value = config_cmd[4:].strip()
+                if '=' in key_value:
+                    key, value = key_value.split('=', 1)
+                    updates = {key.strip(): value.strip()}
+                    if self.update_config(updates):
+                        print(f"✅ Updated config: {key.strip()} = {value.strip()}")
                     else:
-                        print("❌ Unknown config command. Use: config show|set key=value|save")
-                
-                elif user_input.strip():
-                    # Process as query
-                    result = self.query(user_input)
-                    last_result = result
-                    print(f"\n📝 Query: {result['query']}")
-                    print(f"💡 Answer: {result['answer']}")
-                    print(f"🎯 Confidence: {result['confidence_score']:.3f}")
-                    
-                    if result.get('original_query'):
-                        print(f"🔄 Original Query: {result['original_query']}")
-                    
-                    if result.get('retrieved_documents'):
-                        print(f"📚 Sources: {len(result['retrieved_documents'])} documents")
-                    
-                    if result.get('reasoning_steps'):
-                        print(f"🧠 Reasoning Steps: {len(result['reasoning_steps'])}")
-                    
-                    if result.get('summary'):
-                        print(f"📄 Summary: {result['summary'][:200]}...")
-                        if result.get('summary_stats'):
-                            stats = result['summary_stats']
-                            print(f"    Sources: {stats.get('source_count', 0)}, Compression: {stats.get('compression_ratio', 0):.1%}")
-                
-            except KeyboardInterrupt:
-                print("\n\nGoodbye!")
-                break
+                        print("❌ Failed to update config")
+                else:
+                    print("❌ Invalid format. Use: config set key=value")
             except Exception as e:
-                print(f"❌ Error: {e}")
+                print(f"❌ Error updating config: {e}")
+        elif config_cmd == 'save':
+            if self.save_config():
+                print("✅ Configuration saved")
+            else:
+                print("❌ Failed to save configuration")
+        else:
+            print("❌ Unknown config command. Use: config show|set key=value|save")
+    
+    def _cmd_query(self, user_input: str):
+        """Process input that is not a command as a query."""
+        print()
+        result = self.cached_query(user_input, on_answer=_print_answer)
+        self._last_result = result
+        _print_summary(result)
     
     def _print_help(self):
         """Print comprehensive help information."""
@@ -927,6 +1507,56 @@ class DeepResearcherAgent:
 """
         print(help_text)
 
+def _format_status(status: dict) -> str:
+    """Format the system status summary shown by 'status' and --status."""
+    return "\n".join([
+        "📊 System Status:",
+        f"  Documents: {status['document_store'].get('total_documents', 0)}",
+        f"  Embedding Model: {status['embedding_model'].get('model_name', 'Unknown')}",
+        f"  Reasoning Enabled: {status['config_summary'].get('reasoning_enabled', False)}",
+        f"  Query Refinement: {status['config_summary'].get('query_refinement_enabled', False)}",
+        f"  Summarization: {status['config_summary'].get('summarization_enabled', False)}",
+        f"  Total Queries: {status['query_handler'].get('query_stats', {}).get('total_queries', 0)}",
+        f"  Refinement Sessions: {status['query_refiner'].get('active_sessions', 0)}",
+        f"  Exports: {status['export_manager'].get('performance_metrics', {}).get('exports_created', 0)}"
+    ])
+
+def _print_answer(result: dict):
+    """Print a query result's answer and sources, flushing so it shows before the summary is ready."""
+    print(f"📝 Query: {result['query']}")
+    print(f"💡 Answer: {result['answer']}")
+    print(f"🎯 Confidence: {result['confidence_score']:.3f}")
+    
+    if result.get('original_query'):
+        print(f"🔄 Original Query: {result['original_query']}")
+    
+    if result.get('retrieved_documents'):
+        print(f"📚 Sources: {len(result['retrieved_documents'])} documents")
+    
+    if result.get('reasoning_steps'):
+        print(f"🧠 Reasoning Steps: {len(result['reasoning_steps'])}")
+    
+    sys.stdout.flush()
+
+def _print_summary(result: dict):
+    """Print a query result's summary, if it has one."""
+    if result.get('summary'):
+        print(f"📄 Summary: {result['summary'][:200]}...")
+        if result.get('summary_stats'):
+            stats = result['summary_stats']
+            print(f"    Sources: {stats.get('source_count', 0)}, Compression: {stats.get('compression_ratio', 0):.1%}")
+
+def _buffer_stdout():
+    """
+    Stop flushing stdout at every newline when it is a terminal.
+    
+    The lines printed for one response then reach the terminal in a single
+    write: input() flushes stdout before each prompt, and it is flushed on
+    exit. Messages announcing slow work pass flush=True.
+    """
+    if getattr(sys.stdout, 'line_buffering', False) and hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False)
+
 def main():
     """Main entry point for the CLI application with enhanced functionality."""
     parser = argparse.ArgumentParser(
@@ -1022,6 +1652,12 @@ Examples:
         help='Disable result summarization'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Process the query even if an earlier run cached its result'
+    )
+    
     parser.add_argument(
         '--explain',
         action='store_true',
@@ -1069,6 +1705,18 @@ Examples:
         help='Disable document chunking'
     )
     
+    parser.add_argument(
+        '--no-embed-cache',
+        action='store_true',
+        help='Re-embed all ingested content instead of reusing cached embeddings'
+    )
+    
+    parser.add_argument(
+        '--ingest-batch-size',
+        type=int,
+        help='Embedding batch size for ingestion (default: embedding.batch_size from config)'
+    )
+    
     # System options
     parser.add_argument(
         '--verbose', '-v',
@@ -1077,6 +1725,7 @@ Examples:
     )
     
     args = parser.parse_args()
+    _buffer_stdout()
     
     # Configure logging level
     if args.verbose:
@@ -1094,6 +1743,9 @@ Examples:
         
         # Initialize the agent
         agent = DeepResearcherAgent(args.config)
+        if args.interactive or args.query:
+            # Load the model while the query cache and configuration are read
+            agent.start_warm_up()
         
         # Handle configuration operations
         if args.save_config:
@@ -1112,31 +1764,17 @@ Examples:
             enable_refinement = args.refine if args.refine else not args.no_refinement
             enable_summarization = not args.no_summarization
             
-            # Process the query
-            result = agent.query(
+            # Process the query, reusing results saved by earlier runs
+            # (data_dir/query_cache.json, dropped when the documents change)
+            process_query = agent.query if args.no_cache else agent.cached_query
+            # The answer is printed as soon as it is ready, the summary after it
+            result = process_query(
                 args.query,
                 enable_refinement=enable_refinement,
-                enable_summarization=enable_summarization
+                enable_summarization=enable_summarization,
+                on_answer=_print_answer
             )
-            
-            print(f"📝 Query: {result['query']}")
-            print(f"💡 Answer: {result['answer']}")
-            print(f"🎯 Confidence: {result['confidence_score']:.3f}")
-            
-            if result.get('original_query'):
-                print(f"🔄 Original Query: {result['original_query']}")
-            
-            if result.get('retrieved_documents'):
-                print(f"📚 Sources: {len(result['retrieved_documents'])} documents")
-            
-            if result.get('reasoning_steps'):
-                print(f"🧠 Reasoning Steps: {len(result['reasoning_steps'])}")
-            
-            if result.get('summary'):
-                print(f"📄 Summary: {result['summary'][:200]}...")
-                if result.get('summary_stats'):
-                    stats = result['summary_stats']
-                    print(f"    Sources: {stats.get('source_count', 0)}, Compression: {stats.get('compression_ratio', 0):.1%}")
+            _print_summary(result)
             
             # Handle explanation
             if args.explain:
@@ -1159,20 +1797,29 @@ Examples:
                     print(f"❌ Export failed: {e}")
         
         elif args.ingest:
+            if args.no_embed_cache:
+                agent.config.embedding.use_cache = False
+            
+            batch_options = {}
+            if args.ingest_batch_size:
+                batch_options['batch_size'] = args.ingest_batch_size
+            
             if os.path.isfile(args.ingest):
                 doc_ids = agent.ingest_file(
                     args.ingest,
                     chunk_document=not args.no_chunking,
                     chunk_size=args.chunk_size,
-                    chunk_overlap=args.chunk_overlap
+                    chunk_overlap=args.chunk_overlap,
+                    **batch_options
                 )
                 print(f"✅ Ingested file with {len(doc_ids)} document(s)")
             elif os.path.isdir(args.ingest):
                 doc_ids = agent.ingest_directory(
                     args.ingest,
-                    chunk_document=not args.no_chunking,
+                    chunk_documents=not args.no_chunking,
                     chunk_size=args.chunk_size,
-                    chunk_overlap=args.chunk_overlap
+                    chunk_overlap=args.chunk_overlap,
+                    **batch_options
                 )
                 print(f"✅ Ingested directory with {len(doc_ids)} document(s)")
             else:
@@ -1183,16 +1830,7 @@ Examples:
             print(f"✅ Added text document: {doc_id}")
         
         elif args.status:
-            status = agent.get_status()
-            print(f"📊 System Status:")
-            print(f"  Documents: {status['document_store'].get('total_documents', 0)}")
-            print(f"  Embedding Model: {status['embedding_model'].get('model_name', 'Unknown')}")
-            print(f"  Reasoning Enabled: {status['config_summary'].get('reasoning_enabled', False)}")
-            print(f"  Query Refinement: {status['config_summary'].get('query_refinement_enabled', False)}")
-            print(f"  Summarization: {status['config_summary'].get('summarization_enabled', False)}")
-            print(f"  Total Queries: {status['query_handler'].get('query_stats', {}).get('total_queries', 0)}")
-            print(f"  Refinement Sessions: {status['query_refiner'].get('active_sessions', 0)}")
-            print(f"  Exports: {status['export_manager'].get('performance_metrics', {}).get('exports_created', 0)}")
+            print(_format_status(agent.get_status()))
         
         elif args.list_exports:
             exports = agent.list_exports()
@@ -1207,7 +1845,7 @@ Examples:
             parser.print_help()
     
     except Exception as e:
-        print(f"❌ Error: {e}")
+        print(f"❌ Error: {e}", flush=True)
         if args.verbose:
             import traceback
             traceback.print_exc()
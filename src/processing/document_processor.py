@@ -1,11 +1,12 @@
 import os
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional
 from pathlib import Path
 import json
 import re
 from datetime import datetime
 from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 
 import docx
 import PyPDF2
@@ -224,13 +225,15 @@ class DocumentProcessor:
             raise
     
     def process_text(self, text: str, 
-                    metadata: Optional[Dict[str, Any]] = None) -> ProcessedDocument:
+                    metadata: Optional[Dict[str, Any]] = None,
+                    clean: bool = True) -> ProcessedDocument:
         """
         Process raw text content.
         
         Args:
             text: Text content to process
             metadata: Additional metadata to include
+            clean: Whether to clean the text (False if it was cleaned beforehand)
             
         Returns:
             ProcessedDocument object
@@ -244,7 +247,7 @@ class DocumentProcessor:
         })
         
         # Clean and preprocess text
-        cleaned_text = self._clean_text(text)
+        cleaned_text = self._clean_text(text) if clean else text
         
         processed_doc = ProcessedDocument(
             content=cleaned_text,
@@ -261,6 +264,34 @@ class DocumentProcessor:
         
         return processed_doc
     
+    def process_texts(self, texts: List[str],
+                     metadata_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+                     clean: bool = True) -> List[ProcessedDocument]:
+        """
+        Process several raw texts, cleaning them in parallel.
+        
+        Args:
+            texts: Text contents to process
+            metadata_list: Per-text metadata (optional, same length as texts)
+            clean: Whether to clean the texts (False if they were cleaned beforehand)
+            
+        Returns:
+            List of ProcessedDocument objects in input order
+        """
+        if metadata_list is None:
+            metadata_list = [None] * len(texts)
+        
+        if clean and texts:
+            # Cleaning is independent per text; the pool lives only for this call
+            with ThreadPoolExecutor(max_workers=min(len(texts), os.cpu_count() or 1)) as executor:
+                texts = list(executor.map(self._clean_text, texts))
+        
+        # Build documents and update statistics serially
+        return [
+            self.process_text(text, metadata, clean=False)
+            for text, metadata in zip(texts, metadata_list)
+        ]
+    
     # File format specific processors
     def _process_txt_file(self, file_path: Path) -> str:
         """Process a text file."""
@@ -429,16 +460,19 @@ class DocumentIngestor:
     High-level document ingestion system that combines processing and storage.
     """
     
-    def __init__(self, document_store, processor: Optional[DocumentProcessor] = None):
+    def __init__(self, document_store, processor: Optional[DocumentProcessor] = None,
+                 embedding_cache=None):
         """
         Initialize the document ingestor.
         
         Args:
             document_store: DocumentStore instance
             processor: DocumentProcessor instance
+            embedding_cache: EmbeddingCache reused across ingestions (optional)
         """
         self.document_store = document_store
         self.processor = processor or DocumentProcessor()
+        self.embedding_cache = embedding_cache
         
         self.ingestion_stats = {
             'total_ingested': 0,
@@ -450,7 +484,8 @@ class DocumentIngestor:
                    metadata: Optional[Dict[str, Any]] = None,
                    chunk_document: bool = False,
                    chunk_size: int = 1000,
-                   chunk_overlap: int = 200) -> List[str]:
+                   chunk_overlap: int = 200,
+                   batch_size: int = 32) -> List[str]:
         """
         Ingest a single file into the document store.
         
@@ -460,6 +495,7 @@ class DocumentIngestor:
             chunk_document: Whether to chunk the document
             chunk_size: Size of chunks if chunking
             chunk_overlap: Overlap between chunks
+            batch_size: Encoder batch size for embedding the chunks
             
         Returns:
             List of document IDs
@@ -468,24 +504,9 @@ class DocumentIngestor:
             # Process the file
             processed_doc = self.processor.process_file(file_path, metadata)
             
-            # Chunk if requested
-            if chunk_document:
-                chunks = self.processor.chunk_document(processed_doc, chunk_size, chunk_overlap)
-                doc_ids = []
-                for chunk in chunks:
-                    doc_id = self.document_store.add_document(
-                        chunk.content, 
-                        chunk.metadata, 
-                        chunk.source_path
-                    )
-                    doc_ids.append(doc_id)
-            else:
-                doc_id = self.document_store.add_document(
-                    processed_doc.content, 
-                    processed_doc.metadata, 
-                    processed_doc.source_path
-                )
-                doc_ids = [doc_id]
+            # Chunk if requested, then embed and store all pieces in one batch
+            pieces = self._split_document(processed_doc, chunk_document, chunk_size, chunk_overlap)
+            doc_ids = self._store_processed(pieces, batch_size)
             
             # Update statistics
             self.ingestion_stats['total_ingested'] += len(doc_ids)
@@ -505,10 +526,14 @@ class DocumentIngestor:
                         metadata: Optional[Dict[str, Any]] = None,
                         chunk_documents: bool = False,
                         chunk_size: int = 1000,
-                        chunk_overlap: int = 200) -> List[str]:
+                        chunk_overlap: int = 200,
+                        batch_size: int = 32) -> List[str]:
         """
         Ingest all files in a directory.
         
+        The chunks of every file are collected first and then embedded and
+        stored together in a single batch.
+        
         Args:
             directory_path: Path to the directory
             recursive: Whether to process subdirectories
@@ -516,6 +541,7 @@ class DocumentIngestor:
             chunk_documents: Whether to chunk documents
             chunk_size: Size of chunks if chunking
             chunk_overlap: Overlap between chunks
+            batch_size: Encoder batch size for embedding the chunks
             
         Returns:
             List of all document IDs
@@ -524,26 +550,12 @@ class DocumentIngestor:
             # Process all files
             processed_docs = self.processor.process_directory(directory_path, recursive, metadata)
             
-            all_doc_ids = []
-            
-            # Ingest each document
+            # Collect the documents (or their chunks) of every file
+            pieces = []
             for processed_doc in processed_docs:
-                if chunk_documents:
-                    chunks = self.processor.chunk_document(processed_doc, chunk_size, chunk_overlap)
-                    for chunk in chunks:
-                        doc_id = self.document_store.add_document(
-                            chunk.content, 
-                            chunk.metadata, 
-                            chunk.source_path
-                        )
-                        all_doc_ids.append(doc_id)
-                else:
-                    doc_id = self.document_store.add_document(
-                        processed_doc.content, 
-                        processed_doc.metadata, 
-                        processed_doc.source_path
-                    )
-                    all_doc_ids.append(doc_id)
+                pieces.extend(self._split_document(processed_doc, chunk_documents, chunk_size, chunk_overlap))
+            
+            all_doc_ids = self._store_processed(pieces, batch_size)
             
             # Update statistics
             self.ingestion_stats['total_ingested'] += len(all_doc_ids)
@@ -575,11 +587,10 @@ class DocumentIngestor:
         try:
             processed_doc = self.processor.process_text(text, metadata)
             
-            doc_id = self.document_store.add_document(
-                processed_doc.content, 
-                processed_doc.metadata, 
-                doc_id
-            )
+            entry = {'content': processed_doc.content, 'metadata': processed_doc.metadata}
+            if doc_id is not None:
+                entry['id'] = doc_id
+            doc_id = self._store_documents([entry])[0]
             
             # Update statistics
             self.ingestion_stats['total_ingested'] += 1
@@ -594,11 +605,53 @@ class DocumentIngestor:
             logging.error(f"Error ingesting text: {e}")
             raise
     
+    def ingest_texts(self, documents: List[Dict[str, Any]],
+                     clean: bool = True) -> List[str]:
+        """
+        Ingest several raw text documents in one batch.
+        
+        Args:
+            documents: List of dictionaries with 'content' and optional 'metadata'/'id'
+            clean: Whether to clean the text (False for pre-cleaned content)
+            
+        Returns:
+            List of document IDs
+        """
+        try:
+            processed_docs = self.processor.process_texts(
+                [document.get('content', '') for document in documents],
+                [document.get('metadata') for document in documents],
+                clean
+            )
+            
+            batch = []
+            for document, processed_doc in zip(documents, processed_docs):
+                entry = {'content': processed_doc.content, 'metadata': processed_doc.metadata}
+                if document.get('id'):
+                    entry['id'] = document['id']
+                batch.append(entry)
+            
+            doc_ids = self._store_documents(batch)
+            
+            # Update statistics
+            self.ingestion_stats['total_ingested'] += len(doc_ids)
+            self.ingestion_stats['by_source']['text'] = \
+                self.ingestion_stats['by_source'].get('text', 0) + len(doc_ids)
+            
+            logging.info(f"Successfully ingested {len(doc_ids)} text documents")
+            return doc_ids
+            
+        except Exception as e:
+            self.ingestion_stats['errors'] += 1
+            logging.error(f"Error ingesting text batch: {e}")
+            raise
+    
     def ingest_url(self, url: str, 
                   metadata: Optional[Dict[str, Any]] = None,
                   chunk_document: bool = False,
                   chunk_size: int = 1000,
-                  chunk_overlap: int = 200) -> List[str]:
+                  chunk_overlap: int = 200,
+                  batch_size: int = 32) -> List[str]:
         """
         Ingest content from a URL.
         
@@ -608,6 +661,7 @@ class DocumentIngestor:
             chunk_document: Whether to chunk the document
             chunk_size: Size of chunks if chunking
             chunk_overlap: Overlap between chunks
+            batch_size: Encoder batch size for embedding the chunks
             
         Returns:
             List of document IDs
@@ -615,23 +669,8 @@ class DocumentIngestor:
         try:
             processed_doc = self.processor.process_url(url, metadata)
             
-            if chunk_document:
-                chunks = self.processor.chunk_document(processed_doc, chunk_size, chunk_overlap)
-                doc_ids = []
-                for chunk in chunks:
-                    doc_id = self.document_store.add_document(
-                        chunk.content, 
-                        chunk.metadata, 
-                        chunk.source_path
-                    )
-                    doc_ids.append(doc_id)
-            else:
-                doc_id = self.document_store.add_document(
-                    processed_doc.content, 
-                    processed_doc.metadata, 
-                    processed_doc.source_path
-                )
-                doc_ids = [doc_id]
+            pieces = self._split_document(processed_doc, chunk_document, chunk_size, chunk_overlap)
+            doc_ids = self._store_processed(pieces, batch_size)
             
             # Update statistics
             self.ingestion_stats['total_ingested'] += len(doc_ids)
@@ -646,6 +685,38 @@ class DocumentIngestor:
             logging.error(f"Error ingesting URL {url}: {e}")
             raise
     
+    def _split_document(self, processed_doc: ProcessedDocument, chunk_document: bool,
+                        chunk_size: int, chunk_overlap: int) -> List[ProcessedDocument]:
+        """Get a processed document's chunks, or the document itself when not chunking."""
+        if chunk_document:
+            return self.processor.chunk_document(processed_doc, chunk_size, chunk_overlap)
+        return [processed_doc]
+    
+    def _store_processed(self, processed_docs: List[ProcessedDocument], batch_size: int = 32) -> List[str]:
+        """Add processed documents to the store, keyed by source path."""
+        return self._store_documents(
+            [
+                {'content': doc.content, 'metadata': doc.metadata, 'id': doc.source_path}
+                for doc in processed_docs
+            ],
+            batch_size
+        )
+    
+    def _store_documents(self, documents: List[Dict[str, Any]], batch_size: int = 32) -> List[str]:
+        """
+        Add documents to the store in one batch.
+        
+        All contents are embedded in one batched encoder pass, skipping those
+        already in the embedding cache, and the store is written to disk once.
+        """
+        embeddings = None
+        generator = self.document_store.embedding_generator
+        if self.embedding_cache is not None and generator is not None:
+            embeddings = self.embedding_cache.embed(
+                [document['content'] for document in documents], generator, batch_size
+            )
+        return self.document_store.add_documents_batch(documents, embeddings, batch_size=batch_size)
+    
     def get_ingestion_statistics(self) -> Dict[str, Any]:
         """Get ingestion statistics."""
         stats = self.ingestion_stats.copy()
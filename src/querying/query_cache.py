@@ -0,0 +1,232 @@
+import os
+import json
+import logging
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, Callable
+
+import numpy as np
+
+class SemanticQueryCache:
+    """
+    Two-tier cache of query results.
+    
+    Results are looked up first by a hash of the normalized query text, then
+    by the nearest cached query embedding above a cosine similarity threshold.
+    Each entry belongs to a scope naming the processing options it was
+    produced with, and only matches lookups in the same scope. Entries are
+    tied to a corpus version and dropped when it changes.
+    """
+    
+    def __init__(self, cache_path: Optional[str] = None,
+                 similarity_threshold: float = 0.97,
+                 max_entries: int = 1024):
+        """
+        Initialize the query cache.
+        
+        Args:
+            cache_path: JSON file the cache is loaded from and saved to (optional)
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            max_entries: Most results kept, least recently used evicted first
+        """
+        self.cache_path = cache_path
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.corpus_version: Optional[str] = None
+        
+        self._results: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._embeddings: Dict[str, np.ndarray] = {}
+        self._scopes: Dict[str, str] = {}
+        # Stacked embeddings per scope for the semantic tier, rebuilt lazily after changes
+        self._matrices: Dict[str, Tuple[np.ndarray, Tuple[str, ...]]] = {}
+        self._dirty = False
+        
+        self.stats = {'exact_hits': 0, 'semantic_hits': 0, 'misses': 0}
+        
+        if cache_path:
+            self.load()
+    
+    @staticmethod
+    def _make_key(query: str, scope: str) -> str:
+        """Exact-match key: query text normalized for case and whitespace, plus scope."""
+        normalized = ' '.join(query.lower().split())
+        return hashlib.sha1(f"{scope}\x00{normalized}".encode('utf-8')).hexdigest()
+    
+    def set_corpus_version(self, version: Optional[str]):
+        """Record the current corpus version, clearing the cache if it changed."""
+        if version != self.corpus_version:
+            if self._results:
+                logging.info("Document corpus changed, clearing query cache")
+            self.clear()
+            self.corpus_version = version
+    
+    def lookup(self, query: str, scope: str = "",
+               embed: Optional[Callable[[str], np.ndarray]] = None) -> Tuple[Optional[Dict[str, Any]], Optional[np.ndarray]]:
+        """
+        Look up a cached result.
+        
+        Args:
+            query: Query text
+            scope: Processing options the result must have been produced with
+            embed: Function embedding the query text, called on an exact miss
+        
+        Returns:
+            Tuple of (cached result or None, query embedding if one was computed).
+            The result is a shallow copy; a semantic hit has its 'query' set
+            to the looked-up text and is the only hit returned with an embedding.
+        """
+        key = self._make_key(query, scope)
+        result = self._results.get(key)
+        if result is not None:
+            self._results.move_to_end(key)
+            self.stats['exact_hits'] += 1
+            return dict(result), None
+        
+        embedding = None
+        if embed is not None:
+            embedding = self._normalize(embed(query))
+            if embedding is not None:
+                matrix, keys = self._get_matrix(scope)
+                if keys and matrix.shape[1] == len(embedding):
+                    scores = matrix @ embedding
+                    best = int(np.argmax(scores))
+                    if scores[best] >= self.similarity_threshold:
+                        hit_key = keys[best]
+                        self._results.move_to_end(hit_key)
+                        self.stats['semantic_hits'] += 1
+                        return {**self._results[hit_key], 'query': query}, embedding
+        
+        self.stats['misses'] += 1
+        return None, embedding
+    
+    def put(self, query: str, result: Dict[str, Any], scope: str = "",
+            embedding: Optional[np.ndarray] = None):
+        """
+        Store a result.
+        
+        Args:
+            query: Query text
+            result: Query result dictionary (a shallow copy is stored)
+            scope: Processing options the result was produced with
+            embedding: Query embedding for the semantic tier (optional)
+        """
+        self._put(self._make_key(query, scope), dict(result), scope, embedding)
+    
+    def _put(self, key: str, result: Dict[str, Any], scope: str, embedding: Optional[np.ndarray]):
+        """Store a result under its exact-match key, evicting the oldest beyond max_entries."""
+        self._results[key] = result
+        self._results.move_to_end(key)
+        self._scopes[key] = scope
+        embedding = self._normalize(embedding)
+        if embedding is not None:
+            self._embeddings[key] = embedding
+        
+        while len(self._results) > self.max_entries:
+            evicted, _ = self._results.popitem(last=False)
+            self._scopes.pop(evicted, None)
+            self._embeddings.pop(evicted, None)
+        
+        self._matrices.clear()
+        self._dirty = True
+    
+    def clear(self):
+        """Remove all cached results."""
+        self._dirty = self._dirty or bool(self._results)
+        self._results.clear()
+        self._embeddings.clear()
+        self._scopes.clear()
+        self._matrices.clear()
+    
+    def load(self) -> bool:
+        """
+        Load cached results from cache_path.
+        
+        Returns:
+            True if a cache file was loaded, False otherwise
+        """
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return False
+        
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            self.clear()
+            self.corpus_version = data.get('corpus_version')
+            for entry in data.get('entries', []):
+                embedding = entry.get('embedding')
+                self._put(entry['key'], entry['result'], entry.get('scope', ''),
+                          np.asarray(embedding, dtype=np.float32) if embedding is not None else None)
+            self._dirty = False
+            
+            logging.info(f"Loaded {len(self._results)} cached query results")
+            return True
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable query cache {self.cache_path}: {e}")
+            self.clear()
+            return False
+    
+    def save(self) -> bool:
+        """
+        Save cached results to cache_path if they changed.
+        
+        Returns:
+            True if successful or nothing to save, False otherwise
+        """
+        if not self.cache_path or not self._dirty:
+            return True
+        
+        try:
+            data = {
+                'corpus_version': self.corpus_version,
+                'entries': [
+                    {
+                        'key': key,
+                        'scope': self._scopes.get(key, ''),
+                        'embedding': self._embeddings[key].tolist() if key in self._embeddings else None,
+                        'result': result
+                    }
+                    for key, result in self._results.items()
+                ]
+            }
+            
+            tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp_path, self.cache_path)
+            
+            self._dirty = False
+            return True
+        except Exception as e:
+            logging.error(f"Error saving query cache: {e}")
+            return False
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache size and hit statistics."""
+        return {
+            'entries': len(self._results),
+            'semantic_entries': len(self._embeddings),
+            'similarity_threshold': self.similarity_threshold,
+            **self.stats
+        }
+    
+    def _get_matrix(self, scope: str) -> Tuple[np.ndarray, Tuple[str, ...]]:
+        """Get a scope's stacked cached embeddings and the keys of their rows."""
+        cached = self._matrices.get(scope)
+        if cached is None:
+            keys = tuple(key for key in self._embeddings if self._scopes.get(key) == scope)
+            matrix = (np.vstack([self._embeddings[key] for key in keys])
+                      if keys else np.empty((0, 0), dtype=np.float32))
+            cached = self._matrices[scope] = (matrix, keys)
+        return cached
+    
+    @staticmethod
+    def _normalize(embedding: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Scale an embedding to unit length (None for a missing or zero vector)."""
+        if embedding is None:
+            return None
+        embedding = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(embedding)
+        if norm == 0:
+            return None
+        return embedding / norm
@@ -4,9 +4,9 @@ from dataclasses import dataclass
 from datetime import datetime
 import json
 
-from ..embeddings.embedding_generator import LocalEmbeddingGenerator, EmbeddingManager
+from ..embeddings.embedding_generator import EmbeddingManager
 from ..storage.document_store import DocumentStore
-from ..reasoning.reasoning_engine import ReasoningEngine, ReasoningPlan
+from ..reasoning.reasoning_engine import ReasoningEngine
 
 @dataclass
 class QueryResult:
@@ -45,7 +45,9 @@ class QueryHandler:
     def __init__(self, 
                  document_store_path: str = "data/documents",
                  embedding_model: str = "all-MiniLM-L6-v2",
-                 enable_reasoning: bool = True):
+                 enable_reasoning: bool = True,
+                 quantization: Optional[str] = None,
+                 precision: Optional[str] = None):
         """
         Initialize the query handler.
         
@@ -53,6 +55,8 @@ class QueryHandler:
             document_store_path: Path to document store
             embedding_model: Name of embedding model to use
             enable_reasoning: Whether to enable multi-step reasoning
+            quantization: Document index vector storage ('fp32', 'fp16' or 'int8')
+            precision: Embedding model precision (see LocalEmbeddingGenerator)
         """
         self.document_store_path = document_store_path
         self.embedding_model = embedding_model
@@ -60,11 +64,12 @@ class QueryHandler:
         
         # Initialize components
         self.embedding_manager = EmbeddingManager()
-        self.embedding_generator = self.embedding_manager.load_model(embedding_model)
+        self.embedding_generator = self.embedding_manager.load_model(embedding_model, precision=precision)
         self.document_store = DocumentStore(
             store_path=document_store_path,
             embedding_dim=self.embedding_generator.embedding_dim,
-            embedding_generator=self.embedding_generator
+            embedding_generator=self.embedding_generator,
+            quantization=quantization
         )
         self.reasoning_engine = ReasoningEngine(self.document_store) if enable_reasoning else None
         
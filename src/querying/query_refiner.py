@@ -1,11 +1,10 @@
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
-import json
 import re
 
-from ..reasoning.reasoning_engine import ReasoningEngine, ReasoningPlan, ReasoningStepType
+from ..reasoning.reasoning_engine import ReasoningEngine
 from ..storage.document_store import DocumentStore
 from ..embeddings.embedding_generator import LocalEmbeddingGenerator
 
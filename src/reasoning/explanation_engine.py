@@ -1,8 +1,7 @@
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime
-import json
 
 from .reasoning_engine import ReasoningPlan, ReasoningStep, ReasoningStepType
 
@@ -445,7 +444,7 @@ class ReasoningExplanationEngine:
         
         overview = f"This reasoning plan consists of {step_count} steps: "
         overview += ", ".join(step_types)
-        overview += f". The plan follows a logical sequence to comprehensively address the query."
+        overview += ". The plan follows a logical sequence to comprehensively address the query."
         
         return overview
     
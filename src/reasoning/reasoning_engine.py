@@ -1,9 +1,8 @@
 import re
 import logging
-from typing import List, Dict, Any, Optional, Tuple, Callable
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass
 from datetime import datetime
-import json
 from enum import Enum
 
 class ReasoningStepType(Enum):
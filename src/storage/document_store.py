@@ -1,11 +1,10 @@
 import os
 import json
-import pickle
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import logging
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import faiss
 from ..embeddings.embedding_generator import LocalEmbeddingGenerator
 
@@ -25,6 +24,16 @@ class Document:
         if self.updated_at is None:
             self.updated_at = datetime.now()
 
+# FAISS scalar quantizer per index storage type (None: exact float32 vectors)
+_INDEX_QUANTIZERS = {
+    'fp32': None,
+    'fp16': faiss.ScalarQuantizer.QT_fp16,
+    'int8': faiss.ScalarQuantizer.QT_8bit,
+}
+
+# Minimum number of indexed vectors before searches run on a GPU copy of the index
+_GPU_MIN_VECTORS = 50000
+
 class DocumentStore:
     """
     Document storage and retrieval system using FAISS for efficient similarity search.
@@ -32,7 +41,8 @@ class DocumentStore:
     
     def __init__(self, store_path: str = "data/documents", 
                  embedding_dim: int = 384,
-                 embedding_generator: Optional[LocalEmbeddingGenerator] = None):
+                 embedding_generator: Optional[LocalEmbeddingGenerator] = None,
+                 quantization: Optional[str] = None):
         """
         Initialize the document store.
         
@@ -40,10 +50,15 @@ class DocumentStore:
             store_path: Path to store documents and indexes
             embedding_dim: Dimension of embeddings
             embedding_generator: Embedding generator instance
+            quantization: Index vector storage, 'fp32' (default), 'fp16' or 'int8'
         """
+        if quantization is not None and quantization not in _INDEX_QUANTIZERS:
+            raise ValueError(f"Unknown embedding quantization: {quantization}")
+        
         self.store_path = store_path
         self.embedding_dim = embedding_dim
         self.embedding_generator = embedding_generator
+        self.quantization = quantization or 'fp32'
         
         # Create directories
         os.makedirs(store_path, exist_ok=True)
@@ -53,6 +68,11 @@ class DocumentStore:
         self.index = None
         self.documents = {}
         self.doc_id_to_index = {}
+        # Reverse of doc_id_to_index, rebuilt lazily after the mapping changes
+        self._index_to_doc_id: Optional[Dict[int, str]] = None
+        # GPU copy of the index for large corpora, rebuilt lazily after the index changes
+        self._use_gpu = hasattr(faiss, 'index_cpu_to_all_gpus') and faiss.get_num_gpus() > 0
+        self._gpu_index = None
         
         # Load existing data if available
         self._load_data()
@@ -66,11 +86,20 @@ class DocumentStore:
                 with open(docs_file, 'r', encoding='utf-8') as f:
                     docs_data = json.load(f)
                     
-                for doc_data in docs_data:
+                # Embeddings live in one matrix, row i belonging to document i
+                embeddings_file = os.path.join(self.store_path, "embeddings.npy")
+                embeddings = np.load(embeddings_file) if os.path.exists(embeddings_file) else None
+                if embeddings is not None and len(embeddings) != len(docs_data):
+                    logging.warning("Ignoring embeddings.npy: row count does not match documents.json")
+                    embeddings = None
+                
+                for i, doc_data in enumerate(docs_data):
                     doc = Document(**doc_data)
-                    # Convert string embedding back to numpy array
                     if doc.embedding and isinstance(doc.embedding, list):
+                        # Stores written before embeddings.npy keep them inline
                         doc.embedding = np.array(doc.embedding)
+                    elif embeddings is not None and not np.isnan(embeddings[i, 0]):
+                        doc.embedding = embeddings[i]
                     self.documents[doc.id] = doc
                 
                 logging.info(f"Loaded {len(self.documents)} documents")
@@ -83,35 +112,120 @@ class DocumentStore:
                 # Rebuild doc_id_to_index mapping
                 for i, doc_id in enumerate(self.documents.keys()):
                     self.doc_id_to_index[doc_id] = i
+                self._index_to_doc_id = None
+                self._gpu_index = None
                 
                 logging.info(f"Loaded FAISS index with {self.index.ntotal} vectors")
+                
+                if not self._index_matches_quantization():
+                    self._reindex_documents()
             else:
                 # Initialize new index
-                self.index = faiss.IndexFlatIP(self.embedding_dim)  # Inner product for cosine similarity
+                self.index = self._create_index()
                 
         except Exception as e:
             logging.error(f"Error loading data: {e}")
             # Initialize empty structures
             self.documents = {}
             self.doc_id_to_index = {}
-            self.index = faiss.IndexFlatIP(self.embedding_dim)
+            self._index_to_doc_id = None
+            self._gpu_index = None
+            self.index = self._create_index()
+    
+    def _create_index(self):
+        """
+        Create an empty inner-product index (cosine similarity on normalized vectors).
+        
+        Vectors are stored exactly for 'fp32'; 'fp16' and 'int8' use a scalar
+        quantizer, cutting index memory and scan bandwidth to 1/2 or 1/4.
+        """
+        qtype = _INDEX_QUANTIZERS[self.quantization]
+        if qtype is None:
+            return faiss.IndexFlatIP(self.embedding_dim)
+        index = faiss.IndexScalarQuantizer(self.embedding_dim, qtype, faiss.METRIC_INNER_PRODUCT)
+        # Normalized components lie in [-1, 1], so train the quantizer on that range
+        index.train(np.vstack([np.full(self.embedding_dim, -1.0),
+                               np.full(self.embedding_dim, 1.0)]).astype(np.float32))
+        return index
+    
+    def _index_matches_quantization(self) -> bool:
+        """Check whether the loaded index stores vectors as configured."""
+        qtype = _INDEX_QUANTIZERS[self.quantization]
+        if qtype is None:
+            return isinstance(self.index, faiss.IndexFlat)
+        return isinstance(self.index, faiss.IndexScalarQuantizer) and self.index.sq.qtype == qtype
+    
+    def _reindex_documents(self):
+        """Rebuild the index from stored document embeddings with the configured quantization."""
+        embeddings = [doc.embedding for doc in self.documents.values()]
+        if len(embeddings) != self.index.ntotal or any(e is None for e in embeddings):
+            logging.warning(f"Cannot convert FAISS index to {self.quantization}: "
+                            f"document embeddings are incomplete, keeping the stored index")
+            return
+        
+        index = self._create_index()
+        if embeddings:
+            matrix = np.asarray(embeddings, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            index.add(matrix / norms)
+        self.index = index
+        logging.info(f"Rebuilt FAISS index with {self.quantization} vectors")
+    
+    def _search_index(self):
+        """
+        Get the index to search, cloning it to the GPU for large corpora.
+        
+        The GPU copy stores vectors as fp16 to halve scan bandwidth; searches
+        stay on the CPU index when no GPU is available or cloning fails.
+        """
+        if not self._use_gpu or self.index.ntotal < _GPU_MIN_VECTORS:
+            return self.index
+        
+        if self._gpu_index is None:
+            try:
+                options = faiss.GpuMultipleClonerOptions()
+                options.useFloat16 = True
+                self._gpu_index = faiss.index_cpu_to_all_gpus(self.index, co=options)
+                logging.info(f"Moved FAISS index with {self.index.ntotal} vectors to GPU")
+            except Exception as e:
+                logging.warning(f"Searching on CPU, could not move FAISS index to GPU: {e}")
+                self._use_gpu = False
+                return self.index
+        return self._gpu_index
     
     def _save_data(self):
         """Save documents and index to disk."""
         try:
             # Save documents
             docs_file = os.path.join(self.store_path, "documents.json")
-            docs_data = []
-            for doc in self.documents.values():
-                doc_dict = asdict(doc)
-                # Convert numpy array to list for JSON serialization
-                if doc_dict['embedding'] is not None:
-                    doc_dict['embedding'] = doc_dict['embedding'].tolist()
-                docs_data.append(doc_dict)
+            docs = list(self.documents.values())
+            docs_data = [
+                {
+                    'id': doc.id,
+                    'content': doc.content,
+                    'metadata': doc.metadata,
+                    'created_at': doc.created_at,
+                    'updated_at': doc.updated_at
+                }
+                for doc in docs
+            ]
             
             with open(docs_file, 'w', encoding='utf-8') as f:
                 json.dump(docs_data, f, indent=2, default=str)
             
+            # Save embeddings as one contiguous float32 matrix in document order
+            # (NaN rows for documents without an embedding)
+            embeddings = np.full((len(docs), self.embedding_dim), np.nan, dtype=np.float32)
+            for i, doc in enumerate(docs):
+                if doc.embedding is not None:
+                    embeddings[i] = doc.embedding
+            embeddings_file = os.path.join(self.store_path, "embeddings.npy")
+            tmp_file = f"{embeddings_file}.{os.getpid()}.tmp"
+            with open(tmp_file, 'wb') as f:
+                np.save(f, embeddings)
+            os.replace(tmp_file, embeddings_file)
+            
             # Save FAISS index
             index_file = os.path.join(self.store_path, "indexes", "faiss.index")
             faiss.write_index(self.index, index_file)
@@ -155,6 +269,8 @@ class DocumentStore:
             normalized_embedding = doc.embedding / np.linalg.norm(doc.embedding)
             self.index.add(normalized_embedding.reshape(1, -1))
             self.doc_id_to_index[doc_id] = self.index.ntotal - 1
+            self._index_to_doc_id = None
+            self._gpu_index = None
         
         # Save data
         self._save_data()
@@ -162,27 +278,126 @@ class DocumentStore:
         logging.info(f"Added document {doc_id}")
         return doc_id
     
-    def add_documents_batch(self, documents: List[Dict[str, Any]]) -> List[str]:
+    def add_documents_batch(self, documents: List[Dict[str, Any]],
+                            embeddings: Optional[np.ndarray] = None,
+                            batch_size: int = 32) -> List[str]:
         """
         Add multiple documents to the store.
         
+        Embeddings are generated in a single batch (unless precomputed ones
+        are passed in) and the store is written to disk once, after all
+        documents have been added.
+        
         Args:
-            documents: List of document dictionaries with 'content' and optional 'metadata'
+            documents: List of document dictionaries with 'content' and optional 'metadata'/'id'
+            embeddings: Precomputed (n_documents, embedding_dim) matrix (optional)
+            batch_size: Encoder batch size when generating embeddings
             
         Returns:
             List of document IDs
         """
-        doc_ids = []
+        if not documents:
+            return []
+        
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        base_count = len(self.documents)
         
+        new_docs = []
         for i, doc_data in enumerate(documents):
             content = doc_data.get('content', '')
             metadata = doc_data.get('metadata', {})
-            doc_id = doc_data.get('id', f"doc_{len(self.documents)}_{i}_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+            doc_id = doc_data.get('id', f"doc_{base_count}_{i}_{timestamp}")
+            new_docs.append(Document(id=doc_id, content=content, metadata=metadata))
+        
+        # Generate all embeddings in one pass unless they were precomputed
+        if embeddings is None and self.embedding_generator:
+            embeddings = self.embedding_generator.generate_embeddings_batch(
+                [doc.content for doc in new_docs], batch_size=batch_size
+            )
+        
+        if embeddings is not None:
+            for doc, embedding in zip(new_docs, embeddings):
+                doc.embedding = embedding
             
-            doc_ids.append(self.add_document(content, metadata, doc_id))
+            # Normalize embeddings for cosine similarity and add them to FAISS together
+            matrix = np.asarray(embeddings, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            start = self.index.ntotal
+            self.index.add(matrix / norms)
+            for offset, doc in enumerate(new_docs):
+                self.doc_id_to_index[doc.id] = start + offset
+            self._index_to_doc_id = None
+            self._gpu_index = None
+        
+        for doc in new_docs:
+            self.documents[doc.id] = doc
+        
+        # Save data once for the whole batch
+        self._save_data()
         
+        doc_ids = [doc.id for doc in new_docs]
+        logging.info(f"Added {len(doc_ids)} documents in batch")
         return doc_ids
     
+    def save_snapshot(self, snapshot_path: str, doc_ids: Optional[List[str]] = None) -> bool:
+        """
+        Save documents and their embeddings to a single .npz snapshot file.
+        
+        Embeddings are stored as one contiguous float32 matrix; document
+        text and metadata are stored alongside as JSON.
+        
+        Args:
+            snapshot_path: Path of the snapshot file
+            doc_ids: Documents to include (all documents if None)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if doc_ids is None:
+                doc_ids = list(self.documents.keys())
+            docs = [self.documents[doc_id] for doc_id in doc_ids]
+            
+            entries = [{'id': doc.id, 'content': doc.content, 'metadata': doc.metadata} for doc in docs]
+            if docs and all(doc.embedding is not None for doc in docs):
+                embeddings = np.stack([np.asarray(doc.embedding, dtype=np.float32) for doc in docs])
+            else:
+                embeddings = np.empty((0, self.embedding_dim), dtype=np.float32)
+            
+            with open(snapshot_path, 'wb') as f:
+                np.savez(
+                    f,
+                    documents=np.frombuffer(json.dumps(entries, default=str).encode('utf-8'), dtype=np.uint8),
+                    embeddings=embeddings
+                )
+            
+            logging.info(f"Saved snapshot of {len(entries)} documents to {snapshot_path}")
+            return True
+        except Exception as e:
+            logging.error(f"Error saving snapshot: {e}")
+            return False
+    
+    def load_snapshot(self, snapshot_path: str) -> List[str]:
+        """
+        Add the documents from a snapshot file without recomputing embeddings.
+        
+        Args:
+            snapshot_path: Path of the snapshot file
+            
+        Returns:
+            List of document IDs
+        """
+        with np.load(snapshot_path, allow_pickle=False) as snapshot:
+            entries = json.loads(snapshot['documents'].tobytes().decode('utf-8'))
+            embeddings = snapshot['embeddings']
+        
+        # Snapshots without embeddings fall back to generating them
+        if len(embeddings) != len(entries):
+            embeddings = None
+        
+        return self.add_documents_batch(entries, embeddings)
+    
     def get_document(self, doc_id: str) -> Optional[Document]:
         """
         Get a document by ID.
@@ -232,6 +447,8 @@ class DocumentStore:
             self.index.remove_ids(np.array([index_pos]))
             self.index.add(normalized_embedding.reshape(1, -1))
             self.doc_id_to_index[doc_id] = self.index.ntotal - 1
+            self._index_to_doc_id = None
+            self._gpu_index = None
         
         # Save data
         self._save_data()
@@ -257,6 +474,8 @@ class DocumentStore:
             index_pos = self.doc_id_to_index[doc_id]
             self.index.remove_ids(np.array([index_pos]))
             del self.doc_id_to_index[doc_id]
+            self._index_to_doc_id = None
+            self._gpu_index = None
         
         # Remove from documents
         del self.documents[doc_id]
@@ -286,31 +505,78 @@ class DocumentStore:
         try:
             # Generate query embedding
             query_embedding = self.embedding_generator.generate_embedding(query)
+            return self.search_by_embedding(query_embedding, top_k, similarity_threshold)
+        except Exception as e:
+            logging.error(f"Error searching similar documents: {e}")
+            return []
+    
+    def search_by_embedding(self, query_embedding: np.ndarray, top_k: int = 5,
+                            similarity_threshold: float = 0.0) -> List[Tuple[Document, float]]:
+        """
+        Search for documents similar to a precomputed query embedding.
+        
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            similarity_threshold: Minimum similarity score
             
-            # Normalize query embedding
-            query_embedding = query_embedding / np.linalg.norm(query_embedding)
+        Returns:
+            List of (Document, similarity_score) tuples
+        """
+        return self.search_by_embeddings([query_embedding], top_k, similarity_threshold)[0]
+    
+    def search_by_embeddings(self, query_embeddings: List[np.ndarray], top_k: int = 5,
+                             similarity_threshold: float = 0.0) -> List[List[Tuple[Document, float]]]:
+        """
+        Search for documents similar to several precomputed query embeddings.
+        
+        All queries are scored against the index in a single FAISS search call,
+        so the corpus is scanned once regardless of the number of queries.
+        
+        Args:
+            query_embeddings: Query embedding vectors
+            top_k: Number of results to return per query
+            similarity_threshold: Minimum similarity score
+            
+        Returns:
+            One list of (Document, similarity_score) tuples per query
+        """
+        results = [[] for _ in query_embeddings]
+        if not query_embeddings or self.index is None or self.index.ntotal == 0:
+            return results
+        
+        try:
+            # Normalize query embeddings, leaving zero vectors without results
+            queries = np.asarray(query_embeddings, dtype=np.float32).reshape(len(query_embeddings), -1)
+            norms = np.linalg.norm(queries, axis=1)
+            rows = np.flatnonzero(norms)
+            if len(rows) == 0:
+                return results
+            queries = queries[rows] / norms[rows, None]
             
             # Search in FAISS index
-            scores, indices = self.index.search(query_embedding.reshape(1, -1), min(top_k, self.index.ntotal))
+            scores, indices = self._search_index().search(queries, min(top_k, self.index.ntotal))
             
-            results = []
-            for score, idx in zip(scores[0], indices[0]):
-                if score >= similarity_threshold:
-                    # Find document by index
-                    doc_id = None
-                    for did, di in self.doc_id_to_index.items():
-                        if di == idx:
-                            doc_id = did
-                            break
-                    
-                    if doc_id and doc_id in self.documents:
-                        doc = self.documents[doc_id]
-                        results.append((doc, float(score)))
+            # Map index positions back to document IDs (first ID wins on a shared position)
+            index_to_doc_id = self._index_to_doc_id
+            if index_to_doc_id is None:
+                index_to_doc_id = self._index_to_doc_id = {
+                    di: did for did, di in reversed(self.doc_id_to_index.items())
+                }
+            
+            for row, row_scores, row_indices in zip(rows.tolist(), scores.tolist(), indices.tolist()):
+                row_results = results[row]
+                for score, idx in zip(row_scores, row_indices):
+                    if score >= similarity_threshold:
+                        # Find document by index
+                        doc_id = index_to_doc_id.get(idx)
+                        if doc_id and doc_id in self.documents:
+                            row_results.append((self.documents[doc_id], score))
             
             return results
         except Exception as e:
             logging.error(f"Error searching similar documents: {e}")
-            return []
+            return [[] for _ in query_embeddings]
     
     def search_by_metadata(self, metadata_filter: Dict[str, Any], 
                           top_k: Optional[int] = None) -> List[Document]:
@@ -356,7 +622,9 @@ class DocumentStore:
         """Clear all documents from the store."""
         self.documents.clear()
         self.doc_id_to_index.clear()
-        self.index = faiss.IndexFlatIP(self.embedding_dim)
+        self._index_to_doc_id = None
+        self._gpu_index = None
+        self.index = self._create_index()
         self._save_data()
         logging.info("Document store cleared")
     
@@ -366,6 +634,7 @@ class DocumentStore:
             'total_documents': len(self.documents),
             'indexed_documents': len(self.doc_id_to_index),
             'embedding_dimension': self.embedding_dim,
+            'quantization': self.quantization,
             'store_path': self.store_path,
             'has_embedding_generator': self.embedding_generator is not None
         }
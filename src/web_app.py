@@ -4,12 +4,10 @@ Deep Researcher Agent Web Interface
 Flask web application for the Deep Researcher Agent
 """
 import os
-import json
 import logging
 from pathlib import Path
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, render_template, request, jsonify
 from flask_cors import CORS
-from typing import Dict, Any, Optional
 
 # Add the src directory to the path so we can import our modules
 import sys
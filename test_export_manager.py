@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Tests for the export manager's PDF and JSON exports
+"""
+
+import os
+import sys
+import json
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.exporting.export_manager import ExportManager
+
+def make_query_result(answer):
+    return SimpleNamespace(
+        query="What is machine learning?",
+        timestamp=datetime(2026, 1, 1, 12, 0, 0),
+        confidence=0.8,
+        processing_time=0.5,
+        answer=answer,
+        sources=[{'document_id': 'doc-1', 'score': 0.9, 'content': 'Machine learning learns from data.'}],
+        reasoning_steps=[{'step_type': 'analysis', 'description': 'Analyzed sources', 'confidence': 0.7}],
+        metadata={}
+    )
+
+def test_pdf_exports_with_spacers_at_page_breaks():
+    """Growing answers push spacers across page boundaries in many consecutive builds."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = ExportManager(output_dir=tmp_dir)
+        for words in range(0, 1600, 8):
+            answer = " ".join(["learning"] * words)
+            filepath = manager.export_query_result(make_query_result(answer), 'pdf', f"result_{words}")
+            assert os.path.getsize(filepath) > 0
+
+@dataclass
+class DataclassQueryResult:
+    query: str
+    timestamp: datetime
+    confidence: float
+    processing_time: float
+    answer: str
+    sources: list
+    reasoning_steps: list
+    metadata: dict
+    internal_state: dict = field(default_factory=dict)
+
+def test_json_export_schema_matches_for_dataclass_and_duck_typed_results():
+    """A dataclass result exports exactly the keys of an equivalent duck-typed one."""
+    duck_typed = make_query_result("Machine learning learns from data.")
+    as_dataclass = DataclassQueryResult(**vars(duck_typed), internal_state={'cache': 'hit'})
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = ExportManager(output_dir=tmp_dir)
+        exported = []
+        for name, result in (("duck_typed", duck_typed), ("dataclass", as_dataclass)):
+            filepath = manager.export_query_result(result, 'json', name)
+            with open(filepath, encoding='utf-8') as f:
+                exported.append(json.load(f))
+    assert list(exported[0]) == list(exported[1])
+    assert exported[0] == exported[1]
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")
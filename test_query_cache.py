@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent semantic query result cache
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.querying.query_cache import SemanticQueryCache
+
+# Fixed embeddings standing in for the model: the two AI wordings are near-duplicates
+EMBEDDINGS = {
+    'what is ai': np.array([1.0, 0.0, 0.0], dtype=np.float32),
+    'explain ai': np.array([0.99, 0.01, 0.0], dtype=np.float32),
+    'how do i cook pasta': np.array([0.0, 1.0, 0.0], dtype=np.float32),
+}
+
+def embed(text):
+    return EMBEDDINGS[' '.join(text.lower().split())]
+
+def make_result(query):
+    return {'query': query, 'answer': f"Answer to {query}", 'confidence_score': 0.8}
+
+def test_exact_hit():
+    """Lookups ignoring case and whitespace hit, and return a copy of the stored result."""
+    cache = SemanticQueryCache()
+    cache.put('What is AI', make_result('What is AI'), scope='s')
+    
+    result, embedding = cache.lookup('  what   is ai ', scope='s', embed=embed)
+    assert result == make_result('What is AI')
+    assert embedding is None
+    
+    result['answer'] = 'edited by caller'
+    assert cache.lookup('What is AI', scope='s')[0]['answer'] == 'Answer to What is AI'
+    assert cache.get_statistics()['exact_hits'] == 2
+
+def test_stored_result_is_copied():
+    """Editing a result after storing it leaves the cached entry intact."""
+    cache = SemanticQueryCache()
+    result = make_result('What is AI')
+    cache.put('What is AI', result, scope='s')
+    result['answer'] = 'edited by caller'
+    assert cache.lookup('What is AI', scope='s')[0]['answer'] == 'Answer to What is AI'
+
+def test_semantic_hit():
+    """A near-duplicate query hits with its own query text and the computed embedding."""
+    cache = SemanticQueryCache(similarity_threshold=0.97)
+    cache.put('What is AI', make_result('What is AI'), scope='s', embedding=embed('What is AI'))
+    
+    result, embedding = cache.lookup('Explain AI', scope='s', embed=embed)
+    assert result is not None
+    assert result['query'] == 'Explain AI'
+    assert embedding is not None
+    assert cache.lookup('What is AI', scope='s')[0]['query'] == 'What is AI'
+    
+    result, embedding = cache.lookup('How do I cook pasta', scope='s', embed=embed)
+    assert result is None
+    assert embedding is not None
+    
+    stats = cache.get_statistics()
+    assert stats['semantic_hits'] == 1
+    assert stats['misses'] == 1
+
+def test_scope_miss():
+    """Results produced with other processing options match neither tier."""
+    cache = SemanticQueryCache()
+    cache.put('What is AI', make_result('What is AI'), scope='refine=True', embedding=embed('What is AI'))
+    
+    assert cache.lookup('What is AI', scope='refine=False', embed=embed)[0] is None
+    assert cache.lookup('Explain AI', scope='refine=False', embed=embed)[0] is None
+
+def test_corpus_version_invalidation():
+    """Changing the corpus version drops every cached result."""
+    cache = SemanticQueryCache()
+    cache.set_corpus_version('model:1')
+    cache.put('What is AI', make_result('What is AI'), embedding=embed('What is AI'))
+    
+    cache.set_corpus_version('model:1')
+    assert cache.lookup('What is AI')[0] is not None
+    
+    cache.set_corpus_version('model:2')
+    assert cache.lookup('What is AI')[0] is None
+    assert cache.lookup('Explain AI', embed=embed)[0] is None
+    assert cache.get_statistics()['entries'] == 0
+
+def test_save_load_round_trip():
+    """Saved results, scopes, embeddings and corpus version survive a reload."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, 'query_cache.json')
+        cache = SemanticQueryCache(cache_path=cache_path)
+        cache.set_corpus_version('model:1')
+        cache.put('What is AI', make_result('What is AI'), scope='s', embedding=embed('What is AI'))
+        cache.put('How do I cook pasta', make_result('How do I cook pasta'), scope='t')
+        assert cache.save()
+        
+        loaded = SemanticQueryCache(cache_path=cache_path)
+        assert loaded.corpus_version == 'model:1'
+        assert loaded.get_statistics()['entries'] == 2
+        assert loaded.get_statistics()['semantic_entries'] == 1
+        assert loaded.lookup('what is ai', scope='s')[0] == make_result('What is AI')
+        assert loaded.lookup('Explain AI', scope='s', embed=embed)[0]['answer'] == 'Answer to What is AI'
+        assert loaded.lookup('How do I cook pasta', scope='s')[0] is None
+        assert loaded.lookup('How do I cook pasta', scope='t')[0] is not None
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith('test_') and callable(test):
+            test()
+            print(f"✅ {name}")